@@ -0,0 +1,68 @@
+"""
+Benchmark: plain BFS vs bidirectional BFS
+Compares how many nodes each strategy explores on the Figure 1 graph and
+on larger synthetic road networks
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.graph_converter import GraphConverter, create_figure1_graph
+from question1.search_algorithm import SearchAlgorithm
+from question2.graph_with_costs import create_synthetic_graph
+
+
+def compare(graph, queries):
+    """Total explored nodes and seconds for BFS and bidirectional BFS"""
+    search_alg = SearchAlgorithm(graph)
+    totals = {}
+    for strategy in ('bfs', 'bidirectional'):
+        explored_total = 0
+        start = time.perf_counter()
+        for initial, goal in queries:
+            _, explored = search_alg.search(initial, goal, strategy=strategy)
+            explored_total += explored
+        totals[strategy] = (explored_total, time.perf_counter() - start)
+    return totals
+
+
+def report(title, totals, num_queries):
+    bfs_explored, bfs_time = totals['bfs']
+    bi_explored, bi_time = totals['bidirectional']
+    print(f"\n{title} ({num_queries} queries)")
+    print(f"  BFS:           {bfs_explored / num_queries:10.1f} nodes/query  {bfs_time / num_queries * 1e3:8.3f} ms/query")
+    print(f"  Bidirectional: {bi_explored / num_queries:10.1f} nodes/query  {bi_time / num_queries * 1e3:8.3f} ms/query")
+    print(f"  Bidirectional explores {bi_explored / bfs_explored:.1%} of the BFS nodes")
+
+
+def run_benchmark(sizes=(50, 100, 200), num_queries=50, seed=0):
+    print("=" * 60)
+    print("Bidirectional BFS benchmark")
+    print("=" * 60)
+
+    graph = create_figure1_graph().get_graph()
+    for goal in ("Moyale", "Juba"):
+        totals = compare(graph, [("Addis Ababa", goal)])
+        print(f"\nAddis Ababa -> {goal}: BFS explored {totals['bfs'][0]}, "
+              f"bidirectional explored {totals['bidirectional'][0]}")
+
+    cities = sorted(graph)
+    all_pairs = [(a, b) for a in cities for b in cities if a != b]
+    report("Figure 1 graph, all city pairs", compare(graph, all_pairs), len(all_pairs))
+
+    rng = random.Random(seed)
+    for size in sizes:
+        weighted = create_synthetic_graph(size, size, seed=seed).get_graph()
+        converter = GraphConverter()
+        converter.build_from_adjacency_list(
+            (node, [neighbor for neighbor, _ in neighbors]) for node, neighbors in weighted.items()
+        )
+        csr = converter.to_csr()
+        queries = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(num_queries)]
+        report(f"Synthetic {size}x{size} grid (CSR)", compare(csr, queries), num_queries)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,512 @@
+"""
+Compact, integer-indexed CSR (compressed sparse row) graph representation.
+
+The dictionary adjacency lists used by GraphConverter and GraphWithCosts are
+convenient for the ~80-city figure graphs, but every node name and every
+(neighbor, cost) tuple is a separate Python object. CSRGraph freezes a graph
+into three flat arrays plus a name <-> id symbol table:
+
+    offsets[i] .. offsets[i + 1]   slice of `targets`/`costs` owned by node i
+    targets[e]                     node id at the end of edge e
+    costs[e]                       cost of edge e (None for unweighted graphs)
+
+save()/load() write and map a binary snapshot of those arrays. Loading only
+mmaps the file and casts memoryviews over it: nothing is parsed, so cold
+start is O(1) and every process that loads the same snapshot shares the same
+page-cache pages. save() writes to a temporary file and renames it into
+place, so a reader never maps a half-written snapshot.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from itertools import repeat
+
+# Snapshot layout (native byte order, every section 8-byte aligned):
+#   header        magic, version, flags, num_nodes, num_edges, name_bytes
+#   offsets       int64  x (num_nodes + 1)
+#   targets       int32  x num_edges
+#   costs         int64 or float64 x num_edges   (weighted graphs only)
+#   name_offsets  int64  x (num_nodes + 1)       (byte offsets into names)
+#   sorted_ids    int32  x num_nodes             (ids ordered by name bytes)
+#   names         UTF-8 bytes of all node names, concatenated
+SNAPSHOT_MAGIC = b'CSRGRAPH'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('=8sIIQQQ')
+_HEADER_SIZE = 64
+_FLAG_WEIGHTED = 1
+_FLAG_FLOAT_COSTS = 2
+_FLAG_BIG_ENDIAN = 4
+
+
+class _UnitCosts:
+    """Cost array stand-in for unweighted graphs (every edge costs 1)"""
+
+    def __getitem__(self, edge):
+        return 1
+
+
+class _NameTable:
+    """Read-only sequence of node names decoded lazily from a snapshot"""
+
+    def __init__(self, blob, name_offsets):
+        self._blob = blob
+        self._name_offsets = name_offsets
+
+    def encoded(self, node_id):
+        return bytes(self._blob[self._name_offsets[node_id]:self._name_offsets[node_id + 1]])
+
+    def __getitem__(self, node_id):
+        if node_id < 0:
+            node_id += len(self)
+        return self.encoded(node_id).decode('utf-8')
+
+    def __len__(self):
+        return len(self._name_offsets) - 1
+
+    def __iter__(self):
+        for node_id in range(len(self)):
+            yield self[node_id]
+
+
+class _NameIndex:
+    """Name -> id lookup by binary search over a snapshot's sorted ids"""
+
+    def __init__(self, names, sorted_ids):
+        self._names = names
+        self._sorted_ids = sorted_ids
+
+    def get(self, name, default=None):
+        if not isinstance(name, str):
+            return default
+        key = name.encode('utf-8')
+        low, high = 0, len(self._sorted_ids)
+        while low < high:
+            middle = (low + high) // 2
+            node_id = self._sorted_ids[middle]
+            candidate = self._names.encoded(node_id)
+            if candidate == key:
+                return node_id
+            if candidate < key:
+                low = middle + 1
+            else:
+                high = middle
+        return default
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __getitem__(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+    def __len__(self):
+        return len(self._sorted_ids)
+
+
+def _typecode(values):
+    """Array typecode of an array.array or a cast memoryview"""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def _pad(size):
+    """Bytes needed to round size up to a multiple of 8"""
+    return -size % 8
+
+
+class CSRGraph:
+    """Frozen, array-backed graph with a name <-> id symbol table"""
+
+    def __init__(self, names, offsets, targets, costs=None, index=None):
+        """
+        Initialize from already-built CSR arrays
+
+        Args:
+            names: Sequence of node names; position is the node id
+            offsets: Integer array of length len(names) + 1
+            targets: Integer array of edge destination ids
+            costs: Optional array of edge costs aligned with targets
+            index: Optional name -> id mapping (built from names if omitted)
+        """
+        self.names = names
+        if index is None:
+            index = {name: node_id for node_id, name in enumerate(names)}
+        self.index = index
+        self.offsets = offsets
+        self.targets = targets
+        self.costs = costs
+        self._reverse = None
+        self._mmap = None
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """
+        Build a CSR graph from a dictionary adjacency list
+
+        Args:
+            adjacency: {node: [neighbor, ...]} for unweighted graphs or
+                       {node: [(neighbor, cost), ...]} for weighted graphs
+
+        Returns:
+            CSRGraph: Node ids follow dictionary order, then any node that
+                      only appears as a destination
+        """
+        names = list(adjacency)
+        index = {name: node_id for node_id, name in enumerate(names)}
+        weighted = any(
+            isinstance(entry, tuple)
+            for neighbors in adjacency.values()
+            for entry in neighbors[:1]
+        )
+
+        offsets = array('q', [0])
+        targets = array('i')
+        cost_values = []
+        for node in list(names):
+            for entry in adjacency[node]:
+                if weighted:
+                    neighbor, cost = entry
+                    cost_values.append(cost)
+                else:
+                    neighbor = entry
+                if neighbor not in index:
+                    index[neighbor] = len(names)
+                    names.append(neighbor)
+                targets.append(index[neighbor])
+            offsets.append(len(targets))
+
+        # Nodes that only appear as destinations have no outgoing edges
+        while len(offsets) < len(names) + 1:
+            offsets.append(len(targets))
+
+        costs = None
+        if weighted:
+            typecode = 'q' if all(isinstance(c, int) for c in cost_values) else 'd'
+            costs = array(typecode, cost_values)
+
+        return cls(names, offsets, targets, costs)
+
+    @property
+    def num_nodes(self):
+        """Number of nodes in the graph"""
+        return len(self.names)
+
+    @property
+    def num_edges(self):
+        """Number of directed edges stored in the graph"""
+        return len(self.targets)
+
+    @property
+    def is_weighted(self):
+        """True if the graph carries edge costs"""
+        return self.costs is not None
+
+    def node_id(self, name):
+        """Return the integer id of a node name (None if unknown)"""
+        return self.index.get(name)
+
+    def node_name(self, node_id):
+        """Return the name of an integer node id"""
+        return self.names[node_id]
+
+    def neighbor_ids(self, node_id):
+        """Return the neighbor ids of a node as an array slice"""
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def neighbor_items(self, node_id):
+        """Iterate (neighbor_id, cost) pairs of a node (cost 1 if unweighted)"""
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        if self.costs is None:
+            return zip(self.targets[start:end], repeat(1))
+        return zip(self.targets[start:end], self.costs[start:end])
+
+    def edge_cost(self, edge):
+        """Cost of edge position `edge` (1 for unweighted graphs)"""
+        return self.costs[edge] if self.costs is not None else 1
+
+    def cost_array(self):
+        """Return the edge costs, or unit costs for unweighted graphs"""
+        return self.costs if self.costs is not None else _UnitCosts()
+
+    def path_from_parents(self, parents, node_id):
+        """
+        Rebuild a path of node names by following parent pointers
+
+        Args:
+            parents: Mapping/array from node id to parent id (-1 at the root)
+            node_id: Last node of the path
+
+        Returns:
+            list: Node names from the root to node_id
+        """
+        path = []
+        while node_id != -1:
+            path.append(self.names[node_id])
+            node_id = parents[node_id]
+        path.reverse()
+        return path
+
+    def shortest_path_tree(self, source_id, targets=None, first_only=False):
+        """
+        Dijkstra from one node over the whole graph (or until targets settle)
+
+        Args:
+            source_id: Id of the root node
+            targets: Optional iterable of node ids; the search stops once all
+                     of them are settled
+            first_only: With targets, stop as soon as the first one settles
+
+        Returns:
+            tuple: (distances, parents, reached)
+                   distances - array keyed by node id (-1 = not settled)
+                   parents   - array keyed by node id (-1 = root/not reached)
+                   reached   - targets in the order they were settled
+        """
+        num_nodes = self.num_nodes
+        integral = self.costs is None or _typecode(self.costs) != 'd'
+        distances = array('q' if integral else 'd', [-1]) * num_nodes
+        parents = array('i', [-1]) * num_nodes
+        remaining = set(targets) if targets is not None else None
+        reached = []
+        if remaining is not None and not remaining:
+            return distances, parents, reached
+
+        offsets, node_targets, costs = self.offsets, self.targets, self.cost_array()
+        settled = bytearray(num_nodes)
+        tentative = {source_id: 0}
+        queue = [(0, source_id)]
+
+        while queue:
+            distance, node = heapq.heappop(queue)
+            if settled[node]:
+                continue
+            settled[node] = 1
+            distances[node] = distance
+
+            if remaining is not None and node in remaining:
+                reached.append(node)
+                remaining.discard(node)
+                if first_only or not remaining:
+                    break
+
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = node_targets[edge]
+                if settled[neighbor]:
+                    continue
+                new_distance = distance + costs[edge]
+                old_distance = tentative.get(neighbor)
+                if old_distance is None or new_distance < old_distance:
+                    tentative[neighbor] = new_distance
+                    parents[neighbor] = node
+                    heapq.heappush(queue, (new_distance, neighbor))
+
+        return distances, parents, reached
+
+    def reverse(self):
+        """
+        Return the graph with every edge reversed (built once and cached)
+
+        Returns:
+            CSRGraph: Shares the symbol table with this graph
+        """
+        if self._reverse is not None:
+            return self._reverse
+
+        num_nodes = self.num_nodes
+        offsets, targets, costs = self.offsets, self.targets, self.costs
+
+        # Counting sort of the edges by destination
+        counts = [0] * (num_nodes + 1)
+        for target in targets:
+            counts[target + 1] += 1
+        for node_id in range(num_nodes):
+            counts[node_id + 1] += counts[node_id]
+
+        reverse_offsets = array('q', counts)
+        reverse_targets = array('i', bytes(4 * len(targets)))
+        reverse_costs = None
+        if costs is not None:
+            reverse_costs = array(_typecode(costs), bytes(costs.itemsize * len(targets)))
+
+        position = counts[:-1]
+        for node_id in range(num_nodes):
+            for edge in range(offsets[node_id], offsets[node_id + 1]):
+                target = targets[edge]
+                slot = position[target]
+                position[target] += 1
+                reverse_targets[slot] = node_id
+                if costs is not None:
+                    reverse_costs[slot] = costs[edge]
+
+        reverse = CSRGraph(self.names, reverse_offsets, reverse_targets,
+                           reverse_costs, index=self.index)
+        reverse._reverse = self
+        self._reverse = reverse
+        return reverse
+
+    def save(self, path):
+        """
+        Write the graph to a binary snapshot file (see the layout above)
+
+        Args:
+            path: Destination file path
+        """
+        encoded = [name.encode('utf-8') for name in self.names]
+        name_offsets = array('q', [0])
+        for name_bytes in encoded:
+            name_offsets.append(name_offsets[-1] + len(name_bytes))
+        sorted_ids = array('i', sorted(range(len(encoded)), key=encoded.__getitem__))
+
+        flags = 0
+        costs = self.costs
+        if costs is not None:
+            flags |= _FLAG_WEIGHTED
+            if isinstance(costs[0] if len(costs) else 0, float):
+                flags |= _FLAG_FLOAT_COSTS
+                costs = array('d', costs)
+            else:
+                costs = array('q', costs)
+        if sys.byteorder == 'big':
+            flags |= _FLAG_BIG_ENDIAN
+
+        sections = [array('q', self.offsets), array('i', self.targets)]
+        if costs is not None:
+            sections.append(costs)
+        sections += [name_offsets, sorted_ids]
+
+        # Write next to the destination, then atomically rename into place
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as snapshot:
+                header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags,
+                                      self.num_nodes, self.num_edges, name_offsets[-1])
+                snapshot.write(header + bytes(_HEADER_SIZE - len(header)))
+                for section in sections:
+                    data = section.tobytes()
+                    snapshot.write(data + bytes(_pad(len(data))))
+                snapshot.write(b''.join(encoded))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a snapshot written by save() without parsing it
+
+        The arrays are memoryviews over a read-only mmap of the file, names
+        are decoded on demand and name lookups binary-search the sorted id
+        table, so loading costs O(1) regardless of the graph size.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            CSRGraph: Read-only graph backed by the mapped file
+        """
+        with open(path, 'rb') as snapshot:
+            if os.fstat(snapshot.fileno()).st_size < _HEADER_SIZE:
+                raise ValueError(f"{path} is truncated: shorter than a snapshot header")
+            mapped = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, num_nodes, num_edges, name_bytes = \
+            _HEADER.unpack_from(mapped, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} graph snapshot")
+        if bool(flags & _FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+        cost_size = 8 * num_edges if flags & _FLAG_WEIGHTED else 0
+        sections = [8 * (num_nodes + 1), 4 * num_edges, cost_size, 8 * (num_nodes + 1), 4 * num_nodes]
+        expected = _HEADER_SIZE + sum(size + _pad(size) for size in sections) + name_bytes
+        if len(mapped) != expected:
+            mapped.close()
+            raise ValueError(f"{path} is {len(mapped)} bytes but its header describes "
+                             f"{expected}; the snapshot is truncated or corrupt")
+
+        view = memoryview(mapped)
+        position = _HEADER_SIZE
+
+        def take(typecode, count):
+            nonlocal position
+            size = count * array(typecode).itemsize
+            section = view[position:position + size].cast(typecode)
+            position += size + _pad(size)
+            return section
+
+        offsets = take('q', num_nodes + 1)
+        targets = take('i', num_edges)
+        costs = None
+        if flags & _FLAG_WEIGHTED:
+            costs = take('d' if flags & _FLAG_FLOAT_COSTS else 'q', num_edges)
+        name_offsets = take('q', num_nodes + 1)
+        sorted_ids = take('i', num_nodes)
+        blob = view[position:position + name_bytes]
+
+        names = _NameTable(blob, name_offsets)
+        graph = cls(names, offsets, targets, costs, index=_NameIndex(names, sorted_ids))
+        graph._mmap = mapped
+        return graph
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy views of the CSR arrays
+
+        Returns:
+            tuple: (offsets, targets, costs) as numpy arrays (costs may be None)
+        """
+        import numpy as np
+        costs = np.asarray(self.costs) if self.costs is not None else None
+        return np.asarray(self.offsets), np.asarray(self.targets), costs
+
+    # Read-only dictionary view, so code written against the adjacency
+    # dictionaries (graph.get(node, []), graph[node], node in graph) keeps
+    # working. Weighted graphs yield (neighbor, cost) pairs, unweighted
+    # graphs yield neighbor names.
+
+    def get_graph(self):
+        """Return the graph itself (mirrors GraphConverter/GraphWithCosts)"""
+        return self
+
+    def get_neighbors(self, node):
+        """Get all neighbors of a node in the adjacency-list format"""
+        node_id = self.index.get(node)
+        if node_id is None:
+            return []
+        names = self.names
+        start, end = self.offsets[node_id], self.offsets[node_id + 1]
+        if self.costs is None:
+            return [names[t] for t in self.targets[start:end]]
+        return [(names[self.targets[e]], self.costs[e]) for e in range(start, end)]
+
+    def get(self, node, default=None):
+        if node not in self.index:
+            return default
+        return self.get_neighbors(node)
+
+    def __getitem__(self, node):
+        if node not in self.index:
+            raise KeyError(node)
+        return self.get_neighbors(node)
+
+    def __contains__(self, node):
+        return node in self.index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def keys(self):
+        return list(self.names)
+
+    def items(self):
+        return [(name, self.get_neighbors(name)) for name in self.names]
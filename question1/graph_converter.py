@@ -3,6 +3,11 @@ Question 1.1: Convert Figure 1 (State space graph for traveling Ethiopia)
 into a manageable data structure (dictionary/adjacency list)
 """
 
+try:
+    from question1.csr_graph import CSRGraph
+except ImportError:
+    from csr_graph import CSRGraph
+
 class GraphConverter:
     """Converts a state space graph into a dictionary-based adjacency list"""
     
@@ -17,25 +22,50 @@ class GraphConverter:
             from_node: Starting node
             to_node: Destination node
         """
-        if from_node not in self.graph:
-            self.graph[from_node] = []
-        if to_node not in self.graph:
-            self.graph[to_node] = []
+        self._link(from_node, to_node, None)
+        self._link(to_node, from_node, None)
+    
+    def _link(self, from_node, to_node, index):
+        """
+        Append to_node to from_node's neighbors unless it is already there
         
-        if to_node not in self.graph[from_node]:
-            self.graph[from_node].append(to_node)
-        if from_node not in self.graph[to_node]:
-            self.graph[to_node].append(from_node)
+        Args:
+            index: None to check the neighbor list (single insertions), or a
+                   bulk build's {node: set of neighbors} for O(1) checks
+        """
+        graph = self.graph
+        neighbors = graph.get(from_node)
+        if neighbors is None:
+            neighbors = graph[from_node] = []
+        if index is None:
+            if to_node in neighbors:
+                return
+        else:
+            targets = index.get(from_node)
+            if targets is None:
+                targets = index[from_node] = set(neighbors)
+            if to_node in targets:
+                return
+            targets.add(to_node)
+        neighbors.append(to_node)
     
     def build_from_edges(self, edges):
         """
-        Build graph from a list of edges
+        Build graph from edges (bulk path)
+        
+        Edges are consumed one at a time, so any iterable or generator works.
+        Duplicates are dropped through a hashed index of every touched node's
+        neighbors that only lives for this build, so hubs stay O(1) per edge
+        and the graph remains the only lasting copy of its edges.
         
         Args:
-            edges: List of tuples (from_node, to_node)
+            edges: Iterable of tuples (from_node, to_node)
         """
+        index = {}
+        link = self._link
         for from_node, to_node in edges:
-            self.add_edge(from_node, to_node)
+            link(from_node, to_node, index)
+            link(to_node, from_node, index)
     
     def build_from_adjacency_list(self, adjacency_data):
         """
@@ -43,11 +73,13 @@ class GraphConverter:
         {node: [list of connected nodes]}
         
         Args:
-            adjacency_data: Dictionary with node as key and list of neighbors as value
+            adjacency_data: Dictionary with node as key and list of neighbors as value,
+                            or any iterable of (node, neighbors) pairs
         """
-        for node, neighbors in adjacency_data.items():
-            for neighbor in neighbors:
-                self.add_edge(node, neighbor)
+        items = adjacency_data.items() if hasattr(adjacency_data, 'items') else adjacency_data
+        self.build_from_edges(
+            (node, neighbor) for node, neighbors in items for neighbor in neighbors
+        )
     
     def get_graph(self):
         """Return the graph as a dictionary"""
@@ -56,6 +88,32 @@ class GraphConverter:
     def get_neighbors(self, node):
         """Get all neighbors of a node"""
         return self.graph.get(node, [])
+    
+    def to_csr(self):
+        """Freeze the graph into a compact, integer-indexed CSRGraph"""
+        return CSRGraph.from_adjacency(self.graph)
+    
+    def save_snapshot(self, path):
+        """
+        Write the graph to a binary, memory-mappable snapshot file
+        
+        Args:
+            path: Destination file path
+        """
+        self.to_csr().save(path)
+    
+    @staticmethod
+    def load_snapshot(path):
+        """
+        Load a snapshot written by save_snapshot() via mmap (no parsing)
+        
+        Args:
+            path: Snapshot file path
+            
+        Returns:
+            CSRGraph: Read-only unweighted graph accepted by all search classes
+        """
+        return CSRGraph.load(path)
 
 
 # Building the graph from Figure 1
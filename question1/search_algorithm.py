@@ -5,20 +5,32 @@ the corresponding solution/path.
 """
 
 from collections import deque
-from graph_converter import GraphConverter
+
+try:
+    from question1.graph_converter import GraphConverter
+    from question1.csr_graph import CSRGraph
+except ImportError:
+    from graph_converter import GraphConverter
+    from csr_graph import CSRGraph
 
 
 class SearchAlgorithm:
     """Implements BFS and DFS search strategies"""
     
-    def __init__(self, graph):
+    def __init__(self, graph, record_explored=False):
         """
-        Initialize with a graph (dictionary adjacency list)
+        Initialize with a graph (dictionary adjacency list or CSRGraph)
         
         Args:
-            graph: Dictionary where keys are nodes and values are lists of neighbors
+            graph: Dictionary where keys are nodes and values are lists of neighbors,
+                   or a CSRGraph (searched directly on integer node ids)
+            record_explored: If True, searches return the list of explored nodes;
+                             otherwise they only return how many were explored
         """
         self.graph = graph
+        self.is_csr = isinstance(graph, CSRGraph)
+        self.record_explored = record_explored
+        self._reverse_graph = None  # Built on first bidirectional search
     
     def breadth_first_search(self, initial_state, goal_state):
         """
@@ -29,58 +41,168 @@ class SearchAlgorithm:
             goal_state: Target node
             
         Returns:
-            tuple: (path, nodes_explored) or (None, nodes_explored) if no path found
+            tuple: (path, nodes_explored) or (None, nodes_explored) if no path found.
+                   nodes_explored is a list if record_explored is set, else a count
         """
         if initial_state == goal_state:
-            return [initial_state], [initial_state]
+            return [initial_state], self._explored_result([initial_state], 1)
         
-        # Queue for BFS: (current_node, path)
-        queue = deque([(initial_state, [initial_state])])
-        visited = set([initial_state])
-        nodes_explored = [initial_state]
+        if self.is_csr:
+            return self._csr_search(initial_state, goal_state, breadth_first=True)
+        return self._dict_search(initial_state, goal_state, breadth_first=True)
+    
+    def depth_first_search(self, initial_state, goal_state):
+        """
+        Depth-First Search algorithm (iterative version)
         
-        while queue:
-            current_node, path = queue.popleft()
-            
-            # Get neighbors
-            neighbors = self.graph.get(current_node, [])
+        Args:
+            initial_state: Starting node
+            goal_state: Target node
             
-            for neighbor in neighbors:
-                if neighbor == goal_state:
-                    # Goal found
-                    final_path = path + [neighbor]
-                    nodes_explored.append(neighbor)
-                    return final_path, nodes_explored
-                
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    nodes_explored.append(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+        Returns:
+            tuple: (path, nodes_explored) or (None, nodes_explored) if no path found.
+                   nodes_explored is a list if record_explored is set, else a count
+        """
+        if initial_state == goal_state:
+            return [initial_state], self._explored_result([initial_state], 1)
         
-        # No path found
-        return None, nodes_explored
+        if self.is_csr:
+            return self._csr_search(initial_state, goal_state, breadth_first=False)
+        return self._dict_search(initial_state, goal_state, breadth_first=False)
     
-    def depth_first_search(self, initial_state, goal_state):
+    def bidirectional_search(self, initial_state, goal_state):
         """
-        Depth-First Search algorithm (iterative version)
+        Bidirectional Breadth-First Search
+        
+        Grows one BFS frontier from the initial state and one (over reversed
+        edges) from the goal, always expanding a full level of the smaller
+        frontier, and stops as soon as the two searches meet. Returns a
+        shortest path like BFS while exploring far fewer nodes on long queries.
         
         Args:
             initial_state: Starting node
             goal_state: Target node
             
         Returns:
-            tuple: (path, nodes_explored) or (None, nodes_explored) if no path found
+            tuple: (path, nodes_explored) or (None, nodes_explored) if no path found.
+                   nodes_explored is a list if record_explored is set, else a count
         """
         if initial_state == goal_state:
-            return [initial_state], [initial_state]
+            return [initial_state], self._explored_result([initial_state], 1)
         
-        # Stack for DFS: (current_node, path)
-        stack = [(initial_state, [initial_state])]
-        visited = set([initial_state])
-        nodes_explored = [initial_state]
+        if self.is_csr:
+            csr = self.graph
+            start, goal = csr.node_id(initial_state), csr.node_id(goal_state)
+            if start is None or goal is None:
+                return None, self._explored_result([initial_state], 1)
+            path, nodes_explored = self._meet_in_the_middle(
+                start, goal, csr.neighbor_ids, csr.reverse().neighbor_ids
+            )
+            if path is not None:
+                path = [csr.names[node] for node in path]
+            if self.record_explored:
+                nodes_explored = [csr.names[node] for node in nodes_explored]
+            return path, nodes_explored
         
-        while stack:
-            current_node, path = stack.pop()
+        empty = []
+        forward = lambda node: self.graph.get(node, empty)
+        reverse_graph = self._backward_graph()
+        backward = lambda node: reverse_graph.get(node, empty)
+        return self._meet_in_the_middle(initial_state, goal_state, forward, backward)
+    
+    def _backward_graph(self):
+        """
+        Adjacency list with every edge reversed (built once and cached)
+        
+        Undirected graphs, like the ones GraphConverter builds, are their own
+        reverse, so the dictionary itself is reused in that case.
+        """
+        if self._reverse_graph is None:
+            reverse = {}
+            for node, neighbors in self.graph.items():
+                for neighbor in neighbors:
+                    reverse.setdefault(neighbor, []).append(node)
+            symmetric = all(
+                set(reverse.get(node, ())) == set(neighbors)
+                for node, neighbors in self.graph.items()
+            ) and all(node in self.graph for node in reverse)
+            self._reverse_graph = self.graph if symmetric else reverse
+        return self._reverse_graph
+    
+    def _meet_in_the_middle(self, start, goal, forward, backward):
+        """
+        Level-synchronous bidirectional BFS over neighbor functions
+        
+        Every node reached by the current level is at distance level + 1 and
+        the two searches had not met before, so the first meeting node found
+        already lies on a shortest path.
+        """
+        parents = {start: None}
+        children = {goal: None}  # Parent pointers of the backward search
+        forward_frontier = [start]
+        backward_frontier = [goal]
+        nodes_explored = [start, goal] if self.record_explored else None
+        explored_count = 2
+        
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, neighbors, own, other = forward_frontier, forward, parents, children
+            else:
+                frontier, neighbors, own, other = backward_frontier, backward, children, parents
+            
+            next_frontier = []
+            meeting_node = None
+            for node in frontier:
+                for neighbor in neighbors(node):
+                    if neighbor in own:
+                        continue
+                    own[neighbor] = node
+                    explored_count += 1
+                    if nodes_explored is not None:
+                        nodes_explored.append(neighbor)
+                    if neighbor in other:
+                        meeting_node = neighbor
+                        break
+                    next_frontier.append(neighbor)
+                if meeting_node is not None:
+                    break
+            
+            if meeting_node is not None:
+                path = self._path_from_parents(parents, meeting_node)
+                node = children[meeting_node]
+                while node is not None:
+                    path.append(node)
+                    node = children[node]
+                return path, self._explored_result(nodes_explored, explored_count)
+            
+            if own is parents:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+        
+        # No path found
+        return None, self._explored_result(nodes_explored, explored_count)
+    
+    def _explored_result(self, nodes_explored, explored_count):
+        """Explored nodes in the form requested by record_explored"""
+        return nodes_explored if self.record_explored else explored_count
+    
+    def _dict_search(self, initial_state, goal_state, breadth_first):
+        """
+        BFS/DFS over a dictionary graph using parent pointers
+        
+        The frontier only holds nodes; the path is rebuilt from the parent
+        map once the goal is found, so no path is copied per discovered node.
+        """
+        # parents doubles as the visited set
+        parents = {initial_state: None}
+        frontier = deque([initial_state])
+        next_node = frontier.popleft if breadth_first else frontier.pop
+        nodes_explored = [initial_state] if self.record_explored else None
+        explored_count = 1
+        
+        while frontier:
+            current_node = next_node()
             
             # Get neighbors
             neighbors = self.graph.get(current_node, [])
@@ -88,17 +210,78 @@ class SearchAlgorithm:
             for neighbor in neighbors:
                 if neighbor == goal_state:
                     # Goal found
-                    final_path = path + [neighbor]
-                    nodes_explored.append(neighbor)
-                    return final_path, nodes_explored
+                    parents[neighbor] = current_node
+                    if nodes_explored is not None:
+                        nodes_explored.append(neighbor)
+                    return (self._path_from_parents(parents, neighbor),
+                            self._explored_result(nodes_explored, explored_count + 1))
+                
+                if neighbor not in parents:
+                    parents[neighbor] = current_node
+                    explored_count += 1
+                    if nodes_explored is not None:
+                        nodes_explored.append(neighbor)
+                    frontier.append(neighbor)
+        
+        # No path found
+        return None, self._explored_result(nodes_explored, explored_count)
+    
+    @staticmethod
+    def _path_from_parents(parents, node):
+        """Rebuild the path ending at node from a parent map"""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return path
+    
+    def _csr_search(self, initial_state, goal_state, breadth_first):
+        """
+        BFS/DFS over a CSRGraph using integer ids and parent pointers
+        
+        Expands nodes in exactly the same order as the dictionary version.
+        """
+        csr = self.graph
+        names = csr.names
+        start = csr.node_id(initial_state)
+        if start is None:
+            return None, self._explored_result([initial_state], 1)
+        goal = csr.node_id(goal_state)
+        if goal is None:
+            goal = -1
+        
+        offsets, targets = csr.offsets, csr.targets
+        visited = bytearray(csr.num_nodes)
+        visited[start] = 1
+        parents = {start: -1}
+        nodes_explored = [initial_state] if self.record_explored else None
+        explored_count = 1
+        frontier = deque([start])
+        next_node = frontier.popleft if breadth_first else frontier.pop
+        
+        while frontier:
+            current = next_node()
+            
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                if neighbor == goal:
+                    parents[neighbor] = current
+                    if nodes_explored is not None:
+                        nodes_explored.append(goal_state)
+                    return (csr.path_from_parents(parents, goal),
+                            self._explored_result(nodes_explored, explored_count + 1))
                 
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    nodes_explored.append(neighbor)
-                    stack.append((neighbor, path + [neighbor]))
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parents[neighbor] = current
+                    explored_count += 1
+                    if nodes_explored is not None:
+                        nodes_explored.append(names[neighbor])
+                    frontier.append(neighbor)
         
         # No path found
-        return None, nodes_explored
+        return None, self._explored_result(nodes_explored, explored_count)
     
     def search(self, initial_state, goal_state, strategy='bfs'):
         """
@@ -107,7 +290,8 @@ class SearchAlgorithm:
         Args:
             initial_state: Starting node
             goal_state: Target node
-            strategy: 'bfs' for Breadth-First Search or 'dfs' for Depth-First Search
+            strategy: 'bfs' for Breadth-First Search, 'dfs' for Depth-First Search
+                      or 'bidirectional' for Bidirectional Breadth-First Search
             
         Returns:
             tuple: (path, nodes_explored) or (None, nodes_explored) if no path found
@@ -116,8 +300,10 @@ class SearchAlgorithm:
             return self.breadth_first_search(initial_state, goal_state)
         elif strategy.lower() == 'dfs':
             return self.depth_first_search(initial_state, goal_state)
+        elif strategy.lower() == 'bidirectional':
+            return self.bidirectional_search(initial_state, goal_state)
         else:
-            raise ValueError(f"Unknown strategy: {strategy}. Use 'bfs' or 'dfs'")
+            raise ValueError(f"Unknown strategy: {strategy}. Use 'bfs', 'dfs' or 'bidirectional'")
 
 
 if __name__ == "__main__":
@@ -140,7 +326,7 @@ if __name__ == "__main__":
     if path:
         print(f"Path from {initial} to {goal}: {' -> '.join(path)}")
         print(f"Path length: {len(path) - 1} edges")
-        print(f"Nodes explored: {len(explored)}")
+        print(f"Nodes explored: {explored}")
     else:
         print(f"No path found from {initial} to {goal}")
     
@@ -152,7 +338,7 @@ if __name__ == "__main__":
     if path:
         print(f"Path from {initial} to {goal}: {' -> '.join(path)}")
         print(f"Path length: {len(path) - 1} edges")
-        print(f"Nodes explored: {len(explored)}")
+        print(f"Nodes explored: {explored}")
     else:
         print(f"No path found from {initial} to {goal}")
 
@@ -2,7 +2,11 @@
 Test cases for Question 1
 """
 
-from graph_converter import create_figure1_graph
+import os
+import tempfile
+import time
+
+from graph_converter import GraphConverter, create_figure1_graph
 from search_algorithm import SearchAlgorithm
 
 
@@ -20,6 +24,16 @@ def test_question1():
     print(f"   Total nodes: {len(graph)}")
     print(f"   Sample node 'Addis Ababa' has {len(graph.get('Addis Ababa', []))} neighbors")
     
+    # Bulk builds drop duplicates in O(1) per edge, even around a hub
+    hub = GraphConverter()
+    start = time.perf_counter()
+    hub.build_from_edges([("Hub", f"Town {i}") for i in range(50000)] + [("Hub", "Town 0"), ("Town 1", "Hub")])
+    hub_seconds = time.perf_counter() - start
+    if len(hub.graph["Hub"]) == 50000 and hub.graph["Town 1"] == ["Hub"] and hub_seconds < 2:
+        print(f"   [OK] 50000-edge hub built with duplicates dropped")
+    else:
+        print(f"   [FAIL] Hub build: degree {len(hub.graph['Hub'])} in {hub_seconds:.2f}s")
+    
     # Test search algorithms
     search_alg = SearchAlgorithm(graph)
     
@@ -32,9 +46,17 @@ def test_question1():
     if path:
         print(f"   [OK] BFS found path: {' -> '.join(path)}")
         print(f"   Path length: {len(path) - 1} edges")
+        print(f"   Nodes explored: {explored}")
     else:
         print(f"   [FAIL] BFS: No path found")
     
+    # The explored list is opt-in; it must agree with the default count
+    recorded_path, recorded = SearchAlgorithm(graph, record_explored=True).search(initial, goal, strategy='bfs')
+    if recorded_path == path and len(recorded) == explored:
+        print(f"   [OK] record_explored list matches the explored count")
+    else:
+        print(f"   [FAIL] record_explored: {len(recorded)} nodes vs count {explored}")
+    
     # Test DFS
     print("\n1.2 Testing DFS:")
     path, explored = search_alg.search(initial, goal, strategy='dfs')
@@ -44,6 +66,55 @@ def test_question1():
     else:
         print(f"   [FAIL] DFS: No path found")
     
+    # Test Bidirectional BFS
+    print("\n1.2 Testing Bidirectional BFS:")
+    bfs_path, bfs_explored = search_alg.search(initial, goal, strategy='bfs')
+    path, explored = search_alg.search(initial, goal, strategy='bidirectional')
+    if path and len(path) == len(bfs_path):
+        print(f"   [OK] Bidirectional BFS found path: {' -> '.join(path)}")
+        print(f"   Nodes explored: {explored} (BFS: {bfs_explored})")
+    else:
+        print(f"   [FAIL] Bidirectional BFS: {path}")
+    
+    # Test CSR backend
+    print("\n1.3 Testing CSR graph backend:")
+    csr = converter.to_csr()
+    csr_search = SearchAlgorithm(csr)
+    print(f"   CSR graph: {csr.num_nodes} nodes, {csr.num_edges} directed edges")
+    for strategy in ('bfs', 'dfs', 'bidirectional'):
+        csr_path, _ = csr_search.search(initial, goal, strategy=strategy)
+        dict_path, _ = search_alg.search(initial, goal, strategy=strategy)
+        # Equal-length shortest paths may differ for bidirectional search,
+        # because the reversed CSR lists neighbors in a different order
+        same = len(csr_path) == len(dict_path) if strategy == 'bidirectional' else csr_path == dict_path
+        if same:
+            print(f"   [OK] {strategy.upper()} on CSR matches dictionary graph")
+        else:
+            print(f"   [FAIL] {strategy.upper()} on CSR: {csr_path}")
+    
+    # Test binary snapshot round trip
+    snapshot_path = os.path.join(tempfile.mkdtemp(), "figure1.csr")
+    converter.save_snapshot(snapshot_path)
+    loaded = GraphConverter.load_snapshot(snapshot_path)
+    loaded_path, _ = SearchAlgorithm(loaded).search(initial, goal, strategy='bfs')
+    if loaded_path == search_alg.search(initial, goal, strategy='bfs')[0]:
+        print(f"   [OK] Snapshot loaded via mmap ({os.path.getsize(snapshot_path)} bytes)")
+    else:
+        print(f"   [FAIL] Snapshot search returned {loaded_path}")
+    
+    # A truncated snapshot must be rejected, not loaded with cut names
+    truncated_path = os.path.join(os.path.dirname(snapshot_path), "truncated.csr")
+    with open(snapshot_path, 'rb') as source, open(truncated_path, 'wb') as target:
+        target.write(source.read()[:-5])
+    try:
+        GraphConverter.load_snapshot(truncated_path)
+        print("   [FAIL] Truncated snapshot loaded without error")
+    except ValueError:
+        print("   [OK] Truncated snapshot rejected")
+    leftovers = [name for name in os.listdir(os.path.dirname(snapshot_path)) if name.endswith('.tmp')]
+    if leftovers:
+        print(f"   [FAIL] Temporary snapshot files left behind: {leftovers}")
+    
     print("\n" + "=" * 60)
 
 
@@ -0,0 +1,67 @@
+"""
+Benchmark: one-directional vs bidirectional Dijkstra (UniformCostSearch)
+Checks that both return identical optimal costs and compares how many
+nodes they settle on undirected and directed synthetic road networks
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import create_synthetic_graph
+from question2.uniform_cost_search import UniformCostSearch
+
+
+def compare(graph, queries):
+    """Return {mode: (settled nodes, seconds)} after checking equal costs"""
+    searches = {
+        'one-directional': UniformCostSearch(graph),
+        'bidirectional': UniformCostSearch(graph, bidirectional=True),
+    }
+    results = {}
+    costs = {}
+    for mode, ucs in searches.items():
+        settled = 0
+        start = time.perf_counter()
+        costs[mode] = []
+        for initial, goal in queries:
+            _, cost, explored = ucs.search(initial, goal)
+            costs[mode].append(cost)
+            settled += len(explored)
+        results[mode] = (settled, time.perf_counter() - start)
+    assert costs['one-directional'] == costs['bidirectional'], "optimal costs differ"
+    return results
+
+
+def report(title, results, num_queries):
+    print(f"\n{title} ({num_queries} queries, identical costs)")
+    base_settled, _ = results['one-directional']
+    for mode, (settled, seconds) in results.items():
+        print(f"  {mode:16s} {settled / num_queries:10.1f} settled/query  "
+              f"{seconds / num_queries * 1e3:8.2f} ms/query  ({settled / base_settled:.0%})")
+
+
+def run_benchmark(size=150, num_queries=30, seed=0):
+    print("=" * 60)
+    print("Bidirectional Dijkstra benchmark")
+    print("=" * 60)
+
+    rng = random.Random(seed)
+    for directed in (False, True):
+        graph = create_synthetic_graph(size, size, seed=seed, directed=directed)
+        kind = "directed" if directed else "undirected"
+        for backend, searchable in (("dict", graph), ("CSR", graph.to_csr())):
+            names = sorted(graph.get_graph())
+            random_queries = [(rng.choice(names), rng.choice(names)) for _ in range(num_queries)]
+            low, high = size // 4, 3 * size // 4
+            long_queries = [(f"City {low}-{low}", f"City {high}-{high}"),
+                            (f"City {low}-{high}", f"City {high}-{low}")]
+            report(f"{size}x{size} {kind} grid, {backend}, random pairs",
+                   compare(searchable, random_queries), len(random_queries))
+            report(f"{size}x{size} {kind} grid, {backend}, long interior queries",
+                   compare(searchable, long_queries), len(long_queries))
+
+
+if __name__ == "__main__":
+    run_benchmark()
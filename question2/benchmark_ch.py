@@ -0,0 +1,68 @@
+"""
+Benchmark: Contraction Hierarchies vs Uniform Cost Search
+Reports preprocessing time, shortcut overhead and per-query latency on
+synthetic road networks, and checks every query returns the UCS cost
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import create_synthetic_graph
+from question2.uniform_cost_search import UniformCostSearch
+from question2.contraction_hierarchies import ContractionHierarchy
+
+
+def time_queries(search, queries):
+    """Return (costs, nodes settled per query, seconds per query)"""
+    costs = []
+    settled = 0
+    start = time.perf_counter()
+    for initial, goal in queries:
+        _, cost, explored = search(initial, goal)
+        costs.append(cost)
+        settled += len(explored)
+    return costs, settled / len(queries), (time.perf_counter() - start) / len(queries)
+
+
+def run_benchmark(sizes=(50, 100), num_queries=100, seed=0):
+    print("=" * 60)
+    print("Contraction Hierarchies benchmark")
+    print("=" * 60)
+
+    for size in sizes:
+        for directed in (False, True):
+            graph = create_synthetic_graph(size, size, seed=seed, directed=directed)
+            csr = graph.to_csr()
+            kind = "directed" if directed else "undirected"
+            print(f"\n{size}x{size} {kind} grid: {csr.num_nodes} nodes, {csr.num_edges} edges")
+
+            start = time.perf_counter()
+            hierarchy = ContractionHierarchy(csr)
+            preprocessing = time.perf_counter() - start
+            print(f"  preprocessing    {preprocessing:8.2f} s")
+            print(f"  shortcuts        {hierarchy.num_shortcuts:8d} "
+                  f"({hierarchy.num_shortcuts / csr.num_edges:.0%} of original edges)")
+
+            rng = random.Random(seed)
+            queries = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(num_queries)]
+            searches = [
+                ("UCS", UniformCostSearch(csr).search),
+                ("bidirectional", UniformCostSearch(csr, bidirectional=True).search),
+                ("CH", hierarchy.search),
+            ]
+            reference = None
+            for name, search in searches:
+                costs, settled, seconds = time_queries(search, queries)
+                if reference is None:
+                    reference = costs
+                    base_seconds = seconds
+                assert costs == reference, f"{name} returned a non-optimal cost"
+                print(f"  {name:14s} {settled:10.1f} settled/query  {seconds * 1e3:8.3f} ms/query"
+                      f"  ({base_seconds / seconds:5.1f}x)")
+            print(f"  break-even after {preprocessing / max(base_seconds - seconds, 1e-9):.0f} queries")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,76 @@
+"""
+Benchmark: dictionary adjacency lists vs the compact CSRGraph backend
+Compares retained memory and per-query latency of UCS and BFS on a
+large synthetic road network
+"""
+
+import random
+import sys
+import os
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.graph_converter import GraphConverter
+from question1.search_algorithm import SearchAlgorithm
+from question2.graph_with_costs import create_synthetic_graph
+from question2.uniform_cost_search import UniformCostSearch
+
+
+def measure_memory(build):
+    """Return (result, bytes retained by result) for a build function"""
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def time_queries(search, queries):
+    """Average seconds per query"""
+    start = time.perf_counter()
+    for initial, goal in queries:
+        search(initial, goal)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def run_benchmark(rows=200, cols=200, num_queries=20, seed=0):
+    print("=" * 60)
+    print(f"CSR benchmark on a {rows}x{cols} synthetic grid")
+    print("=" * 60)
+
+    graph, dict_bytes = measure_memory(lambda: create_synthetic_graph(rows, cols, seed=seed))
+    csr, csr_bytes = measure_memory(graph.to_csr)
+    # The CSR graph reuses the dict graph's name strings, which were
+    # allocated before its measurement started: count them for both
+    name_bytes = sum(sys.getsizeof(name) for name in csr.names)
+    print(f"Nodes: {csr.num_nodes}, directed edges: {csr.num_edges}")
+    print(f"Weighted dict graph memory: {dict_bytes / 1e6:8.1f} MB")
+    print(f"Weighted CSR graph memory:  {(csr_bytes + name_bytes) / 1e6:8.1f} MB")
+    print(f"  of which node names:      {name_bytes / 1e6:8.1f} MB (same strings in both)")
+
+    converter = GraphConverter()
+    converter.build_from_adjacency_list(
+        {node: [n for n, _ in neighbors] for node, neighbors in graph.get_graph().items()}
+    )
+
+    rng = random.Random(seed)
+    names = csr.names
+    queries = [(rng.choice(names), rng.choice(names)) for _ in range(num_queries)]
+
+    ucs_dict = UniformCostSearch(graph)
+    ucs_csr = UniformCostSearch(csr)
+    for initial, goal in queries:
+        assert ucs_dict.search(initial, goal)[1] == ucs_csr.search(initial, goal)[1]
+
+    print("\nPer-query latency:")
+    print(f"  UCS dict: {time_queries(ucs_dict.search, queries) * 1e3:8.2f} ms")
+    print(f"  UCS CSR:  {time_queries(ucs_csr.search, queries) * 1e3:8.2f} ms")
+
+    bfs_dict = SearchAlgorithm(converter.get_graph())
+    bfs_csr = SearchAlgorithm(converter.to_csr())
+    print(f"  BFS dict: {time_queries(bfs_dict.breadth_first_search, queries) * 1e3:8.2f} ms")
+    print(f"  BFS CSR:  {time_queries(bfs_csr.breadth_first_search, queries) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+"""
+Benchmark: binary heap vs Dial bucket queue frontier
+Runs UCS and A* (zero heuristic) on large synthetic road networks with
+small integer costs, plus a float-cost graph where 'auto' falls back to
+the heap
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import GraphWithCosts, create_synthetic_graph
+from question2.uniform_cost_search import UniformCostSearch
+from question3.astar_search import AStarSearch
+
+
+def time_queries(search, queries):
+    """Average seconds per query and the list of returned costs"""
+    costs = []
+    start = time.perf_counter()
+    for initial, goal in queries:
+        costs.append(search(initial, goal)[1])
+    return (time.perf_counter() - start) / len(queries), costs
+
+
+def compare(title, make_search, queries, kinds=('heap', 'bucket')):
+    print(f"\n{title} ({len(queries)} queries)")
+    reference = None
+    for kind in kinds:
+        seconds, costs = time_queries(make_search(kind).search, queries)
+        if reference is None:
+            reference = costs
+        assert costs == reference, "frontiers disagree on optimal costs"
+        print(f"  {kind:6s} {seconds * 1e3:8.2f} ms/query")
+
+
+def run_benchmark(size=200, max_cost=20, num_queries=20, seed=0):
+    print("=" * 60)
+    print("Frontier benchmark: heap vs Dial bucket queue")
+    print("=" * 60)
+
+    graph = create_synthetic_graph(size, size, max_cost=max_cost, seed=seed)
+    csr = graph.to_csr()
+    rng = random.Random(seed)
+    queries = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(num_queries)]
+    zero = lambda node, goal: 0
+
+    compare(f"UCS, {size}x{size} grid, dict graph, costs 1..{max_cost}",
+            lambda kind: UniformCostSearch(graph, frontier=kind), queries)
+    compare(f"UCS, {size}x{size} grid, CSR graph, costs 1..{max_cost}",
+            lambda kind: UniformCostSearch(csr, frontier=kind), queries)
+    compare(f"Bidirectional UCS, {size}x{size} grid, CSR graph",
+            lambda kind: UniformCostSearch(csr, bidirectional=True, frontier=kind), queries)
+    compare(f"A* (zero heuristic), {size}x{size} grid, CSR graph",
+            lambda kind: AStarSearch(csr, zero, frontier=kind), queries)
+
+    float_graph = GraphWithCosts()
+    float_graph.build_from_edges(
+        ((node, neighbor, cost + 0.5) for node, neighbors in graph.get_graph().items()
+         for neighbor, cost in neighbors),
+        bidirectional=False,
+    )
+    compare(f"UCS, {size}x{size} grid, float costs ('auto' uses the heap)",
+            lambda kind: UniformCostSearch(float_graph, frontier=kind), queries,
+            kinds=('heap', 'auto'))
+
+
+if __name__ == "__main__":
+    run_benchmark()
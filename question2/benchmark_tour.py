@@ -0,0 +1,52 @@
+"""
+Benchmark: multi-goal itinerary quality vs time budget
+Builds the goal distance matrix once, then compares the greedy order,
+2-opt / Or-opt improvement under several wall-clock budgets and (for
+small goal sets) the exact Held-Karp optimum
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import create_synthetic_graph
+from question2.uniform_cost_search import UniformCostSearch
+from question2.tour_solver import (goal_distance_matrix, held_karp, improve_tour,
+                                   nearest_neighbor_order, tour_cost)
+
+
+def run_benchmark(size=80, goal_counts=(12, 40, 120), budgets=(0.01, 0.05, 0.2, 1.0), seed=0):
+    print("=" * 60)
+    print("Multi-goal tour benchmark: greedy vs 2-opt/Or-opt vs exact")
+    print("=" * 60)
+
+    for directed in (False, True):
+        graph = create_synthetic_graph(size, size, seed=seed, directed=directed)
+        ucs = UniformCostSearch(graph.to_csr())
+        names = sorted(graph.get_graph())
+        rng = random.Random(seed)
+        kind = "directed" if directed else "undirected"
+
+        for num_goals in goal_counts:
+            nodes = rng.sample(names, num_goals + 1)
+            start = time.perf_counter()
+            matrix, _ = goal_distance_matrix(ucs, nodes)
+            print(f"\n{size}x{size} {kind} grid, {num_goals} goals "
+                  f"(distance matrix {time.perf_counter() - start:.2f} s)")
+
+            greedy = nearest_neighbor_order(matrix)
+            greedy_cost = tour_cost(matrix, greedy)
+            print(f"  greedy          cost {greedy_cost:8.0f}")
+            for budget in budgets:
+                _, cost, trace = improve_tour(matrix, greedy, time_budget=budget)
+                print(f"  improve {budget:5.2f}s   cost {cost:8.0f}  ({1 - cost / greedy_cost:5.1%} better, "
+                      f"{len(trace) - 1} improvements, last at {trace[-1][0]:.3f} s)")
+            if num_goals <= 18:
+                start = time.perf_counter()
+                _, cost = held_karp(matrix)
+                print(f"  exact           cost {cost:8.0f}  ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
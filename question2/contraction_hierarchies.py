@@ -0,0 +1,236 @@
+"""
+Contraction Hierarchies for many point-to-point queries on a static graph
+
+Preprocessing contracts the nodes one at a time in order of importance.
+Contracting v removes it from the remaining graph and, for every pair of
+remaining neighbors u -> v -> w, inserts a shortcut u -> w unless a witness
+search finds a path from u to w that avoids v and is no longer. Every node
+gets a rank (its contraction order) and every edge, original or shortcut,
+ends up pointing either up or down the ranks.
+
+A query is a bidirectional Dijkstra that only follows upward edges: the
+forward search climbs from the start, the backward search climbs (over
+reversed edges) from the goal, and the shortest path passes through the
+highest-ranked node where they meet. Shortcuts are unpacked back into the
+original edges before the path is returned.
+"""
+
+import heapq
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.csr_graph import CSRGraph
+
+
+class ContractionHierarchy:
+    """Preprocessed GraphWithCosts/CSRGraph answering shortest-path queries"""
+
+    def __init__(self, graph, witness_limit=50):
+        """
+        Contract every node of the graph (the preprocessing step)
+
+        Args:
+            graph: GraphWithCosts object or CSRGraph (non-negative costs)
+            witness_limit: Maximum nodes settled per witness search. Lower is
+                           faster to preprocess but may add shortcuts that a
+                           longer search would have proven unnecessary;
+                           queries stay exact either way
+        """
+        adjacency = graph.get_graph()
+        self.csr = adjacency if isinstance(adjacency, CSRGraph) else CSRGraph.from_adjacency(adjacency)
+        self.witness_limit = witness_limit
+        self.num_shortcuts = 0
+
+        num_nodes = self.csr.num_nodes
+        self.rank = [0] * num_nodes
+        self._upward = [[] for _ in range(num_nodes)]    # node -> [(higher node, cost)]
+        self._downward = [[] for _ in range(num_nodes)]  # node -> [(higher node, cost)] over reversed edges
+        self._middle = {}  # (u, w) -> node a shortcut u -> w skips
+        self._contract_all()
+
+    def _contract_all(self):
+        """Order nodes by edge difference (lazy updates) and contract them"""
+        num_nodes = self.csr.num_nodes
+        inf = float('inf')
+        # Remaining graph, with the cheapest cost kept for parallel edges
+        self._out = [{} for _ in range(num_nodes)]
+        self._in = [{} for _ in range(num_nodes)]
+        for node in range(num_nodes):
+            for neighbor, cost in self.csr.neighbor_items(node):
+                if neighbor != node and cost < self._out[node].get(neighbor, inf):
+                    self._out[node][neighbor] = cost
+                    self._in[neighbor][node] = cost
+        self._deleted_neighbors = [0] * num_nodes
+
+        queue = [(self._priority(node), node) for node in range(num_nodes)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, node = heapq.heappop(queue)
+            # Lazy update: the stored priority may be stale since neighbors
+            # were contracted; re-queue if the node is no longer the minimum
+            priority = self._priority(node)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, node))
+                continue
+            self._contract(node)
+            self.rank[node] = order
+            order += 1
+
+        del self._out, self._in, self._deleted_neighbors
+
+    def _priority(self, node):
+        """Edge difference plus contracted neighbors (spreads contraction evenly)"""
+        shortcuts = self._shortcuts(node)
+        removed = len(self._out[node]) + len(self._in[node])
+        return len(shortcuts) - removed + self._deleted_neighbors[node]
+
+    def _shortcuts(self, node):
+        """Shortcuts (u, w, cost) needed to contract node"""
+        out_edges = self._out[node]
+        shortcuts = []
+        if not out_edges:
+            return shortcuts
+        for source, cost_in in self._in[node].items():
+            max_out = max((cost for target, cost in out_edges.items() if target != source), default=None)
+            if max_out is None:
+                continue
+            witness = self._witness_search(source, node, cost_in + max_out)
+            for target, cost_out in out_edges.items():
+                if target != source and witness.get(target, cost_in + cost_out + 1) > cost_in + cost_out:
+                    shortcuts.append((source, target, cost_in + cost_out))
+        return shortcuts
+
+    def _witness_search(self, source, excluded, max_cost):
+        """Dijkstra from source in the remaining graph, avoiding excluded"""
+        distances = {source: 0}
+        queue = [(0, source)]
+        settled = 0
+        while queue and settled < self.witness_limit:
+            distance, node = heapq.heappop(queue)
+            if distance > max_cost:
+                break
+            if distance > distances[node]:
+                continue
+            settled += 1
+            for neighbor, cost in self._out[node].items():
+                if neighbor == excluded:
+                    continue
+                new_distance = distance + cost
+                if new_distance < distances.get(neighbor, new_distance + 1):
+                    distances[neighbor] = new_distance
+                    heapq.heappush(queue, (new_distance, neighbor))
+        return distances
+
+    def _contract(self, node):
+        """Insert the node's shortcuts and remove it from the remaining graph"""
+        for source, target, cost in self._shortcuts(node):
+            if cost < self._out[source].get(target, cost + 1):
+                self._out[source][target] = cost
+                self._in[target][source] = cost
+                self._middle[(source, target)] = node
+                self.num_shortcuts += 1
+
+        # Every remaining neighbor is contracted later, so these edges all
+        # point up the hierarchy from this node
+        self._upward[node] = list(self._out[node].items())
+        self._downward[node] = list(self._in[node].items())
+        for target in self._out[node]:
+            del self._in[target][node]
+            self._deleted_neighbors[target] += 1
+        for source in self._in[node]:
+            del self._out[source][node]
+            self._deleted_neighbors[source] += 1
+        self._out[node], self._in[node] = {}, {}
+
+    def search(self, initial_state, goal_state):
+        """
+        Shortest path query (upward bidirectional Dijkstra)
+
+        Args:
+            initial_state: Starting node
+            goal_state: Target node
+
+        Returns:
+            tuple: (path, total_cost, nodes_explored) or (None, None, nodes_explored) if no path found
+        """
+        if initial_state == goal_state:
+            return [initial_state], 0, [initial_state]
+
+        csr = self.csr
+        start, goal = csr.node_id(initial_state), csr.node_id(goal_state)
+        if start is None or goal is None:
+            return None, None, [initial_state]
+
+        inf = float('inf')
+        names = csr.names
+        min_cost = ({start: 0}, {goal: 0})
+        parents = ({start: -1}, {goal: -1})
+        queues = ([(0, start)], [(0, goal)])
+        settled = (set(), set())
+        edges = (self._upward, self._downward)
+        nodes_explored = []
+        best_cost = inf
+        meeting_node = -1
+
+        while True:
+            # A side is done once its queue minimum cannot improve best_cost
+            live = [side for side in (0, 1) if queues[side] and queues[side][0][0] < best_cost]
+            if not live:
+                break
+            side = min(live, key=lambda side: queues[side][0][0])
+            total_cost, current = heapq.heappop(queues[side])
+            if current in settled[side] or total_cost > min_cost[side][current]:
+                continue
+            settled[side].add(current)
+            nodes_explored.append(names[current])
+
+            other_cost = min_cost[1 - side].get(current)
+            if other_cost is not None and total_cost + other_cost < best_cost:
+                best_cost = total_cost + other_cost
+                meeting_node = current
+
+            own_cost = min_cost[side]
+            for neighbor, edge_cost in edges[side][current]:
+                new_cost = total_cost + edge_cost
+                if new_cost < own_cost.get(neighbor, inf):
+                    own_cost[neighbor] = new_cost
+                    parents[side][neighbor] = current
+                    heapq.heappush(queues[side], (new_cost, neighbor))
+
+        if meeting_node == -1:
+            return None, None, nodes_explored
+
+        # Hierarchy path: start up to the meeting node, then down to the goal
+        hierarchy_path = []
+        node = meeting_node
+        while node != -1:
+            hierarchy_path.append(node)
+            node = parents[0][node]
+        hierarchy_path.reverse()
+        node = parents[1][meeting_node]
+        while node != -1:
+            hierarchy_path.append(node)
+            node = parents[1][node]
+
+        path = [start]
+        for source, target in zip(hierarchy_path, hierarchy_path[1:]):
+            self._unpack(source, target, path)
+        return [names[node] for node in path], best_cost, nodes_explored
+
+    def _unpack(self, source, target, path):
+        """Append the original nodes of edge source -> target (after source) to path"""
+        stack = [(source, target)]
+        while stack:
+            source, target = stack.pop()
+            middle = self._middle.get((source, target))
+            if middle is None:
+                path.append(target)
+            else:
+                stack.append((middle, target))
+                stack.append((source, middle))
+
+    @property
+    def num_edges(self):
+        """Edges in the hierarchy (original edges plus shortcuts)"""
+        return sum(map(len, self._upward)) + sum(map(len, self._downward))
@@ -0,0 +1,150 @@
+"""
+Priority-queue frontiers for Uniform Cost Search and A*
+
+HeapFrontier wraps heapq and works for any priorities. BucketFrontier is a
+circular bucket queue (Dial's algorithm): when every edge cost is a small
+non-negative integer, push and pop are O(1) plus a short scan over empty
+buckets, instead of O(log n) tuple comparisons.
+"""
+
+import heapq
+
+# Largest edge cost for which make_frontier() picks buckets automatically
+DEFAULT_BUCKET_BOUND = 1024
+
+
+class HeapFrontier:
+    """Binary-heap frontier (any comparable priorities)"""
+
+    def __init__(self):
+        self._heap = []
+
+    def push(self, priority, item):
+        """Add item with the given priority"""
+        heapq.heappush(self._heap, (priority, item))
+
+    def pop(self):
+        """Remove and return the (priority, item) pair with lowest priority"""
+        return heapq.heappop(self._heap)
+
+    def min_priority(self):
+        """Lowest priority currently queued"""
+        return self._heap[0][0]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class BucketFrontier:
+    """
+    Circular bucket queue (Dial's algorithm) for integer priorities
+
+    With edge costs in [0, max_cost], every priority pushed while expanding
+    a node with priority p lies in [p, p + max_cost], so max_cost + 1
+    buckets indexed by priority modulo the bucket count are enough.
+
+    Priorities that do not fit that window (floats, or integers below the
+    current minimum or beyond the window, which can happen with A*
+    heuristics) go to an overflow heap, so the queue stays correct for any
+    input and only loses speed on the unusual entries.
+    """
+
+    def __init__(self, max_cost):
+        """
+        Args:
+            max_cost: Largest edge cost (non-negative integer)
+        """
+        self._num_buckets = max_cost + 1
+        self._buckets = [[] for _ in range(self._num_buckets)]
+        self._current = 0  # Lowest priority any bucket may hold
+        self._bucket_count = 0
+        self._overflow = []
+
+    def push(self, priority, item):
+        """Add item with the given priority"""
+        if type(priority) is int and 0 <= priority - self._current < self._num_buckets:
+            self._buckets[priority % self._num_buckets].append(item)
+            self._bucket_count += 1
+        else:
+            heapq.heappush(self._overflow, (priority, item))
+
+    def _advance(self):
+        """Move the window start to the lowest non-empty bucket"""
+        buckets, num_buckets = self._buckets, self._num_buckets
+        current = self._current
+        while not buckets[current % num_buckets]:
+            current += 1
+        self._current = current
+
+    def pop(self):
+        """Remove and return the (priority, item) pair with lowest priority"""
+        if self._bucket_count:
+            self._advance()
+            if not self._overflow or self._current <= self._overflow[0][0]:
+                self._bucket_count -= 1
+                return self._current, self._buckets[self._current % self._num_buckets].pop()
+
+        priority, item = heapq.heappop(self._overflow)
+        if not self._bucket_count and type(priority) is int:
+            # Re-centre the empty window so later pushes land in buckets
+            self._current = priority
+        return priority, item
+
+    def min_priority(self):
+        """Lowest priority currently queued"""
+        if self._bucket_count:
+            self._advance()
+            if not self._overflow or self._current <= self._overflow[0][0]:
+                return self._current
+        return self._overflow[0][0]
+
+    def __len__(self):
+        return self._bucket_count + len(self._overflow)
+
+
+def edge_cost_profile(graph):
+    """
+    Summarize the edge costs of a graph
+
+    Args:
+        graph: Weighted adjacency dictionary or CSRGraph
+
+    Returns:
+        tuple: (all costs are non-negative integers, largest cost)
+    """
+    costs = getattr(graph, 'costs', None)
+    if costs is None and hasattr(graph, 'offsets'):
+        return True, 1  # Unweighted CSR graph: every edge costs 1
+    if costs is None:
+        costs = [cost for neighbors in graph.values() for _, cost in neighbors]
+    if len(costs) == 0:
+        return True, 0
+    integral = all(type(cost) is int and cost >= 0 for cost in costs)
+    return integral, max(costs)
+
+
+def make_frontier(kind='auto', profile=(False, 0), bound=DEFAULT_BUCKET_BOUND):
+    """
+    Create a frontier
+
+    Args:
+        kind: 'heap', 'bucket', or 'auto' (buckets when every edge cost is a
+              non-negative integer no larger than bound, heap otherwise)
+        profile: (integral, max_cost) as returned by edge_cost_profile()
+        bound: Largest max_cost for which 'auto' picks buckets
+
+    Returns:
+        HeapFrontier or BucketFrontier
+    """
+    integral, max_cost = profile
+    if kind == 'heap':
+        return HeapFrontier()
+    if kind == 'bucket':
+        if not integral:
+            raise ValueError("Bucket frontier needs non-negative integer edge costs")
+        return BucketFrontier(max_cost)
+    if kind == 'auto':
+        if integral and max_cost <= bound:
+            return BucketFrontier(max_cost)
+        return HeapFrontier()
+    raise ValueError(f"Unknown frontier: {kind}. Use 'auto', 'heap' or 'bucket'")
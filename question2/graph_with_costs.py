@@ -3,11 +3,18 @@ Question 2.1: Convert Figure 2 (State space graph with backward cost)
 into a manageable data structure
 """
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.csr_graph import CSRGraph
+
+
 class GraphWithCosts:
     """Represents a graph with edge costs (backward costs)"""
     
     def __init__(self):
         self.graph = {}  # {node: [(neighbor, cost), ...]}
+        self._reverse_graph = None  # Cached by get_reverse_graph()
     
     def add_edge(self, from_node, to_node, cost):
         """
@@ -18,12 +25,33 @@ class GraphWithCosts:
             to_node: Destination node
             cost: Cost of the edge
         """
-        if from_node not in self.graph:
-            self.graph[from_node] = []
+        self._link(from_node, to_node, cost, None)
+    
+    def _link(self, from_node, to_node, cost, index):
+        """
+        Append (to_node, cost) to from_node's neighbors unless to_node is
+        already one of them (first cost wins)
         
-        # Check if edge already exists to avoid duplicates
-        if not any(neighbor == to_node for neighbor, _ in self.graph[from_node]):
-            self.graph[from_node].append((to_node, cost))
+        Args:
+            index: None to check the neighbor list (single insertions), or a
+                   bulk build's {node: set of neighbors} for O(1) checks
+        """
+        neighbors = self.graph.get(from_node)
+        if neighbors is None:
+            neighbors = self.graph[from_node] = []
+        if index is None:
+            for neighbor, _ in neighbors:
+                if neighbor == to_node:
+                    return
+        else:
+            targets = index.get(from_node)
+            if targets is None:
+                targets = index[from_node] = {neighbor for neighbor, _ in neighbors}
+            if to_node in targets:
+                return
+            targets.add(to_node)
+        neighbors.append((to_node, cost))
+        self._reverse_graph = None
     
     def add_bidirectional_edge(self, from_node, to_node, cost):
         """Add bidirectional edge with same cost both ways"""
@@ -32,17 +60,40 @@ class GraphWithCosts:
     
     def build_from_edges(self, edges, bidirectional=True):
         """
-        Build graph from a list of edges with costs
+        Build graph from edges with costs (bulk path)
+        
+        Edges are consumed one at a time, so a generator reading from a file
+        never has to materialize the whole edge list. Duplicates are dropped
+        (keeping the first cost seen) through a hashed index of every touched
+        node's neighbors that only lives for this build, so hubs stay O(1)
+        per edge and the graph remains the only lasting copy of its edges.
         
         Args:
-            edges: List of tuples (from_node, to_node, cost)
+            edges: Iterable of tuples (from_node, to_node, cost)
             bidirectional: If True, make all edges bidirectional (default: True)
         """
+        index = {}
+        link = self._link
         for from_node, to_node, cost in edges:
+            link(from_node, to_node, cost, index)
             if bidirectional:
-                self.add_bidirectional_edge(from_node, to_node, cost)
-            else:
-                self.add_edge(from_node, to_node, cost)
+                link(to_node, from_node, cost, index)
+    
+    def build_from_adjacency_list(self, adjacency_data, bidirectional=False):
+        """
+        Build graph from adjacency list format
+        {node: [(neighbor, cost), ...]}
+        
+        Args:
+            adjacency_data: Dictionary with node as key and list of (neighbor, cost)
+                            as value, or any iterable of (node, neighbors) pairs
+            bidirectional: If True, also add every edge in the reverse direction
+        """
+        items = adjacency_data.items() if hasattr(adjacency_data, 'items') else adjacency_data
+        self.build_from_edges(
+            ((node, neighbor, cost) for node, neighbors in items for neighbor, cost in neighbors),
+            bidirectional=bidirectional,
+        )
     
     def get_graph(self):
         """Return the graph as a dictionary"""
@@ -51,6 +102,53 @@ class GraphWithCosts:
     def get_neighbors(self, node):
         """Get all neighbors of a node with their costs"""
         return self.graph.get(node, [])
+    
+    def get_reverse_graph(self):
+        """
+        Return the adjacency list with every edge reversed
+        {node: [(predecessor, cost), ...]}
+        
+        Built once and cached until the graph changes. Graphs built with
+        bidirectional edges are their own reverse, so the graph dictionary
+        itself is returned in that case.
+        """
+        if self._reverse_graph is None:
+            reverse = {}
+            for node, neighbors in self.graph.items():
+                for neighbor, cost in neighbors:
+                    reverse.setdefault(neighbor, []).append((node, cost))
+            symmetric = all(
+                set(reverse.get(node, ())) == set(neighbors)
+                for node, neighbors in self.graph.items()
+            ) and all(node in self.graph for node in reverse)
+            self._reverse_graph = self.graph if symmetric else reverse
+        return self._reverse_graph
+    
+    def to_csr(self):
+        """Freeze the graph into a compact, integer-indexed CSRGraph"""
+        return CSRGraph.from_adjacency(self.graph)
+    
+    def save_snapshot(self, path):
+        """
+        Write the graph to a binary, memory-mappable snapshot file
+        
+        Args:
+            path: Destination file path
+        """
+        self.to_csr().save(path)
+    
+    @staticmethod
+    def load_snapshot(path):
+        """
+        Load a snapshot written by save_snapshot() via mmap (no parsing)
+        
+        Args:
+            path: Snapshot file path
+            
+        Returns:
+            CSRGraph: Read-only weighted graph accepted by all search classes
+        """
+        return CSRGraph.load(path)
 
 
 # Example: Building the graph from Figure 2 with costs
@@ -187,6 +285,51 @@ def create_figure2_graph():
     return graph
 
 
+def create_synthetic_graph(rows, cols, max_cost=20, shortcut_ratio=0.1, seed=0, directed=False):
+    """
+    Create a large synthetic road network for benchmarking
+    Cities sit on a rows x cols grid and are connected to their right and
+    lower neighbours, plus a few random diagonal shortcuts
+    
+    Args:
+        rows: Number of grid rows
+        cols: Number of grid columns
+        max_cost: Edge costs are random integers in [1, max_cost]
+        shortcut_ratio: Fraction of cities that get an extra diagonal road
+        seed: Random seed (the same seed always gives the same graph)
+        directed: If True, every road becomes two one-way edges with
+                  independent random costs
+        
+    Returns:
+        GraphWithCosts: Graph with rows * cols cities named "City r-c"
+    """
+    import random
+    rng = random.Random(seed)
+    
+    def name(r, c):
+        return f"City {r}-{c}"
+    
+    edges = []
+    
+    def add_road(a, b):
+        edges.append((a, b, rng.randint(1, max_cost)))
+        if directed:
+            edges.append((b, a, rng.randint(1, max_cost)))
+    
+    for r in range(rows):
+        for c in range(cols):
+            if c + 1 < cols:
+                add_road(name(r, c), name(r, c + 1))
+            if r + 1 < rows:
+                add_road(name(r, c), name(r + 1, c))
+            if r + 1 < rows and c + 1 < cols and rng.random() < shortcut_ratio:
+                add_road(name(r, c), name(r + 1, c + 1))
+    
+    graph = GraphWithCosts()
+    graph.build_from_edges(edges, bidirectional=not directed)
+    return graph
+
+
 if __name__ == "__main__":
     # Test the graph converter
     graph = create_figure2_graph()
@@ -9,20 +9,40 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question2.graph_with_costs import GraphWithCosts
 from question2.uniform_cost_search import UniformCostSearch
+from question2.tour_solver import solve_tour
 
 
 class MultiGoalUniformCostSearch:
     """Implements customized UCS for visiting multiple goal states"""
     
-    def __init__(self, graph):
+    def __init__(self, graph, mode='greedy', time_budget=None):
         """
         Initialize with a graph that has costs
         
         Args:
-            graph: GraphWithCosts object
+            graph: GraphWithCosts object or CSRGraph
+            mode: 'greedy' (always go to the nearest remaining goal),
+                  'exact' (cheapest visiting order via Held-Karp over the
+                  goal distance matrix, practical up to about 20 goals) or
+                  'improve' (greedy order refined by 2-opt / Or-opt moves
+                  for time_budget seconds, for larger goal sets)
+            time_budget: Wall-clock seconds for 'improve' mode (default 0.1);
+                         only valid with mode='improve'
         """
+        if mode not in ('greedy', 'exact', 'improve'):
+            raise ValueError(f"Unknown mode: {mode}. Use 'greedy', 'exact' or 'improve'")
+        if time_budget is not None and mode != 'improve':
+            raise ValueError(f"time_budget only applies to mode='improve', not {mode!r}")
+        if mode == 'improve':
+            time_budget = 0.1 if time_budget is None else time_budget
+            if time_budget <= 0:
+                raise ValueError(f"time_budget must be positive, got {time_budget}")
         self.graph = graph.get_graph()
         self.ucs = UniformCostSearch(graph)
+        self.mode = mode
+        self.time_budget = time_budget
+        self.improvement_trace = []  # (seconds, cost) from the last 'improve' search
+        self.searches = 0  # Dijkstra runs made by the last search()
     
     def search(self, initial_state, goal_states):
         """
@@ -38,29 +58,34 @@ class MultiGoalUniformCostSearch:
         if not goal_states:
             return [initial_state], 0, []
         
+        if self.mode == 'exact':
+            return solve_tour(self.ucs, initial_state, goal_states)
+        if self.mode == 'improve':
+            self.improvement_trace = []
+            return solve_tour(self.ucs, initial_state, goal_states,
+                              time_budget=self.time_budget, trace=self.improvement_trace)
+        
         remaining_goals = set(goal_states)
         current_position = initial_state
         complete_path = [initial_state]
         total_cost = 0
         visited_goals_order = []
+        self.searches = 0
         
         while remaining_goals:
-            # Find the nearest unvisited goal from current position
-            best_goal = None
-            best_cost = float('inf')
-            best_path = None
+            # Find the nearest unvisited goal from current position with one
+            # multi-target Dijkstra (goals come back nearest first)
+            reached = self.ucs.multi_target_search(current_position, remaining_goals,
+                                                   first_only=True)
+            self.searches += 1
             
-            for goal in remaining_goals:
-                path, cost, _ = self.ucs.search(current_position, goal)
-                if path and cost < best_cost:
-                    best_goal = goal
-                    best_cost = cost
-                    best_path = path
+            best_goal = next(iter(reached), None)
             
             if best_goal is None:
                 # Cannot reach any remaining goals from current position
                 # Try going back to initial state
                 path_back, cost_back, _ = self.ucs.search(current_position, initial_state)
+                self.searches += 1
                 if path_back:
                     if len(path_back) > 1:
                         complete_path.extend(path_back[1:])
@@ -71,7 +96,8 @@ class MultiGoalUniformCostSearch:
                     # Cannot reach initial state either - break
                     break
             
-            # Visit the best goal
+            # Visit the best goal, reusing the path from the leg's parent tree
+            best_path, best_cost = reached[best_goal]
             if len(best_path) > 1:
                 complete_path.extend(best_path[1:])
             total_cost += best_cost
@@ -4,11 +4,13 @@ Test cases for Question 2
 
 import sys
 import os
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from question2.graph_with_costs import create_figure2_graph
+from question2.graph_with_costs import GraphWithCosts, create_figure2_graph
 from question2.uniform_cost_search import UniformCostSearch
 from question2.multi_goal_ucs import MultiGoalUniformCostSearch
+from question2.contraction_hierarchies import ContractionHierarchy
 
 
 def test_question2():
@@ -29,6 +31,19 @@ def test_question2():
         print(f"   Sample node '{sample_node}' has {len(neighbors)} neighbors with costs")
         print(f"   Example: {neighbors[0] if neighbors else 'No neighbors'}")
     
+    # Bulk construction from a generator (with every edge repeated) must
+    # give the same adjacency lists
+    streamed = GraphWithCosts()
+    streamed.build_from_edges((
+        (node, neighbor, cost)
+        for node, neighbors in graph_dict.items()
+        for neighbor, cost in neighbors + neighbors
+    ), bidirectional=False)
+    if streamed.get_graph() == graph_dict:
+        print(f"   [OK] Streamed bulk build deduplicates edges")
+    else:
+        print(f"   [FAIL] Streamed bulk build differs from the original graph")
+    
     # Test UCS
     print("\n2.2 Testing Uniform Cost Search (Addis Ababa -> Lalibela):")
     ucs = UniformCostSearch(graph)
@@ -42,6 +57,49 @@ def test_question2():
     else:
         print(f"   [FAIL] UCS: No path found")
     
+    # Test both frontier implementations
+    heap_cost = UniformCostSearch(graph, frontier='heap').search(initial, goal)[1]
+    bucket_cost = UniformCostSearch(graph, frontier='bucket').search(initial, goal)[1]
+    if heap_cost == bucket_cost == cost:
+        print(f"   [OK] Heap and bucket-queue frontiers agree on cost {cost}")
+    else:
+        print(f"   [FAIL] Frontier costs differ: heap {heap_cost}, bucket {bucket_cost}")
+    
+    # Test bidirectional Dijkstra mode
+    bi_path, bi_cost, bi_explored = UniformCostSearch(graph, bidirectional=True).search(initial, goal)
+    if bi_cost == cost:
+        print(f"   [OK] Bidirectional UCS: same cost {bi_cost}, "
+              f"{len(bi_explored)} nodes settled (UCS: {len(explored)})")
+    else:
+        print(f"   [FAIL] Bidirectional UCS: cost {bi_cost}, expected {cost}")
+    
+    # Test UCS on the CSR backend
+    csr_path, csr_cost, _ = UniformCostSearch(graph.to_csr()).search(initial, goal)
+    if csr_cost == cost:
+        print(f"   [OK] UCS on CSR graph: same cost {csr_cost}")
+    else:
+        print(f"   [FAIL] UCS on CSR graph: cost {csr_cost}, expected {cost}")
+    
+    # Test UCS on a memory-mapped snapshot
+    snapshot_path = os.path.join(tempfile.mkdtemp(), "figure2.csr")
+    graph.save_snapshot(snapshot_path)
+    _, snapshot_cost, _ = UniformCostSearch(GraphWithCosts.load_snapshot(snapshot_path)).search(initial, goal)
+    if snapshot_cost == cost:
+        print(f"   [OK] UCS on snapshot graph: same cost {snapshot_cost}")
+    else:
+        print(f"   [FAIL] UCS on snapshot graph: cost {snapshot_cost}, expected {cost}")
+    
+    # Test Contraction Hierarchies queries against UCS for every goal
+    hierarchy = ContractionHierarchy(graph)
+    mismatches = [node for node in graph.get_graph()
+                  if hierarchy.search(initial, node)[1] != ucs.search(initial, node)[1]]
+    ch_path = hierarchy.search(initial, goal)[0]
+    if not mismatches and ch_path[0] == initial and ch_path[-1] == goal:
+        print(f"   [OK] Contraction Hierarchies: same costs as UCS for all "
+              f"{len(graph.get_graph())} goals ({hierarchy.num_shortcuts} shortcuts)")
+    else:
+        print(f"   [FAIL] Contraction Hierarchies: costs differ for {mismatches}")
+    
     # Test Multi-Goal UCS
     print("\n2.3 Testing Multi-Goal Uniform Cost Search:")
     multi_ucs = MultiGoalUniformCostSearch(graph)
@@ -56,6 +114,37 @@ def test_question2():
     else:
         print(f"   [FAIL] Multi-Goal UCS: No path found")
     
+    # One multi-target Dijkstra per leg instead of one UCS run per remaining goal
+    if multi_ucs.searches <= len(goal_states) + 1:
+        print(f"   [OK] {multi_ucs.searches} searches for {len(goal_states)} goals")
+    else:
+        print(f"   [FAIL] {multi_ucs.searches} searches for {len(goal_states)} goals")
+    
+    # Exact mode (Held-Karp) can never be worse than greedy nearest-goal
+    exact_path, exact_cost, exact_order = MultiGoalUniformCostSearch(graph, mode='exact').search(
+        initial, goal_states)
+    if exact_path and exact_cost <= total_cost and len(exact_order) == len(visited_order):
+        print(f"   [OK] Exact Held-Karp order: cost {exact_cost} (greedy: {total_cost})")
+        print(f"   Order: {' -> '.join(exact_order)}")
+    else:
+        print(f"   [FAIL] Exact mode: cost {exact_cost}, greedy {total_cost}")
+    
+    # Anytime 2-opt / Or-opt mode stays between the exact and greedy costs
+    improver = MultiGoalUniformCostSearch(graph, mode='improve', time_budget=0.05)
+    improved_path, improved_cost, _ = improver.search(initial, goal_states)
+    if improved_path and exact_cost <= improved_cost <= total_cost:
+        print(f"   [OK] 2-opt/Or-opt order: cost {improved_cost} "
+              f"({len(improver.improvement_trace) - 1} improvements)")
+    else:
+        print(f"   [FAIL] Improve mode: cost {improved_cost}, greedy {total_cost}")
+    
+    # A time budget only makes sense for the anytime mode
+    try:
+        MultiGoalUniformCostSearch(graph, mode='exact', time_budget=0.05)
+        print("   [FAIL] time_budget accepted with mode='exact'")
+    except ValueError:
+        print("   [OK] time_budget rejected outside mode='improve'")
+    
     print("\n" + "=" * 60)
 
 
@@ -0,0 +1,304 @@
+"""
+Exact multi-goal tours: goal distance matrix plus Held-Karp
+
+The shortest path between every pair of (start, goal_1, ..., goal_k) is
+found with one multi-target Dijkstra per row, giving a (k+1)x(k+1) matrix.
+The visiting order is then the cheapest Hamiltonian path over that matrix,
+solved exactly with the Held-Karp bitmask DP:
+
+    best[mask, j] = min over i in mask - {j} of best[mask - {j}, i] + D[i, j]
+
+where mask is the set of goals already visited and j the goal visited last.
+
+For goal sets too large for Held-Karp, improve_tour() is an anytime local
+search: starting from the greedy nearest-goal order it applies 2-opt and
+Or-opt moves until a wall-clock deadline, recording the cost over time.
+
+Subsets are processed one popcount layer at a time and every layer is a
+handful of numpy operations, so no Python loop runs per subset. Only the
+previous layer's costs are kept, in a dense (subsets-in-layer, k) array,
+and the back-pointers are int8, so k = 20 goals peaks around 130 MB and
+takes a couple of seconds.
+"""
+
+import random
+import time
+
+import numpy as np
+
+# Held-Karp is O(2^k * k^2); beyond this the tables no longer fit in memory
+MAX_EXACT_GOALS = 24
+
+
+def goal_distance_matrix(ucs, nodes):
+    """
+    Shortest-path costs and paths between every pair of nodes
+
+    Args:
+        ucs: UniformCostSearch over the graph
+        nodes: List of distinct node names (start first, then the goals)
+
+    Returns:
+        tuple: (matrix, paths)
+               matrix - float array, matrix[i, j] = cost from nodes[i] to
+                        nodes[j] (inf when unreachable)
+               paths  - {(i, j): path} for every reachable pair
+    """
+    size = len(nodes)
+    matrix = np.full((size, size), np.inf)
+    paths = {}
+    index = {node: i for i, node in enumerate(nodes)}
+    for i, node in enumerate(nodes):
+        for target, (path, cost) in ucs.multi_target_search(node, nodes).items():
+            j = index[target]
+            matrix[i, j] = cost
+            paths[(i, j)] = path
+    return matrix, paths
+
+
+def held_karp(matrix, return_to_start=False):
+    """
+    Cheapest order visiting nodes 1..k once each, starting at node 0
+
+    Args:
+        matrix: (k+1)x(k+1) cost matrix (inf for missing edges)
+        return_to_start: If True, the tour ends back at node 0
+
+    Returns:
+        tuple: (order, cost) with order a list of node indices 1..k, or
+               (None, inf) if no complete order exists
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    k = len(matrix) - 1
+    if k <= 0:
+        return [], 0
+    if k > MAX_EXACT_GOALS:
+        raise ValueError(f"Held-Karp supports at most {MAX_EXACT_GOALS} goals, got {k}")
+
+    goal_costs = matrix[1:, 1:]  # goal i -> goal j
+    num_masks = 1 << k
+    masks = np.arange(num_masks, dtype=np.int32)
+    popcount = np.zeros(num_masks, dtype=np.int8)
+    for bit in range(k):
+        popcount += (masks >> bit) & 1
+    # Subsets grouped by size; position maps a mask to its row in its layer
+    layers = [masks[popcount == size] for size in range(k + 1)]
+    position = np.empty(num_masks, dtype=np.int32)
+    for layer in layers:
+        position[layer] = np.arange(len(layer), dtype=np.int32)
+
+    # Layer 1: visit a single goal straight from the start
+    costs = np.full((k, k), np.inf)
+    costs[np.arange(k), np.arange(k)] = matrix[0, 1:]
+    parents = [np.full((k, k), -1, dtype=np.int8)]
+
+    for size in range(2, k + 1):
+        layer = layers[size]
+        layer_costs = np.full((len(layer), k), np.inf)
+        layer_parents = np.full((len(layer), k), -1, dtype=np.int8)
+        for last in range(k):
+            bit = np.int32(1 << last)
+            rows = np.nonzero(layer & bit)[0]
+            previous = costs[position[layer[rows] ^ bit]]  # (rows, k)
+            # Goals outside the previous subset already hold inf
+            candidates = previous + goal_costs[:, last]
+            best = np.argmin(candidates, axis=1)
+            layer_costs[rows, last] = candidates[np.arange(len(rows)), best]
+            layer_parents[rows, last] = best
+        costs = layer_costs
+        parents.append(layer_parents)
+
+    final = costs[0] + (matrix[1:, 0] if return_to_start else 0)
+    last = int(np.argmin(final))
+    total = final[last]
+    if not np.isfinite(total):
+        return None, np.inf
+
+    # Walk the back-pointers from the full set down to a single goal
+    order = []
+    mask = num_masks - 1
+    for size in range(k, 0, -1):
+        order.append(last + 1)
+        previous = int(parents[size - 1][position[mask], last])
+        mask ^= 1 << last
+        last = previous
+    order.reverse()
+    return order, total.item()
+
+
+def tour_cost(matrix, order, return_to_start=False):
+    """Cost of visiting order (node indices) starting from node 0"""
+    stops = [0] + list(order) + ([0] if return_to_start else [])
+    return float(sum(matrix[source][target] for source, target in zip(stops, stops[1:])))
+
+
+def nearest_neighbor_order(matrix):
+    """Greedy order over the matrix: always visit the nearest remaining node"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    remaining = list(range(1, len(matrix)))
+    order = []
+    current = 0
+    while remaining:
+        current = min(remaining, key=lambda node: matrix[current, node])
+        remaining.remove(current)
+        order.append(current)
+    return order
+
+
+def improve_tour(matrix, order, time_budget=0.1, return_to_start=False, seed=0):
+    """
+    Anytime 2-opt / Or-opt improvement of a visiting order
+
+    Every move is scored in O(1) from the matrix (the edges it removes and
+    adds), and all moves sharing a first position are scored in one numpy
+    expression. 2-opt reverses a stretch of the route, which only keeps
+    the other costs unchanged on symmetric matrices, so it is skipped for
+    directed costs; Or-opt (moving a run of 1-3 goals elsewhere) works
+    either way. At a local optimum the best order is perturbed with a
+    random segment swap and optimized again until the deadline.
+
+    Args:
+        matrix: (k+1)x(k+1) cost matrix with the start at index 0
+        order: Initial visiting order (node indices 1..k)
+        time_budget: Wall-clock seconds to spend
+        return_to_start: If True, the route ends back at node 0
+        seed: Seed for the perturbations
+
+    Returns:
+        tuple: (order, cost, trace) where trace lists (seconds elapsed, cost)
+               each time the best order improved, starting with the input
+    """
+    started = time.perf_counter()
+    deadline = started + time_budget
+    matrix = np.asarray(matrix, dtype=np.float64)
+    k = len(order)
+
+    # Append a fixed end node so the open route has fixed endpoints:
+    # route = [0, goals..., end] and reaching end costs 0 (or the way home)
+    end = k + 1
+    costs = np.full((k + 2, k + 2), np.inf)
+    costs[:k + 1, :k + 1] = matrix
+    costs[:k + 1, end] = matrix[:, 0] if return_to_start else 0.0
+    goal_block = matrix[1:, 1:]
+    symmetric = np.array_equal(goal_block, goal_block.T)
+
+    route = np.array([0] + list(order) + [end])
+    cost = tour_cost(matrix, order, return_to_start)
+    best_route, best_cost = route.copy(), cost
+    trace = [(0.0, cost)]
+    rng = random.Random(seed)
+
+    def two_opt(route):
+        """Apply the best improving reversal for each first position"""
+        gain = 0.0
+        for i in range(1, k):
+            if time.perf_counter() > deadline:
+                break
+            a, b = route[i - 1], route[i]
+            c, d = route[i + 1:k + 1], route[i + 2:k + 2]
+            delta = costs[a, c] + costs[b, d] - costs[a, b] - costs[c, d]
+            delta[np.isnan(delta)] = 0.0  # inf - inf: no information
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                route[i:i + j + 2] = route[i:i + j + 2][::-1].copy()
+                gain += delta[j]
+        return gain
+
+    def or_opt(route):
+        """Move runs of 1-3 goals to their best new position"""
+        gain = 0.0
+        for length in (1, 2, 3):
+            for i in range(1, k - length + 2):
+                if time.perf_counter() > deadline:
+                    return gain
+                a, first, last, b = route[i - 1], route[i], route[i + length - 1], route[i + length]
+                removed = costs[a, first] + costs[last, b] - costs[a, b]
+                # Insert between route[p] and route[p + 1], both outside the run
+                positions = np.r_[0:i - 1, i + length:k + 1]
+                if not len(positions):
+                    continue
+                left, right = route[positions], route[positions + 1]
+                delta = costs[left, first] + costs[last, right] - costs[left, right] - removed
+                delta[np.isnan(delta)] = 0.0
+                best = int(np.argmin(delta))
+                if delta[best] < -1e-9:
+                    p = positions[best]
+                    run = route[i:i + length].copy()
+                    rest = np.concatenate([route[:i], route[i + length:]])
+                    insert_at = p + 1 if p < i else p + 1 - length
+                    route[:] = np.concatenate([rest[:insert_at], run, rest[insert_at:]])
+                    gain += delta[best]
+        return gain
+
+    with np.errstate(invalid='ignore'):
+        while time.perf_counter() < deadline:
+            gain = two_opt(route) if symmetric else 0.0
+            gain += or_opt(route)
+            if gain < 0:
+                cost = tour_cost(matrix, route[1:-1], return_to_start)
+                if cost < best_cost - 1e-9:
+                    best_route, best_cost = route.copy(), cost
+                    trace.append((time.perf_counter() - started, cost))
+                continue
+            if k < 4:
+                break  # Local optimum and too few goals to perturb
+            # Local optimum: swap two adjacent segments of the best order
+            cuts = sorted(rng.sample(range(1, k + 1), 3))
+            route = np.concatenate([best_route[:cuts[0]], best_route[cuts[1]:cuts[2]],
+                                    best_route[cuts[0]:cuts[1]], best_route[cuts[2]:]])
+
+    return [int(node) for node in best_route[1:-1]], best_cost, trace
+
+
+def solve_tour(ucs, initial_state, goal_states, return_to_start=False,
+               time_budget=None, trace=None):
+    """
+    Optimal (or improved) multi-goal route instead of greedy nearest-goal
+
+    Goals that are not reachable from the initial state are left out, as
+    the greedy search also skips them.
+
+    Args:
+        ucs: UniformCostSearch over the graph
+        initial_state: Starting node
+        goal_states: Goal nodes to visit
+        return_to_start: If True, the route ends back at initial_state
+        time_budget: None for the exact Held-Karp order; otherwise seconds
+                     of 2-opt / Or-opt improvement of the greedy order
+        trace: Optional list that receives the (seconds, cost) improvement
+               trace when time_budget is set
+
+    Returns:
+        tuple: (complete_path, total_cost, visited_goals_order), or
+               (None, None, []) if the goals cannot all be chained
+    """
+    goals = [goal for goal in dict.fromkeys(goal_states) if goal != initial_state]
+    reachable = ucs.multi_target_search(initial_state, goals)
+    goals = [goal for goal in goals if goal in reachable]
+    nodes = [initial_state] + goals
+
+    matrix, paths = goal_distance_matrix(ucs, nodes)
+    if time_budget is None:
+        order, total_cost = held_karp(matrix, return_to_start)
+    else:
+        order, total_cost, improvements = improve_tour(
+            matrix, nearest_neighbor_order(matrix), time_budget, return_to_start)
+        if trace is not None:
+            trace.extend(improvements)
+        if not np.isfinite(total_cost):
+            order = None
+    if order is None:
+        return None, None, []
+
+    # Expand the optimal order back into a full city path
+    stops = [0] + order + ([0] if return_to_start else [])
+    complete_path = [initial_state]
+    for source, target in zip(stops, stops[1:]):
+        complete_path.extend(paths[(source, target)][1:])
+
+    visited_goals_order = [nodes[i] for i in order]
+    if initial_state in goal_states:
+        visited_goals_order.insert(0, initial_state)
+    if total_cost == int(total_cost):
+        total_cost = int(total_cost)
+    return complete_path, total_cost, visited_goals_order
@@ -3,24 +3,40 @@ Question 2.2: Uniform Cost Search algorithm
 Assuming "Addis Ababa" as initial state, generate a path to "Lalibela"
 """
 
-import heapq
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question2.graph_with_costs import GraphWithCosts, create_figure2_graph
+from question1.csr_graph import CSRGraph
+from question2.frontier import edge_cost_profile, make_frontier
 
 
 class UniformCostSearch:
     """Implements Uniform Cost Search algorithm"""
     
-    def __init__(self, graph):
+    def __init__(self, graph, bidirectional=False, frontier='auto'):
         """
         Initialize with a graph that has costs
         
         Args:
-            graph: GraphWithCosts object
+            graph: GraphWithCosts object or CSRGraph
+            bidirectional: If True, search() runs bidirectional Dijkstra
+            frontier: Priority queue to use - 'heap', 'bucket' (Dial's bucket
+                      queue) or 'auto' (buckets when all edge costs are small
+                      non-negative integers, heap otherwise)
         """
         self.graph = graph.get_graph()
+        self.is_csr = isinstance(self.graph, CSRGraph)
+        self.bidirectional = bidirectional
+        self.frontier = frontier
+        self._graph_object = graph
+        self._cost_profile = None  # (integral costs, max cost), computed on first search
+    
+    def _new_frontier(self):
+        """Create an empty priority queue of the configured kind"""
+        if self._cost_profile is None:
+            self._cost_profile = edge_cost_profile(self.graph)
+        return make_frontier(self.frontier, self._cost_profile)
     
     def search(self, initial_state, goal_state):
         """
@@ -36,15 +52,23 @@ class UniformCostSearch:
         if initial_state == goal_state:
             return [initial_state], 0, [initial_state]
         
-        # Priority queue: (total_cost, current_node, path)
+        if self.bidirectional:
+            return self.bidirectional_search(initial_state, goal_state)
+        if self.is_csr:
+            return self._search_csr(initial_state, goal_state)
+        
+        # Priority queue of (total_cost, current_node); paths are rebuilt from
+        # parent pointers instead of being carried in every queue entry
         # Using total_cost as priority to ensure we explore lowest cost paths first
-        priority_queue = [(0, initial_state, [initial_state])]
+        priority_queue = self._new_frontier()
+        priority_queue.push(0, initial_state)
         visited = set()  # Track visited nodes (only mark when popped with optimal cost)
         min_cost = {initial_state: 0}  # Track minimum cost to reach each node
+        parents = {initial_state: None}
         nodes_explored = []
         
         while priority_queue:
-            total_cost, current_node, path = heapq.heappop(priority_queue)
+            total_cost, current_node = priority_queue.pop()
             
             # Skip if we've already visited this node (we found optimal path to it)
             # This ensures we only process each node once with its optimal cost
@@ -63,7 +87,7 @@ class UniformCostSearch:
             
             # Check if goal reached - when we pop from queue, we have optimal path
             if current_node == goal_state:
-                return path, total_cost, nodes_explored
+                return self._path_from_parents(parents, current_node), total_cost, nodes_explored
             
             # Explore neighbors
             neighbors = self.graph.get(current_node, [])
@@ -77,12 +101,228 @@ class UniformCostSearch:
                 # This prevents adding duplicate entries with higher costs
                 if neighbor not in min_cost or new_cost < min_cost[neighbor]:
                     min_cost[neighbor] = new_cost
-                    new_path = path + [neighbor]
-                    heapq.heappush(priority_queue, (new_cost, neighbor, new_path))
+                    parents[neighbor] = current_node
+                    priority_queue.push(new_cost, neighbor)
+        
+        # No path found
+        return None, None, nodes_explored
+    
+    def multi_target_search(self, initial_state, goal_states, first_only=False):
+        """
+        One Dijkstra from initial_state towards several goals at once
+
+        The search stops as soon as every goal is settled (or the first one,
+        with first_only), so a single run replaces one search per goal.
+
+        Args:
+            initial_state: Starting node
+            goal_states: Iterable of target nodes
+            first_only: Stop at the nearest goal
+
+        Returns:
+            dict: {goal: (path, cost)} for the goals reached, nearest first
+        """
+        remaining = set(goal_states)
+
+        if self.is_csr:
+            csr = self.graph
+            start = csr.node_id(initial_state)
+            if start is None:
+                return {}
+            targets = {csr.node_id(goal) for goal in remaining} - {None}
+            distances, parents, reached = csr.shortest_path_tree(start, targets, first_only)
+            return {csr.names[goal]: (csr.path_from_parents(parents, goal), distances[goal])
+                    for goal in reached}
+
+        priority_queue = self._new_frontier()
+        priority_queue.push(0, initial_state)
+        visited = set()
+        min_cost = {initial_state: 0}
+        parents = {initial_state: None}
+        reached = {}
+
+        while priority_queue and remaining:
+            total_cost, current_node = priority_queue.pop()
+            if current_node in visited or min_cost[current_node] < total_cost:
+                continue
+            visited.add(current_node)
+
+            if current_node in remaining:
+                remaining.discard(current_node)
+                reached[current_node] = (self._path_from_parents(parents, current_node), total_cost)
+                if first_only:
+                    break
+
+            for neighbor, edge_cost in self.graph.get(current_node, []):
+                if neighbor in visited:
+                    continue
+                new_cost = total_cost + edge_cost
+                if neighbor not in min_cost or new_cost < min_cost[neighbor]:
+                    min_cost[neighbor] = new_cost
+                    parents[neighbor] = current_node
+                    priority_queue.push(new_cost, neighbor)
+
+        return reached
+
+    @staticmethod
+    def _path_from_parents(parents, node):
+        """Rebuild the path ending at node from a parent map"""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return path
+    
+    def _search_csr(self, initial_state, goal_state):
+        """
+        Uniform Cost Search over a CSRGraph using integer ids and parent pointers
+        
+        Same contract as search(); the priority queue holds node ids.
+        """
+        csr = self.graph
+        start = csr.node_id(initial_state)
+        if start is None:
+            return None, None, [initial_state]
+        goal = csr.node_id(goal_state)
+        if goal is None:
+            goal = -1
+        
+        offsets, targets, costs = csr.offsets, csr.targets, csr.cost_array()
+        names = csr.names
+        priority_queue = self._new_frontier()
+        priority_queue.push(0, start)
+        visited = bytearray(csr.num_nodes)
+        min_cost = {start: 0}
+        parents = {start: -1}
+        nodes_explored = []
+        
+        while priority_queue:
+            total_cost, current = priority_queue.pop()
+            
+            if visited[current] or min_cost[current] < total_cost:
+                continue
+            
+            visited[current] = 1
+            nodes_explored.append(names[current])
+            
+            if current == goal:
+                return csr.path_from_parents(parents, goal), total_cost, nodes_explored
+            
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                if visited[neighbor]:
+                    continue
+                
+                new_cost = total_cost + costs[edge]
+                if neighbor not in min_cost or new_cost < min_cost[neighbor]:
+                    min_cost[neighbor] = new_cost
+                    parents[neighbor] = current
+                    priority_queue.push(new_cost, neighbor)
         
         # No path found
         return None, None, nodes_explored
 
+    
+    def bidirectional_search(self, initial_state, goal_state):
+        """
+        Bidirectional Dijkstra - same optimal cost as search()
+        
+        Runs a forward search from the initial state and a backward search
+        (over reversed edges) from the goal, always advancing the side with
+        the smaller tentative cost. mu tracks the best complete path seen
+        where the two searches touch; once the two queue minima add up to
+        at least mu no shorter path can exist. On long queries this settles
+        roughly half the nodes a one-directional search would.
+        
+        Args:
+            initial_state: Starting node
+            goal_state: Target node
+            
+        Returns:
+            tuple: (path, total_cost, nodes_explored) or (None, None, nodes_explored) if no path found
+        """
+        if initial_state == goal_state:
+            return [initial_state], 0, [initial_state]
+        
+        if self.is_csr:
+            csr = self.graph
+            start, goal = csr.node_id(initial_state), csr.node_id(goal_state)
+            if start is None or goal is None:
+                return None, None, [initial_state]
+            path, total_cost, nodes_explored = self._meet_in_the_middle(
+                start, goal, csr.neighbor_items, csr.reverse().neighbor_items
+            )
+            names = csr.names
+            if path is not None:
+                path = [names[node] for node in path]
+            return path, total_cost, [names[node] for node in nodes_explored]
+        
+        empty = []
+        reverse_graph = self._graph_object.get_reverse_graph()
+        return self._meet_in_the_middle(
+            initial_state, goal_state,
+            lambda node: self.graph.get(node, empty),
+            lambda node: reverse_graph.get(node, empty),
+        )
+    
+    def _meet_in_the_middle(self, start, goal, forward, backward):
+        """
+        Bidirectional Dijkstra over neighbor functions yielding (neighbor, cost)
+        """
+        inf = float('inf')
+        min_cost = ({start: 0}, {goal: 0})
+        parents = ({start: None}, {goal: None})
+        queues = (self._new_frontier(), self._new_frontier())
+        queues[0].push(0, start)
+        queues[1].push(0, goal)
+        settled = (set(), set())
+        neighbors = (forward, backward)
+        nodes_explored = []
+        best_cost = inf  # mu: cheapest start -> goal path seen so far
+        meeting_node = None
+        
+        while queues[0] and queues[1]:
+            forward_min, backward_min = queues[0].min_priority(), queues[1].min_priority()
+            if forward_min + backward_min >= best_cost:
+                break
+            
+            side = 0 if forward_min <= backward_min else 1
+            own_cost, other_cost = min_cost[side], min_cost[1 - side]
+            total_cost, current = queues[side].pop()
+            if current in settled[side] or own_cost[current] < total_cost:
+                continue
+            settled[side].add(current)
+            nodes_explored.append(current)
+            
+            for neighbor, edge_cost in neighbors[side](current):
+                new_cost = total_cost + edge_cost
+                if new_cost < own_cost.get(neighbor, inf):
+                    own_cost[neighbor] = new_cost
+                    parents[side][neighbor] = current
+                    queues[side].push(new_cost, neighbor)
+                if neighbor in other_cost:
+                    candidate = own_cost[neighbor] + other_cost[neighbor]
+                    if candidate < best_cost:
+                        best_cost = candidate
+                        meeting_node = neighbor
+        
+        if meeting_node is None:
+            return None, None, nodes_explored
+        
+        # Forward half up to the meeting node, then the backward half
+        path = []
+        node = meeting_node
+        while node is not None:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = parents[1][meeting_node]
+        while node is not None:
+            path.append(node)
+            node = parents[1][node]
+        return path, best_cost, nodes_explored
+
 
 if __name__ == "__main__":
     # Create graph (all edges are bidirectional)
@@ -5,152 +5,48 @@ write a class that uses A* search to generate a path from "Addis Ababa"
 to goal state "Moyale".
 """
 
-import heapq
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question2.graph_with_costs import GraphWithCosts
+from question1.csr_graph import CSRGraph
+from question2.frontier import edge_cost_profile, make_frontier
+from question3.heuristics import ReverseDijkstraHeuristic
 
 
 class AStarSearch:
     """Implements A* search algorithm with heuristic function"""
     
-    def __init__(self, graph, heuristic_func=None):
+    def __init__(self, graph, heuristic_func=None, frontier='auto'):
         """
         Initialize with a graph and optional heuristic function
         
         Args:
-            graph: GraphWithCosts object
+            graph: GraphWithCosts object or CSRGraph
             heuristic_func: Optional function that takes (node, goal) and returns heuristic value.
-                          If None, uses dynamic heuristic based on path costs
+                          If None, uses the exact ReverseDijkstraHeuristic (one reverse
+                          Dijkstra per goal, then O(1) lookups)
+            frontier: Priority queue to use - 'heap', 'bucket' (Dial's bucket
+                      queue) or 'auto' (buckets when all edge costs are small
+                      non-negative integers, heap otherwise). Non-integer f
+                      values from the heuristic spill into the bucket queue's
+                      overflow heap, so any heuristic stays correct
         """
         self.graph = graph.get_graph()
+        self.is_csr = isinstance(self.graph, CSRGraph)
+        self.frontier = frontier
+        self._cost_profile = None  # (integral costs, max cost), computed on first search
         if heuristic_func is None:
-            self.heuristic = self._create_dynamic_heuristic()
+            # Exact distances from one reverse Dijkstra per goal, O(1) per lookup
+            self.heuristic = ReverseDijkstraHeuristic(graph)
         else:
             self.heuristic = heuristic_func
-        self._heuristic_cache = {}  # Cache for computed heuristics
     
-    def _create_dynamic_heuristic(self):
-        """
-        Create a dynamic heuristic function based on graph structure and path costs
-        Uses a simplified approach: estimates based on minimum edge costs and graph structure
-        """
-        def dynamic_heuristic(node, goal):
-            """Calculate heuristic dynamically based on graph structure"""
-            if node == goal:
-                return 0
-            
-            # Check cache first
-            cache_key = (node, goal)
-            if cache_key in self._heuristic_cache:
-                return self._heuristic_cache[cache_key]
-            
-            # Use BFS with cost to estimate minimum distance
-            # This is a simplified version - in practice you might use UCS for better estimates
-            heuristic_value = self._estimate_min_cost(node, goal)
-            
-            # Cache the result
-            self._heuristic_cache[cache_key] = heuristic_value
-            return heuristic_value
-        
-        return dynamic_heuristic
-    
-    def _estimate_min_cost(self, start, goal):
-        """
-        Estimate minimum cost from start to goal using actual path costs
-        Uses UCS (Dijkstra) with early termination for heuristic calculation
-        This provides an admissible heuristic (never overestimates)
-        """
-        if start == goal:
-            return 0
-        
-        # Use UCS to find actual minimum cost path
-        # This gives us the true heuristic value based on path costs
-        import heapq
-        
-        # Priority queue: (cost, node)
-        priority_queue = [(0, start)]
-        visited = set()
-        min_cost = float('inf')
-        
-        # Limit exploration to keep it efficient (heuristic calculation)
-        max_explorations = 50
-        explored = 0
-        
-        while priority_queue and explored < max_explorations:
-            cost, current = heapq.heappop(priority_queue)
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
-            explored += 1
-            
-            if current == goal:
-                min_cost = cost
-                break
-            
-            neighbors = self.graph.get(current, [])
-            for neighbor, edge_cost in neighbors:
-                if neighbor not in visited:
-                    new_cost = cost + edge_cost
-                    heapq.heappush(priority_queue, (new_cost, neighbor))
-        
-        # If we found the goal, return the actual cost
-        if min_cost != float('inf'):
-            return int(min_cost)
-        
-        # If we didn't find goal in limited search, use graph-based estimate
-        # Use minimum edge cost * estimated hops (conservative underestimate)
-        min_edge_cost = self._get_minimum_edge_cost()
-        estimated_hops = self._estimate_hops(start, goal)
-        estimated_cost = min_edge_cost * estimated_hops
-        
-        return int(estimated_cost)
-    
-    def _get_average_edge_cost(self):
-        """Calculate average edge cost in the graph"""
-        total_cost = 0
-        total_edges = 0
-        for node, neighbors in self.graph.items():
-            for _, cost in neighbors:
-                total_cost += cost
-                total_edges += 1
-        return total_cost / total_edges if total_edges > 0 else 1
-    
-    def _get_minimum_edge_cost(self):
-        """Calculate minimum edge cost in the graph"""
-        min_cost = float('inf')
-        for node, neighbors in self.graph.items():
-            for _, cost in neighbors:
-                min_cost = min(min_cost, cost)
-        return min_cost if min_cost != float('inf') else 1
-    
-    def _estimate_hops(self, start, goal):
-        """Estimate number of hops using simple BFS (unweighted)"""
-        from collections import deque
-        
-        if start == goal:
-            return 0
-        
-        queue = deque([(start, 0)])
-        visited = {start}
-        
-        while queue:
-            current, hops = queue.popleft()
-            
-            if current == goal:
-                return hops
-            
-            neighbors = self.graph.get(current, [])
-            for neighbor, _ in neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, hops + 1))
-        
-        # If no path found, return a conservative estimate
-        return 20
+    def _new_frontier(self):
+        """Create an empty priority queue of the configured kind"""
+        if self._cost_profile is None:
+            self._cost_profile = edge_cost_profile(self.graph)
+        return make_frontier(self.frontier, self._cost_profile)
     
     def search(self, initial_state, goal_state):
         """
@@ -166,19 +62,23 @@ class AStarSearch:
         if initial_state == goal_state:
             return [initial_state], 0, [initial_state]
         
+        if self.is_csr:
+            return self._search_csr(initial_state, goal_state)
+        
         # g_score: cost from start to node
         # f_score: g_score + heuristic (estimated total cost)
         g_score = {initial_state: 0}
         f_score = {initial_state: self.heuristic(initial_state, goal_state)}
         
-        # Priority queue: (f_score, g_score, current_node, path)
-        priority_queue = [(f_score[initial_state], 0, initial_state, [initial_state])]
+        # Priority queue: f_score -> (g_score, current_node)
+        priority_queue = self._new_frontier()
+        priority_queue.push(f_score[initial_state], (0, initial_state))
         visited = set()
         nodes_explored = []
         came_from = {initial_state: None}  # Track path reconstruction
         
         while priority_queue:
-            current_f, current_g, current_node, path = heapq.heappop(priority_queue)
+            current_f, (current_g, current_node) = priority_queue.pop()
             
             # Skip if we've already found a better path to this node
             if current_node in visited:
@@ -212,7 +112,70 @@ class AStarSearch:
                     g_score[neighbor] = tentative_g
                     h_score = self.heuristic(neighbor, goal_state)
                     f_score[neighbor] = tentative_g + h_score
-                    heapq.heappush(priority_queue, (f_score[neighbor], tentative_g, neighbor, []))
+                    priority_queue.push(f_score[neighbor], (tentative_g, neighbor))
+        
+        # No path found
+        return None, None, nodes_explored
+    
+    def _search_csr(self, initial_state, goal_state):
+        """
+        A* over a CSRGraph using integer ids; the heuristic is still called
+        with node names so existing heuristic functions work unchanged
+        """
+        csr = self.graph
+        start = csr.node_id(initial_state)
+        if start is None:
+            return None, None, [initial_state]
+        goal = csr.node_id(goal_state)
+        if goal is None:
+            goal = -1
+        
+        offsets, targets, costs = csr.offsets, csr.targets, csr.cost_array()
+        names = csr.names
+        heuristic = self.heuristic
+        
+        # Heuristic providers built on this same graph (reverse Dijkstra,
+        # landmarks) expose a per-goal table keyed by node id; read it
+        # directly instead of going through node names
+        table = None
+        if hasattr(heuristic, 'goal_table') and getattr(heuristic, 'csr', None) is csr and goal != -1:
+            table = heuristic.goal_table(goal)
+        
+        g_score = {start: 0}
+        came_from = {start: -1}
+        priority_queue = self._new_frontier()
+        priority_queue.push(heuristic(initial_state, goal_state), (0, start))
+        visited = bytearray(csr.num_nodes)
+        nodes_explored = []
+        
+        while priority_queue:
+            current_f, (current_g, current) = priority_queue.pop()
+            
+            if visited[current]:
+                continue
+            
+            visited[current] = 1
+            nodes_explored.append(names[current])
+            
+            if current == goal:
+                return csr.path_from_parents(came_from, goal), g_score[goal], nodes_explored
+            
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                if visited[neighbor]:
+                    continue
+                
+                tentative_g = g_score[current] + costs[edge]
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                    if table is not None:
+                        h = table[neighbor]
+                        if h < 0:
+                            continue  # Goal unreachable from neighbor
+                    else:
+                        h = heuristic(names[neighbor], goal_state)
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    priority_queue.push(tentative_g + h, (tentative_g, neighbor))
         
         # No path found
         return None, None, nodes_explored
@@ -286,8 +249,8 @@ if __name__ == "__main__":
     # Create graph (using Figure 2 structure, but with heuristics from Figure 3)
     graph = create_figure2_graph()
     
-    # Option 1: Use dynamic heuristic (based on path costs)
-    print("Using dynamic heuristic based on path costs...")
+    # Option 1: Use exact heuristic (one reverse Dijkstra per goal)
+    print("Using exact reverse-Dijkstra heuristic...")
     astar_dynamic = AStarSearch(graph, heuristic_func=None)
     
     # Option 2: Use fixed heuristic from Figure 3 (commented out, but available)
@@ -0,0 +1,61 @@
+"""
+Benchmark: A* heuristics on synthetic road networks
+Compares nodes explored and query time for the zero heuristic (plain
+Dijkstra), landmark (ALT) lower bounds with both selection strategies, and
+the exact reverse-Dijkstra heuristic, and checks they agree on costs
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import create_synthetic_graph
+from question3.astar_search import AStarSearch
+from question3.heuristics import ReverseDijkstraHeuristic
+from question3.landmarks import LandmarkHeuristic
+
+
+def run_queries(astar, queries):
+    """Return (costs, nodes explored per query, seconds per query)"""
+    costs = []
+    explored = 0
+    start = time.perf_counter()
+    for initial, goal in queries:
+        _, cost, nodes = astar.search(initial, goal)
+        costs.append(cost)
+        explored += len(nodes)
+    return costs, explored / len(queries), (time.perf_counter() - start) / len(queries)
+
+
+def run_benchmark(size=150, num_landmarks=8, num_queries=30, seed=0):
+    print("=" * 60)
+    print("A* heuristic benchmark: zero vs ALT vs exact")
+    print("=" * 60)
+
+    for directed in (False, True):
+        csr = create_synthetic_graph(size, size, seed=seed, directed=directed).to_csr()
+        rng = random.Random(seed)
+        queries = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(num_queries)]
+        kind = "directed" if directed else "undirected"
+        print(f"\n{size}x{size} {kind} grid, CSR graph ({num_queries} queries)")
+
+        heuristics = [("zero", lambda node, goal: 0, 0.0)]
+        for selection in ('farthest', 'avoid'):
+            start = time.perf_counter()
+            landmarks = LandmarkHeuristic(csr, num_landmarks=num_landmarks, selection=selection)
+            heuristics.append((f"ALT {selection}", landmarks, time.perf_counter() - start))
+        heuristics.append(("exact", ReverseDijkstraHeuristic(csr), 0.0))
+
+        reference = None
+        for name, heuristic, preprocessing in heuristics:
+            costs, explored, seconds = run_queries(AStarSearch(csr, heuristic), queries)
+            if reference is None:
+                reference = costs
+            assert costs == reference, f"{name} heuristic returned a non-optimal cost"
+            print(f"  {name:13s} {explored:10.1f} explored/query  {seconds * 1e3:8.2f} ms/query"
+                  f"  (preprocessing {preprocessing:.2f} s)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,62 @@
+"""
+Benchmark: multi-goal A* over (city, goal mask) vs Held-Karp
+Goals are placed either in a few tight clusters or uniformly at random on
+a synthetic road network; both solvers must return the same optimal cost
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.graph_with_costs import create_synthetic_graph
+from question2.multi_goal_ucs import MultiGoalUniformCostSearch
+from question3.multi_goal_astar import MultiGoalAStarSearch
+
+
+def clustered_goals(rng, size, num_goals, num_clusters=2, radius=2):
+    """Goals drawn from a few small square neighbourhoods"""
+    centers = [(rng.randrange(radius, size - radius), rng.randrange(radius, size - radius))
+               for _ in range(num_clusters)]
+    goals = set()
+    while len(goals) < num_goals:
+        row, col = rng.choice(centers)
+        goals.add(f"City {row + rng.randint(-radius, radius)}-{col + rng.randint(-radius, radius)}")
+    return sorted(goals)
+
+
+def run_benchmark(size=60, goal_counts=(8, 14, 20), seed=0):
+    print("=" * 60)
+    print("Multi-goal benchmark: product-space A* vs Held-Karp")
+    print("=" * 60)
+
+    graph = create_synthetic_graph(size, size, seed=seed)
+    names = sorted(graph.get_graph())
+    rng = random.Random(seed)
+    initial = "City 0-0"
+
+    for layout in ("clustered", "uniform"):
+        for num_goals in goal_counts:
+            if layout == "clustered":
+                goals = clustered_goals(rng, size, num_goals)
+            else:
+                goals = rng.sample(names, num_goals)
+
+            start = time.perf_counter()
+            _, exact_cost, _ = MultiGoalUniformCostSearch(graph, mode='exact').search(initial, goals)
+            exact_seconds = time.perf_counter() - start
+
+            astar = MultiGoalAStarSearch(graph)
+            start = time.perf_counter()
+            _, astar_cost, _ = astar.search(initial, goals)
+            astar_seconds = time.perf_counter() - start
+            assert astar_cost == exact_cost, "solvers disagree on the optimal cost"
+
+            print(f"\n{layout} goals, k={num_goals}: optimal cost {exact_cost}")
+            print(f"  Held-Karp      {exact_seconds * 1e3:9.1f} ms")
+            print(f"  A* (MST)       {astar_seconds * 1e3:9.1f} ms  "
+                  f"{astar.states_expanded} states expanded, {len(astar.mst_cache)} MSTs memoized")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -3,6 +3,12 @@ Heuristic values for A* search based on the provided path data
 Heuristic represents estimated cost from each node to goal (Moyale)
 """
 
+import sys
+import os
+from collections import OrderedDict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.csr_graph import CSRGraph
+
 # Heuristic values (h) from Figure 3
 # These are the exact heuristic values provided for each city to goal (Moyale)
 
@@ -102,10 +108,20 @@ HEURISTIC_TO_MOYALE = {
     "Kilbet Rasu": 50,  # Close to Fanti Rasu (49)
 }
 
-def create_heuristic_function():
+def create_heuristic_function(graph=None, num_landmarks=8):
     """
     Create a heuristic function that returns estimated cost to goal (Moyale)
+    
+    Args:
+        graph: Optional graph; when given, goals other than Moyale use
+               landmark (ALT) lower bounds instead of a constant
+        num_landmarks: Number of landmarks to preprocess when graph is given
     """
+    landmarks = None
+    if graph is not None:
+        from question3.landmarks import LandmarkHeuristic
+        landmarks = LandmarkHeuristic(graph, num_landmarks=num_landmarks)
+    
     def heuristic(node, goal):
         """Return heuristic value from node to goal"""
         if node == goal:
@@ -115,9 +131,70 @@ def create_heuristic_function():
         if goal == "Moyale":
             return HEURISTIC_TO_MOYALE.get(node, 50)  # Default to 50 if not found
         
-        # For other goals, use a simple approximation
+        # For other goals, use landmark lower bounds when a graph was given
+        if landmarks is not None:
+            return landmarks(node, goal)
+        
+        # Otherwise a simple approximation
         # In practice, you'd have heuristic tables for each goal
         return 30  # Default heuristic
     
     return heuristic
 
+
+def _as_csr(graph):
+    """CSRGraph for a GraphWithCosts, GraphConverter, adjacency dict or CSRGraph"""
+    if isinstance(graph, CSRGraph):
+        return graph
+    if hasattr(graph, 'to_csr'):
+        return graph.to_csr()
+    return CSRGraph.from_adjacency(graph)
+
+
+class ReverseDijkstraHeuristic:
+    """
+    Exact heuristic: h(node, goal) is the true shortest-path cost to goal
+    
+    The first lookup for a goal runs a single Dijkstra from the goal over the
+    reversed edges and keeps the resulting distance table (an array keyed by
+    node id). Every later h(node, goal) for that goal is an O(1) array read.
+    Tables are kept for the most recently used goals only, so memory stays
+    bounded at max_goals * num_nodes entries.
+    """
+    
+    def __init__(self, graph, max_goals=16):
+        """
+        Args:
+            graph: GraphWithCosts, CSRGraph or weighted adjacency dictionary
+            max_goals: Number of goal distance tables kept (LRU)
+        """
+        self.csr = _as_csr(graph)
+        self.max_goals = max_goals
+        self._tables = OrderedDict()  # goal id -> distance table
+        self.searches = 0  # Reverse Dijkstra runs so far
+    
+    def goal_table(self, goal_id):
+        """
+        Distances from every node id to goal_id (-1 where the goal is unreachable)
+        """
+        table = self._tables.get(goal_id)
+        if table is not None:
+            self._tables.move_to_end(goal_id)
+            return table
+        
+        table, _, _ = self.csr.reverse().shortest_path_tree(goal_id)
+        self.searches += 1
+        self._tables[goal_id] = table
+        if len(self._tables) > self.max_goals:
+            self._tables.popitem(last=False)
+        return table
+    
+    def __call__(self, node, goal):
+        """Return the exact remaining cost from node to goal (inf if unreachable)"""
+        if node == goal:
+            return 0
+        node_id, goal_id = self.csr.node_id(node), self.csr.node_id(goal)
+        if node_id is None or goal_id is None:
+            return float('inf')
+        distance = self.goal_table(goal_id)[node_id]
+        return distance if distance >= 0 else float('inf')
@@ -0,0 +1,271 @@
+"""
+Landmark (ALT) heuristic for A* search
+
+Preprocessing picks k landmark nodes and stores, for every node v, the
+shortest-path costs d(L, v) and d(v, L) to and from each landmark L. By the
+triangle inequality both
+
+    d(L, t) - d(L, v)    and    d(v, L) - d(t, L)
+
+are lower bounds on d(v, t), so their maximum over all landmarks is an
+admissible (and consistent) heuristic for any goal t - not only the goal a
+hand-written table was made for.
+
+The distance vectors are numpy arrays of shape (k, num_nodes), so the bounds
+for every node towards one goal come from a single vectorized expression.
+"""
+
+import sys
+import os
+import hashlib
+import random
+from collections import OrderedDict
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question3.heuristics import _as_csr
+
+
+def _names_digest(csr):
+    """SHA-256 of the node names in id order: identifies the graph's id layout"""
+    digest = hashlib.sha256()
+    for node_id in range(csr.num_nodes):
+        digest.update(csr.names[node_id].encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def _distance_vector(distances):
+    """Float vector from a shortest_path_tree() distance array (-1 -> inf)"""
+    vector = np.asarray(distances, dtype=np.float64)
+    vector[vector < 0] = np.inf
+    return vector
+
+
+class LandmarkHeuristic:
+    """
+    ALT heuristic: triangle-inequality lower bounds from precomputed landmarks
+
+    Calling the object as h(node, goal) works with node names like any other
+    heuristic function. goal_table(goal_id) returns the bound for every node
+    id at once (cached for the most recently used goals), which the CSR path
+    of AStarSearch reads directly.
+    """
+
+    def __init__(self, graph, num_landmarks=8, selection='farthest', seed=0,
+                 max_goals=16, landmarks=None):
+        """
+        Args:
+            graph: GraphWithCosts, CSRGraph or weighted adjacency dictionary
+            num_landmarks: Number of landmarks k
+            selection: 'farthest' (each new landmark maximizes its distance to
+                       the ones already chosen) or 'avoid' (grows the landmark
+                       set into the regions the current bounds cover worst)
+            seed: Seed for the random root node used by both selections
+            max_goals: Number of per-goal bound tables kept (LRU)
+            landmarks: Optional list of node names to use instead of selecting
+        """
+        self.csr = _as_csr(graph)
+        self.max_goals = max_goals
+        self._tables = OrderedDict()  # goal id -> bound table
+        self._integral = self.csr.costs is None or np.asarray(self.csr.costs).dtype.kind in 'iu'
+
+        num_nodes = self.csr.num_nodes
+        self.landmarks = []  # landmark node ids
+        self.forward = np.empty((0, num_nodes))   # forward[i, v] = d(L_i, v)
+        self.backward = np.empty((0, num_nodes))  # backward[i, v] = d(v, L_i)
+
+        if landmarks is not None:
+            for name in landmarks:
+                node_id = self.csr.node_id(name)
+                if node_id is None:
+                    raise ValueError(f"Unknown landmark: {name}")
+                self._add_landmark(node_id)
+        elif num_nodes:
+            if selection == 'farthest':
+                self._select_farthest(num_landmarks, random.Random(seed))
+            elif selection == 'avoid':
+                self._select_avoid(num_landmarks, random.Random(seed))
+            else:
+                raise ValueError(f"Unknown selection: {selection}. Use 'farthest' or 'avoid'")
+
+    def _add_landmark(self, node_id):
+        """Run the forward and backward searches from a new landmark"""
+        forward, _, _ = self.csr.shortest_path_tree(node_id)
+        backward, _, _ = self.csr.reverse().shortest_path_tree(node_id)
+        self.landmarks.append(node_id)
+        self.forward = np.vstack([self.forward, _distance_vector(forward)])
+        self.backward = np.vstack([self.backward, _distance_vector(backward)])
+
+    def _select_farthest(self, num_landmarks, rng):
+        """
+        Farthest-point selection: start from the node farthest from a random
+        root, then repeatedly add the node whose round-trip distance to its
+        nearest landmark is largest
+        """
+        root = rng.randrange(self.csr.num_nodes)
+        forward, _, _ = self.csr.shortest_path_tree(root)
+        reach = _distance_vector(forward)
+        candidate = int(np.argmax(np.where(np.isinf(reach), -1, reach)))
+        closest = np.full(self.csr.num_nodes, np.inf)
+
+        while len(self.landmarks) < min(num_landmarks, self.csr.num_nodes):
+            self._add_landmark(candidate)
+            closest = np.fmin(closest, self.forward[-1] + self.backward[-1])
+            closest[self.landmarks] = -1
+            # Nodes no landmark reaches (inf) are the farthest of all
+            candidate = int(np.argmax(closest))
+            if closest[candidate] < 0:
+                break
+
+    def _select_avoid(self, num_landmarks, rng):
+        """
+        Avoid selection (Goldberg and Harrelson): grow a shortest-path tree
+        from a random root, weight every node by how far its current lower
+        bound falls short of the true distance, and walk into the heaviest
+        subtree that holds no landmark yet; its leaf becomes the next landmark
+        """
+        num_nodes = self.csr.num_nodes
+        target = min(num_landmarks, num_nodes)
+        # A root that reaches only landmarks adds nothing; retry a bounded
+        # number of times so small or poorly connected graphs still finish
+        for _ in range(4 * target):
+            if len(self.landmarks) >= target:
+                break
+            root = rng.randrange(num_nodes)
+            distances, parents, _ = self.csr.shortest_path_tree(root)
+            distance = _distance_vector(distances)
+            bound = self.lower_bounds_from(root) if self.landmarks else np.zeros(num_nodes)
+            weight = np.subtract(distance, bound, out=np.zeros(num_nodes),
+                                 where=np.isfinite(distance) & np.isfinite(bound))
+
+            children = [[] for _ in range(num_nodes)]
+            for node in range(num_nodes):
+                parent = parents[node]
+                if parent != -1:
+                    children[parent].append(node)
+
+            # Depth-first order from the root, then subtree sizes bottom-up;
+            # subtrees that already contain a landmark get size 0
+            order = [root]
+            for node in order:
+                order.extend(children[node])
+            size = weight.copy()
+            has_landmark = np.zeros(num_nodes, dtype=bool)
+            has_landmark[self.landmarks] = True
+            for node in reversed(order):
+                for child in children[node]:
+                    has_landmark[node] |= has_landmark[child]
+                    size[node] += size[child]
+            size[has_landmark] = 0.0
+
+            node = root
+            while children[node]:
+                best = max(children[node], key=size.__getitem__)
+                if size[best] <= 0:
+                    break
+                node = best
+            if size[node] <= 0:
+                # Every subtree already holds a landmark - take the farthest free node
+                free = np.where(np.isinf(distance), -1.0, distance)
+                free[self.landmarks] = -1.0
+                node = int(np.argmax(free))
+                if free[node] < 0:
+                    continue
+            self._add_landmark(node)
+
+    def lower_bounds_from(self, source_id):
+        """Lower bounds on d(source, v) for every node v (vectorized)"""
+        with np.errstate(invalid='ignore'):
+            return self._bounds(self.forward - self.forward[:, source_id:source_id + 1],
+                                self.backward[:, source_id:source_id + 1] - self.backward)
+
+    def lower_bounds_to(self, goal_id):
+        """Lower bounds on d(v, goal) for every node v (vectorized)"""
+        with np.errstate(invalid='ignore'):
+            return self._bounds(self.forward[:, goal_id:goal_id + 1] - self.forward,
+                                self.backward - self.backward[:, goal_id:goal_id + 1])
+
+    @staticmethod
+    def _bounds(from_forward, from_backward):
+        """
+        Maximum over landmarks and both triangle inequalities, clamped at 0
+
+        inf - inf (a landmark that sees neither node) is NaN and carries no
+        information, so fmax skips it; a finite - inf term is -inf and loses
+        to any real bound. inf means the goal is provably unreachable.
+        """
+        bound = np.fmax(np.fmax.reduce(from_forward, axis=0),
+                        np.fmax.reduce(from_backward, axis=0))
+        bound = np.nan_to_num(bound, nan=0.0, posinf=np.inf)
+        return np.maximum(bound, 0.0)
+
+    def goal_table(self, goal_id):
+        """
+        Lower bound from every node id to goal_id (-1 where the goal is
+        provably unreachable), as a list for fast scalar reads
+        """
+        table = self._tables.get(goal_id)
+        if table is not None:
+            self._tables.move_to_end(goal_id)
+            return table
+
+        bound = self.lower_bounds_to(goal_id) if self.landmarks else np.zeros(self.csr.num_nodes)
+        bound[np.isinf(bound)] = -1
+        table = bound.astype(np.int64 if self._integral else np.float64).tolist()
+        self._tables[goal_id] = table
+        if len(self._tables) > self.max_goals:
+            self._tables.popitem(last=False)
+        return table
+
+    def __call__(self, node, goal):
+        """Return an admissible estimate of the cost from node to goal"""
+        if node == goal:
+            return 0
+        node_id, goal_id = self.csr.node_id(node), self.csr.node_id(goal)
+        if node_id is None or goal_id is None:
+            return 0  # No information - zero is always admissible
+        bound = self.goal_table(goal_id)[node_id]
+        return bound if bound >= 0 else float('inf')
+
+    def save(self, path):
+        """
+        Write the landmark table to a .npz file
+
+        Args:
+            path: Output file path
+        """
+        names = np.array([self.csr.names[node] for node in self.landmarks], dtype=str)
+        np.savez(path, landmarks=names, forward=self.forward, backward=self.backward,
+                 num_nodes=np.int64(self.csr.num_nodes), names_digest=_names_digest(self.csr))
+
+    @classmethod
+    def load(cls, path, graph, max_goals=16):
+        """
+        Read a landmark table written by save() for the same graph
+
+        The table is indexed by node id, so the graph must have the same
+        nodes in the same id order; a digest of the names checks that.
+
+        Args:
+            path: File written by save()
+            graph: The graph the table was built for
+            max_goals: Number of per-goal bound tables kept (LRU)
+
+        Returns:
+            LandmarkHeuristic: Ready to use without rerunning any search
+        """
+        with np.load(path) as data:
+            heuristic = cls(graph, landmarks=[], max_goals=max_goals)
+            if int(data['num_nodes']) != heuristic.csr.num_nodes:
+                raise ValueError("Landmark table was built for a different graph")
+            if 'names_digest' not in data or str(data['names_digest']) != _names_digest(heuristic.csr):
+                raise ValueError("Landmark table was built for a different graph "
+                                 "(node names or their id order differ)")
+            landmark_ids = [heuristic.csr.node_id(str(name)) for name in data['landmarks']]
+            if None in landmark_ids:
+                raise ValueError("Landmark table was built for a different graph")
+            heuristic.landmarks = landmark_ids
+            heuristic.forward = data['forward']
+            heuristic.backward = data['backward']
+        return heuristic
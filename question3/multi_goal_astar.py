@@ -0,0 +1,185 @@
+"""
+Multi-goal A* over the product state space (city, visited-goal mask)
+
+Instead of chaining independent single-goal legs, A* searches states
+(current city, set of goals visited so far) directly and stops at the first
+state whose mask holds every goal, which gives an optimal multi-goal path.
+Successors are generated lazily from the city graph, so the product graph
+(num_cities * 2^k states) is never built.
+
+Heuristic for a state with unvisited goals U:
+
+    h(city, U) = MST(U) + min over u in U of d(city, u)
+
+Any route from city through all of U first reaches some goal in U (at least
+the nearest-goal term) and then connects the rest, which spans U (at least
+the minimum spanning tree over goal-to-goal distances). The bound is
+admissible and consistent, and the MST only depends on the mask, so it is
+memoized per mask.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question2.frontier import edge_cost_profile, make_frontier
+from question3.heuristics import ReverseDijkstraHeuristic
+
+
+class MultiGoalAStarSearch:
+    """A* over (city, visited-goal bitmask) with an MST heuristic"""
+
+    def __init__(self, graph, frontier='auto'):
+        """
+        Initialize with a graph that has costs
+
+        Args:
+            graph: GraphWithCosts object or CSRGraph
+            frontier: Priority queue to use - 'heap', 'bucket' or 'auto'
+        """
+        self.graph = graph.get_graph()
+        self.frontier = frontier
+        # One reverse Dijkstra per goal gives d(city, goal) for every city
+        self.distances = ReverseDijkstraHeuristic(graph, max_goals=64)
+        self._cost_profile = None
+        self.states_expanded = 0  # Product states expanded by the last search()
+        self.mst_cache = {}  # mask of unvisited goals -> MST cost (last search)
+
+    def search(self, initial_state, goal_states):
+        """
+        Optimal path from initial_state visiting every goal
+
+        Goals that are not reachable from the initial state are left out, as
+        MultiGoalUniformCostSearch also skips them.
+
+        Args:
+            initial_state: Starting node
+            goal_states: List of goal nodes to visit
+
+        Returns:
+            tuple: (complete_path, total_cost, visited_goals_order), or
+                   (None, None, []) if the goals cannot all be visited
+        """
+        csr = self.distances.csr
+        start_id = csr.node_id(initial_state)
+        self.states_expanded = 0
+        self.mst_cache = {}
+        if start_id is None:
+            return None, None, []
+
+        # Distance tables towards each reachable goal, indexed by node id
+        goals, tables = [], []
+        for goal in dict.fromkeys(goal_states):
+            goal_id = csr.node_id(goal)
+            if goal_id is None:
+                continue
+            table = self.distances.goal_table(goal_id)
+            if table[start_id] >= 0:
+                goals.append(goal)
+                tables.append(table)
+        goal_bits = {goal: 1 << i for i, goal in enumerate(goals)}
+        full_mask = (1 << len(goals)) - 1
+
+        # Undirected goal-to-goal bounds for the MST: min(d(a, b), d(b, a))
+        inf = float('inf')
+        goal_ids = [csr.node_id(goal) for goal in goals]
+        link = [[inf] * len(goals) for _ in goals]
+        for i in range(len(goals)):
+            for j in range(len(goals)):
+                forward, backward = tables[j][goal_ids[i]], tables[i][goal_ids[j]]
+                costs = [cost for cost in (forward, backward) if cost >= 0]
+                if i != j and costs:
+                    link[i][j] = min(costs)
+
+        def mst(mask):
+            """Prim's MST over the goals in mask (memoized)"""
+            cost = self.mst_cache.get(mask)
+            if cost is not None:
+                return cost
+            members = [i for i in range(len(goals)) if mask >> i & 1]
+            cost = 0
+            if members:
+                best = {i: link[members[0]][i] for i in members[1:]}
+                while best:
+                    nearest = min(best, key=best.get)
+                    cost += best.pop(nearest)
+                    for i in best:
+                        if link[nearest][i] < best[i]:
+                            best[i] = link[nearest][i]
+            self.mst_cache[mask] = cost
+            return cost
+
+        def heuristic(city, mask):
+            """MST of the unvisited goals plus the nearest of them (inf if stuck)"""
+            unvisited = full_mask & ~mask
+            if not unvisited:
+                return 0
+            city_id = csr.node_id(city)
+            nearest = inf
+            for i in range(len(goals)):
+                if unvisited >> i & 1:
+                    distance = tables[i][city_id]
+                    if distance < 0:
+                        return inf  # This goal can no longer be reached
+                    if distance < nearest:
+                        nearest = distance
+            return nearest + mst(unvisited)
+
+        if self._cost_profile is None:
+            self._cost_profile = edge_cost_profile(self.graph)
+        start = (initial_state, goal_bits.get(initial_state, 0))
+        g_score = {start: 0}
+        came_from = {start: None}
+        priority_queue = make_frontier(self.frontier, self._cost_profile)
+        priority_queue.push(heuristic(*start), (0, start))
+        closed = set()
+
+        while priority_queue:
+            _, (current_g, state) = priority_queue.pop()
+            if state in closed or current_g > g_score[state]:
+                continue
+            closed.add(state)
+            self.states_expanded += 1
+
+            city, mask = state
+            if mask == full_mask:
+                return self._reconstruct(came_from, state), current_g, \
+                    self._goal_order(came_from, state, goal_bits)
+
+            # Successors are generated lazily from the city graph
+            for neighbor, edge_cost in self.graph.get(city, []):
+                next_state = (neighbor, mask | goal_bits.get(neighbor, 0))
+                if next_state in closed:
+                    continue
+                tentative_g = current_g + edge_cost
+                if tentative_g < g_score.get(next_state, inf):
+                    h = heuristic(*next_state)
+                    if h == inf:
+                        continue  # Some unvisited goal is unreachable from here
+                    g_score[next_state] = tentative_g
+                    came_from[next_state] = state
+                    priority_queue.push(tentative_g + h, (tentative_g, next_state))
+
+        return None, None, []
+
+    @staticmethod
+    def _reconstruct(came_from, state):
+        """City path ending at state"""
+        path = []
+        while state is not None:
+            path.append(state[0])
+            state = came_from[state]
+        path.reverse()
+        return path
+
+    @staticmethod
+    def _goal_order(came_from, state, goal_bits):
+        """Goals in the order the path first reaches them"""
+        order = []
+        while state is not None:
+            parent = came_from[state]
+            if parent is None or parent[1] != state[1]:
+                if state[0] in goal_bits:
+                    order.append(state[0])
+            state = parent
+        order.reverse()
+        return order
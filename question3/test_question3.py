@@ -4,10 +4,15 @@ Test cases for Question 3
 
 import sys
 import os
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from question3.astar_search import AStarSearch, create_heuristic_function
-from question2.graph_with_costs import create_figure2_graph
+from question2.graph_with_costs import GraphWithCosts, create_figure2_graph
+from question2.uniform_cost_search import UniformCostSearch
+from question3.landmarks import LandmarkHeuristic
+from question3.multi_goal_astar import MultiGoalAStarSearch
+from question2.multi_goal_ucs import MultiGoalUniformCostSearch
 
 
 def test_question3():
@@ -19,9 +24,9 @@ def test_question3():
     # Create graph
     graph = create_figure2_graph()
     
-    # Option 1: Use dynamic heuristic (works for ANY goal/destination)
-    # This calculates heuristics based on actual path costs dynamically
-    print("Using dynamic heuristic (works for any destination)...")
+    # Option 1: Use the exact heuristic (works for ANY goal/destination)
+    # One reverse Dijkstra per goal gives the true remaining cost of every node
+    print("Using exact reverse-Dijkstra heuristic (works for any destination)...")
     astar = AStarSearch(graph, heuristic_func=None)
     
     # Option 2: Use fixed heuristic from Figure 3 (only for specific goals like Moyale)
@@ -40,6 +45,68 @@ def test_question3():
     else:
         print(f"   [FAIL] A*: No path found")
     
+    print("\n4. Testing exact heuristic against Uniform Cost Search:")
+    ucs = UniformCostSearch(graph)
+    goals = ["Moyale", "Lalibela", "Gondar", "Hawassa"]
+    mismatches = [goal for goal in goals
+                  if astar.search(initial, goal)[1] != ucs.search(initial, goal)[1]]
+    if not mismatches:
+        print(f"   [OK] Same optimal costs as UCS for {len(goals)} goals "
+              f"({astar.heuristic.searches} reverse Dijkstra runs)")
+    else:
+        print(f"   [FAIL] Costs differ from UCS for: {', '.join(mismatches)}")
+    
+    print("\n5. Testing landmark (ALT) heuristic:")
+    landmarks = LandmarkHeuristic(graph, num_landmarks=4)
+    snapshot = os.path.join(tempfile.mkdtemp(), "landmarks.npz")
+    landmarks.save(snapshot)
+    landmarks = LandmarkHeuristic.load(snapshot, graph)
+    exact = astar.heuristic
+    overestimates = [node for node in graph.get_graph()
+                     if landmarks(node, "Lalibela") > exact(node, "Lalibela")]
+    alt_cost = AStarSearch(graph, landmarks).search(initial, "Lalibela")[1]
+    if not overestimates and alt_cost == ucs.search(initial, "Lalibela")[1]:
+        print(f"   [OK] Admissible after save/load, optimal cost {alt_cost}")
+    else:
+        print(f"   [FAIL] ALT overestimates at {overestimates} or cost {alt_cost} is not optimal")
+    
+    # Same cities in a different id order: the saved table must not load
+    reordered = GraphWithCosts()
+    reordered.build_from_adjacency_list(dict(reversed(list(graph.get_graph().items()))))
+    try:
+        LandmarkHeuristic.load(snapshot, reordered)
+        print("   [FAIL] Landmark table loaded for a graph with a different node order")
+    except ValueError:
+        print("   [OK] Landmark table rejected for a graph with a different node order")
+    
+    print("\n6. Testing multi-goal A* over (city, visited-goal mask):")
+    goal_states = ["Axum", "Gondar", "Lalibela", "Babile", "Jimma",
+                   "Bale", "Sof Oumer", "Arba Minch"]
+    multi_astar = MultiGoalAStarSearch(graph)
+    tour, tour_cost, tour_order = multi_astar.search(initial, goal_states)
+    _, exact_cost, _ = MultiGoalUniformCostSearch(graph, mode='exact').search(initial, goal_states)
+    if tour and tour_cost == exact_cost and sorted(tour_order) == sorted(goal_states):
+        print(f"   [OK] Optimal cost {tour_cost} (Held-Karp: {exact_cost}), "
+              f"{multi_astar.states_expanded} states expanded")
+        print(f"   Order: {' -> '.join(tour_order)}")
+    else:
+        print(f"   [FAIL] Multi-goal A*: cost {tour_cost}, expected {exact_cost}")
+
+    # A one-way chain reaches Goal B cheaply but strands Goal A, so every
+    # state on it is a dead end and must not be expanded
+    trap = GraphWithCosts()
+    trap.build_from_edges([("Start", "Trap 1", 1)] +
+                          [(f"Trap {i}", f"Trap {i + 1}", 1) for i in range(1, 20)] +
+                          [("Trap 20", "Goal B", 1), ("Start", "Goal A", 30),
+                           ("Goal A", "Goal B", 30)], bidirectional=False)
+    trap_astar = MultiGoalAStarSearch(trap)
+    _, trap_cost, trap_order = trap_astar.search("Start", ["Goal A", "Goal B"])
+    if trap_cost == 60 and trap_order == ["Goal A", "Goal B"] and trap_astar.states_expanded == 3:
+        print(f"   [OK] Dead-end states pruned ({trap_astar.states_expanded} states expanded)")
+    else:
+        print(f"   [FAIL] Dead-end trap: cost {trap_cost}, "
+              f"{trap_astar.states_expanded} states expanded")
+
     print("\n" + "=" * 60)
 
 
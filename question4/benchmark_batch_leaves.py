@@ -0,0 +1,72 @@
+"""
+Benchmark: one utility call per leaf vs one batched call per depth-1 node
+Two utilities on the same synthetic game: the coffee table (a dict lookup,
+almost free per call) and a small neural-network coffee model whose cost is
+mostly per-call overhead. Both modes must return the same minimax value
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, create_synthetic_game
+
+
+class CoffeeModelUtility:
+    """Stand-in for an expensive learned scorer: a 2-layer MLP over city features"""
+
+    def __init__(self, nodes, num_features=32, hidden=64, seed=0):
+        rng = np.random.default_rng(seed)
+        self.ids = {node: i for i, node in enumerate(nodes)}
+        self.features = rng.standard_normal((len(nodes), num_features))
+        self.w1 = rng.standard_normal((num_features, hidden)) / np.sqrt(num_features)
+        self.w2 = rng.standard_normal(hidden) / np.sqrt(hidden)
+
+    def _score(self, ids):
+        hidden = np.maximum(self.features[ids] @ self.w1, 0.0)
+        return np.round(50 + 10 * (hidden @ self.w2))
+
+    def __call__(self, node, is_maximizing_player):
+        value = self._score([self.ids[node]])[0].item()
+        return value if is_maximizing_player else -value
+
+    def batch(self, nodes, is_maximizing_player):
+        values = self._score([self.ids[node] for node in nodes])
+        return values if is_maximizing_player else -values
+
+
+def run_benchmark(num_nodes=5000, branching=8, depths=(4, 6), seed=0, repeats=3):
+    print("=" * 60)
+    print("MiniMax benchmark: per-leaf vs batched leaf evaluation")
+    print("=" * 60)
+
+    graph, coffee_utility = create_synthetic_game(num_nodes, branching, seed=seed)
+    model_utility = CoffeeModelUtility(list(graph), seed=seed)
+    print(f"{num_nodes} nodes, branching {branching}")
+
+    for name, utility_func in (("coffee table", coffee_utility), ("coffee model", model_utility)):
+        for depth in depths:
+            print(f"\n{name}, depth {depth}:")
+            results = {}
+            for batch_leaves in (False, True):
+                seconds = float('inf')
+                for _ in range(repeats):
+                    search = MiniMaxSearch(graph, utility_func, depth, engine='iterative',
+                                           batch_leaves=batch_leaves)
+                    start = time.perf_counter()
+                    value, _ = search.search("Node 0")
+                    seconds = min(seconds, time.perf_counter() - start)
+                results[batch_leaves] = (value, search.nodes_searched, seconds)
+            assert results[True][0] == results[False][0], "batching changed the minimax value"
+            base = results[False][2]
+            for batch_leaves, (value, nodes, seconds) in results.items():
+                label = "batched" if batch_leaves else "per leaf"
+                print(f"  {label:9s} {seconds * 1e3:9.1f} ms  {nodes:8d} nodes  "
+                      f"({base / seconds:.2f}x)  value {value}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
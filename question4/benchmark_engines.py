@@ -0,0 +1,67 @@
+"""
+Benchmark: recursive vs explicit-stack (iterative) alpha-beta engine
+Both engines search the same tree (same values, paths and node counts);
+the iterative one also handles lines far deeper than the recursion limit
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, CoffeeUtility, create_synthetic_game
+
+
+def time_search(make_search, initial, repeats=3):
+    """(searcher, result, best seconds) over fresh searchers"""
+    seconds = float('inf')
+    for _ in range(repeats):
+        search = make_search()
+        start = time.perf_counter()
+        result = search.search(initial)
+        seconds = min(seconds, time.perf_counter() - start)
+    return search, result, seconds
+
+
+def run_benchmark(depths=(6, 8, 10), num_nodes=5000, branching=6, chain_length=3000, seed=0):
+    print("=" * 60)
+    print("MiniMax benchmark: recursive vs iterative engine")
+    print("=" * 60)
+
+    graph, utility_func = create_synthetic_game(num_nodes, branching, seed=seed)
+    initial = "Node 0"
+
+    for depth in depths:
+        print(f"\ndepth {depth}:")
+        for tt_capacity in (0, 1 << 16):
+            runs = {}
+            for engine in ('recursive', 'iterative'):
+                runs[engine] = time_search(
+                    lambda: MiniMaxSearch(graph, utility_func, depth, tt_capacity, engine=engine), initial)
+            (recursive, result, base_seconds), (iterative, iterative_result, seconds) = \
+                runs['recursive'], runs['iterative']
+            assert iterative_result == result and iterative.nodes_searched == recursive.nodes_searched
+
+            label = "with TT" if tt_capacity else "no TT"
+            nodes = recursive.nodes_searched
+            print(f"  {label:8s} recursive {base_seconds * 1e3:8.1f} ms  "
+                  f"{base_seconds / nodes * 1e6:5.2f} us/node")
+            print(f"  {label:8s} iterative {seconds * 1e3:8.1f} ms  "
+                  f"{seconds / nodes * 1e6:5.2f} us/node  ({base_seconds / seconds:.2f}x, {nodes} nodes)")
+
+    # A long forced line: the agent walks a chain, the adversary may stop it
+    chain = {f"Step {i}": [f"Step {i + 1}", f"Exit {i}"] for i in range(chain_length)}
+    chain_utility = CoffeeUtility({f"Exit {i}": i % 7 for i in range(chain_length)})
+    print(f"\nchain of {chain_length} moves, depth {chain_length}:")
+    try:
+        MiniMaxSearch(chain, chain_utility, chain_length, tt_capacity=0).search("Step 0")
+        print("  recursive  finished")
+    except RecursionError:
+        print(f"  recursive  RecursionError (limit {sys.getrecursionlimit()})")
+    search, (value, path), seconds = time_search(
+        lambda: MiniMaxSearch(chain, chain_utility, chain_length, tt_capacity=0, engine='iterative'),
+        "Step 0", repeats=1)
+    print(f"  iterative  value {value}, {len(path) - 1}-move line in {seconds * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,91 @@
+"""
+Benchmark: playing strength per CPU-second, MCTS vs depth-limited alpha-beta
+Each agent plays whole games of a fixed length on a synthetic game graph
+with a high branching factor against the same opponent (depth-2
+alpha-beta), from the same starting locations. Strength is the mean final
+payoff; cost is the agent's CPU time per game
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, create_synthetic_game
+from question4.mcts_search import MCTSSearch
+
+
+def play_game(graph, utility_func, start, plies, agent_move, opponent_depth=2):
+    """
+    Alternate agent and opponent moves for plies plies
+
+    Args:
+        agent_move: Function (node, plies_left) -> next node; it is told each
+                    opponent move through agent_move.observe, if present
+
+    Returns:
+        tuple: (final payoff, agent CPU seconds)
+    """
+    node, is_max, cpu = start, True, 0.0
+    for plies_left in range(plies, 0, -1):
+        if not graph.get(node):
+            break
+        if is_max:
+            started = time.process_time()
+            node = agent_move(node, plies_left)
+            cpu += time.process_time() - started
+        else:
+            depth = min(opponent_depth, plies_left)
+            _, path = MiniMaxSearch(graph, utility_func, depth).minimax(node, depth, False)
+            node = path[1]
+            if hasattr(agent_move, 'observe'):
+                agent_move.observe(node)
+        is_max = not is_max
+    return utility_func(node, is_max), cpu
+
+
+def alpha_beta_agent(graph, utility_func, depth):
+    def move(node, plies_left):
+        search_depth = min(depth, plies_left)
+        return MiniMaxSearch(graph, utility_func, search_depth, engine='iterative').search(node)[1][1]
+    return move
+
+
+def mcts_agent(mcts):
+    def move(node, plies_left):
+        chosen = mcts.search(node, plies=plies_left)[1][1]
+        mcts.advance(chosen)
+        return chosen
+    move.observe = mcts.advance
+    return move
+
+
+def run_benchmark(num_nodes=5000, branching=10, plies=8, games=40, seed=0):
+    print("=" * 60)
+    print("Adversarial benchmark: MCTS vs depth-limited alpha-beta")
+    print("=" * 60)
+
+    graph, utility_func = create_synthetic_game(num_nodes, branching, seed=seed)
+    starts = [f"Node {i}" for i in range(0, num_nodes, num_nodes // games)][:games]
+    print(f"{num_nodes} nodes, branching {branching}, {plies}-ply games, {games} games, "
+          f"opponent: depth-2 alpha-beta")
+
+    agents = [(f"alpha-beta depth {depth}", lambda depth=depth: alpha_beta_agent(graph, utility_func, depth))
+              for depth in (2, 4, 6)]
+    agents += [(f"MCTS {int(budget * 1e3)} ms/move",
+                lambda budget=budget: mcts_agent(MCTSSearch(graph, utility_func, plies,
+                                                            time_budget=budget, seed=seed)))
+               for budget in (0.005, 0.02, 0.1)]
+
+    print(f"\n  {'agent':22s} {'mean payoff':>11s} {'agent CPU s/game':>17s}")
+    for name, make_agent in agents:
+        payoffs, cpu = [], 0.0
+        for start in starts:
+            payoff, seconds = play_game(graph, utility_func, start, plies, make_agent())
+            payoffs.append(payoff)
+            cpu += seconds
+        mean = sum(payoffs) / len(payoffs)
+        print(f"  {name:22s} {mean:11.2f} {cpu / games:17.3f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,41 @@
+"""
+Benchmark: MiniMax with and without the no-revisit rule
+On the undirected Figure 1 graph most of the plain game tree is shuffling
+back and forth between neighbouring cities; the no-revisit rule removes
+those lines. Note the rule changes the game, so the values may differ
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import (MiniMaxSearch, create_adversarial_graph,
+                                      create_coffee_utility_function)
+
+
+def run_benchmark(depths=(6, 8, 10, 12), initial="Addis Ababa", repeats=3):
+    print("=" * 60)
+    print("MiniMax benchmark: plain game vs no-revisit rule (Figure 1)")
+    print("=" * 60)
+
+    graph = create_adversarial_graph()
+    utility_func = create_coffee_utility_function()
+
+    for depth in depths:
+        print(f"\ndepth {depth}:")
+        for tt_capacity in (0, 1 << 16):
+            for no_revisit in (False, True):
+                seconds = float('inf')
+                for _ in range(repeats):
+                    search = MiniMaxSearch(graph, utility_func, depth, tt_capacity,
+                                           engine='iterative', no_revisit=no_revisit)
+                    start = time.perf_counter()
+                    value, path = search.search(initial)
+                    seconds = min(seconds, time.perf_counter() - start)
+                label = f"{'no-revisit' if no_revisit else 'plain':10s} {'with TT' if tt_capacity else 'no TT':7s}"
+                print(f"  {label} {search.nodes_searched:8d} nodes {seconds * 1e3:8.2f} ms  "
+                      f"value {value}, ends at {path[-1]}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
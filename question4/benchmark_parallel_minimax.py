@@ -0,0 +1,46 @@
+"""
+Benchmark: sequential vs root-split parallel alpha-beta
+Deep searches on a synthetic game graph with 1..N worker processes; every
+run must return the sequential minimax value
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, create_synthetic_game
+from question4.parallel_minimax import ParallelMiniMaxSearch
+
+
+def run_benchmark(depths=(6, 8, 10), num_nodes=5000, branching=6, seed=0):
+    print("=" * 60)
+    print("MiniMax benchmark: sequential vs parallel root split")
+    print("=" * 60)
+
+    graph, utility_func = create_synthetic_game(num_nodes, branching, seed=seed)
+    initial = "Node 0"
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cpus} | ({4} if cpus >= 4 else set()))
+    print(f"{num_nodes} nodes, branching {branching}, {cpus} CPU(s)")
+
+    for depth in depths:
+        sequential = MiniMaxSearch(graph, utility_func, max_depth=depth)
+        start = time.perf_counter()
+        value, _ = sequential.search(initial)
+        base_seconds = time.perf_counter() - start
+        print(f"\ndepth {depth}: value {value}")
+        print(f"  sequential     {base_seconds * 1e3:9.1f} ms  {sequential.nodes_searched} nodes")
+
+        for workers in worker_counts:
+            with ParallelMiniMaxSearch(graph, utility_func, max_depth=depth, workers=workers) as parallel:
+                parallel.start()  # Fork the workers outside the timing
+                start = time.perf_counter()
+                parallel_value, _ = parallel.search(initial)
+                seconds = time.perf_counter() - start
+            assert parallel_value == value, "parallel search disagrees with sequential"
+            print(f"  {workers} worker(s)   {seconds * 1e3:9.1f} ms  {parallel.nodes_searched} nodes  "
+                  f"speedup {base_seconds / seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,172 @@
+"""
+Benchmark: principal variation as returned lists vs triangular PV table
+The list version is the previous implementation (every return builds
+[node] + path); both visit exactly the same nodes, with and without the
+transposition table
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, create_synthetic_game, _SearchTimeout
+from question4.transposition_table import EXACT, LOWER_BOUND, UPPER_BOUND
+
+
+class ListPathMiniMax(MiniMaxSearch):
+    """The previous MiniMaxSearch: every level returns (value, path) lists"""
+    
+    def _tt_path(self, node, depth, is_maximizing_player):
+        path = [node]
+        while not self._is_terminal(node, depth):
+            entry = self.tt.peek((node, depth, is_maximizing_player))
+            if entry is None or entry[3] is None:
+                return path, False
+            node = entry[3]
+            depth -= 1
+            is_maximizing_player = not is_maximizing_player
+            path.append(node)
+        return path, True
+    
+    def minimax(self, node, depth, is_maximizing_player, alpha=float('-inf'), beta=float('inf')):
+        self.nodes_searched += 1
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        
+        # Terminal conditions
+        if self._is_terminal(node, depth):
+            utility = self.utility(node, is_maximizing_player)
+            return utility, [node]
+        
+        neighbors = self.graph[node]
+        
+        # Transposition table: reuse an earlier search of this position if
+        # its value (or bound) settles it for the current alpha-beta window
+        tt = self.tt
+        key = (node, depth, is_maximizing_player)
+        best_move = None
+        if tt is not None:
+            entry = tt.lookup(key)
+            if entry is not None:
+                _, stored_value, flag, best_move = entry
+                if flag == EXACT:
+                    path, complete = self._tt_path(node, depth, is_maximizing_player)
+                    if complete:
+                        tt.cutoffs += 1
+                        return stored_value, path
+                elif flag == LOWER_BOUND:
+                    alpha = max(alpha, stored_value)
+                else:
+                    beta = min(beta, stored_value)
+                if flag != EXACT and alpha >= beta:
+                    tt.cutoffs += 1
+                    return stored_value, self._tt_path(node, depth, is_maximizing_player)[0]
+            if best_move is None and depth > 1:
+                # The previous iteration searched this position one ply
+                # shallower; its best move is still the best first guess
+                shallower = tt.peek((node, depth - 1, is_maximizing_player))
+                if shallower is not None:
+                    best_move = shallower[3]
+        neighbors = self._ordered_moves(node, neighbors, depth, best_move)
+        
+        value, best_path = self._search_children(node, neighbors, depth, is_maximizing_player, alpha, beta)
+        
+        if tt is not None:
+            # Classify against the window actually searched (fail-soft)
+            if value <= alpha:
+                flag = UPPER_BOUND
+            elif value >= beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            tt.store(key, depth, value, flag, best_path[1] if len(best_path) > 1 else None)
+        return value, best_path
+    
+    def _search_children(self, node, neighbors, depth, is_maximizing_player, alpha, beta):
+        """Alpha-beta over the successors of node; returns (best_value, best_path)"""
+        if is_maximizing_player:
+            # Agent's turn: maximize utility
+            max_value = float('-inf')
+            best_path = [node]
+            
+            for neighbor in neighbors:
+                value, path = self.minimax(neighbor, depth - 1, False, alpha, beta)
+                
+                if value > max_value:
+                    max_value = value
+                    best_path = [node] + path
+                
+                alpha = max(alpha, value)
+                if beta <= alpha:
+                    self._record_cutoff(node, neighbor, depth)
+                    break  # Alpha-beta pruning
+            
+            return max_value, best_path
+        
+        else:
+            # Adversary's turn: minimize utility
+            min_value = float('inf')
+            best_path = [node]
+            
+            for neighbor in neighbors:
+                value, path = self.minimax(neighbor, depth - 1, True, alpha, beta)
+                
+                if value < min_value:
+                    min_value = value
+                    best_path = [node] + path
+                
+                beta = min(beta, value)
+                if beta <= alpha:
+                    self._record_cutoff(node, neighbor, depth)
+                    break  # Alpha-beta pruning
+            
+            return min_value, best_path
+
+
+def measure(make_search, initial, repeats=3):
+    """
+    Search from initial with fresh searchers (cold transposition table)
+
+    Returns:
+        tuple: (searcher, value, path, best seconds, peak traced bytes)
+    """
+    seconds = float('inf')
+    for _ in range(repeats):
+        search = make_search()
+        start = time.perf_counter()
+        value, path = search.search(initial)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    make_search().search(initial)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return search, value, path, seconds, peak
+
+
+def run_benchmark(depths=(6, 8, 10), num_nodes=5000, branching=6, seed=0):
+    print("=" * 60)
+    print("MiniMax benchmark: list paths vs triangular PV table")
+    print("=" * 60)
+
+    graph, utility_func = create_synthetic_game(num_nodes, branching, seed=seed)
+    initial = "Node 0"
+
+    for depth in depths:
+        print(f"\ndepth {depth}:")
+        for tt_capacity in (0, 1 << 16):
+            label = "with TT" if tt_capacity else "no TT"
+            lists, list_value, list_path, list_seconds, list_peak = measure(
+                lambda: ListPathMiniMax(graph, utility_func, depth, tt_capacity), initial)
+            table, value, path, seconds, peak = measure(
+                lambda: MiniMaxSearch(graph, utility_func, depth, tt_capacity), initial)
+            assert (value, path) == (list_value, list_path), "PV table changed the result"
+            assert table.nodes_searched == lists.nodes_searched
+
+            print(f"  {label:8s} list paths {list_seconds * 1e3:8.1f} ms  peak {list_peak / 1024:8.1f} KiB")
+            print(f"  {label:8s} PV table   {seconds * 1e3:8.1f} ms  peak {peak / 1024:8.1f} KiB  "
+                  f"({list_seconds / seconds:.2f}x, {table.nodes_searched} nodes)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,57 @@
+"""
+Benchmark: per-start alpha-beta vs one retrograde pass over every city
+Answers the game from many starting cities on a synthetic graph; both
+must give the same value for every start
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch, create_synthetic_game
+from question4.retrograde_solver import RetrogradeSolver
+
+
+def run_benchmark(num_nodes=20000, branching=6, depths=(4, 6, 8), num_starts=200, seed=0):
+    print("=" * 60)
+    print("MiniMax benchmark: per-start alpha-beta vs retrograde table")
+    print("=" * 60)
+
+    graph, utility_func = create_synthetic_game(num_nodes, branching, seed=seed)
+    starts = [f"Node {i}" for i in range(0, num_nodes, num_nodes // num_starts)][:num_starts]
+    print(f"{num_nodes} nodes, branching {branching}, {num_starts} starting cities")
+
+    for depth in depths:
+        start = time.perf_counter()
+        expected = [MiniMaxSearch(graph, utility_func, depth, engine='iterative').search(city)[0]
+                    for city in starts]
+        search_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        solver = RetrogradeSolver(graph, utility_func, depth)
+        solve_seconds = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "retrograde.npz")
+            solver.save(path)
+            start = time.perf_counter()
+            loaded = RetrogradeSolver.load(path)
+            load_seconds = time.perf_counter() - start
+            size = os.path.getsize(path)
+        start = time.perf_counter()
+        values = [loaded.search(city)[0] for city in starts]
+        lookup_seconds = time.perf_counter() - start
+        assert values == expected, "retrograde table disagrees with alpha-beta"
+
+        per_start = search_seconds / num_starts
+        print(f"\ndepth {depth}:")
+        print(f"  alpha-beta       {search_seconds * 1e3:9.1f} ms for {num_starts} starts "
+              f"(~{per_start * num_nodes:.1f} s for all {num_nodes})")
+        print(f"  retrograde solve {solve_seconds * 1e3:9.1f} ms for all {num_nodes} starts "
+              f"(break-even after {solve_seconds / per_start:.0f} starts)")
+        print(f"  load + lookups   {(load_seconds + lookup_seconds) * 1e3:9.1f} ms "
+              f"({lookup_seconds / num_starts * 1e6:.1f} us per start, {size / 2**20:.1f} MiB file)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
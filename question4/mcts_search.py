@@ -0,0 +1,275 @@
+"""
+Monte Carlo Tree Search (UCT) for the adversarial coffee game
+
+Full-width minimax is out of reach on large game graphs with many moves per
+location, even with alpha-beta. MCTS instead grows a search tree one node
+per iteration:
+
+1. Selection: from the root, follow the child with the best UCT score
+   (mean payoff for the player to move plus an exploration bonus) while
+   the node is fully expanded.
+2. Expansion: add one untried move as a new child.
+3. Rollout: play random moves from the new child to the end of the game
+   and score the final location with the coffee utility function, exactly
+   as MiniMaxSearch scores its leaves.
+4. Backpropagation: add the payoff to every node on the way back up.
+
+The game lasts a fixed number of plies (max_depth, like MiniMaxSearch), so
+a tree node is (location, plies left, player to move). After a move is
+played, advance() keeps the subtree below it for the next search.
+
+With workers > 0, rollouts run in a process pool: each round selects a
+batch of leaves (a virtual loss keeps the batch from piling onto one
+line), the workers play their rollouts, and the payoffs are
+backpropagated together. As in ParallelMiniMaxSearch the graph and
+utility function are sent to every worker only once.
+"""
+
+import sys
+import os
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def rollout(graph, utility_func, node, plies_left, is_maximizing_player, rng):
+    """
+    Play uniformly random moves to the end of the game
+
+    Returns:
+        Payoff of the final location, scored like a MiniMaxSearch leaf
+    """
+    while plies_left > 0 and node in graph:
+        moves = graph[node]
+        if not moves:
+            break
+        node = rng.choice(moves)
+        plies_left -= 1
+        is_maximizing_player = not is_maximizing_player
+    return utility_func(node, is_maximizing_player)
+
+
+# Per-process game, set once by _init_worker()
+_worker_graph = None
+_worker_utility = None
+
+
+def _init_worker(graph, utility_func):
+    """Pool initializer: keep the game in this worker"""
+    global _worker_graph, _worker_utility
+    _worker_graph = graph
+    _worker_utility = utility_func
+
+
+def _rollout_batch(leaves, seed):
+    """Worker task: one rollout per (node, plies_left, is_maximizing_player)"""
+    rng = random.Random(seed)
+    return [rollout(_worker_graph, _worker_utility, node, plies_left, is_max, rng)
+            for node, plies_left, is_max in leaves]
+
+
+class _TreeNode:
+    """Search tree node: a location with the plies left and the player to move"""
+    __slots__ = ('node', 'plies_left', 'is_max', 'parent', 'children', 'untried',
+                 'visits', 'total')
+
+    def __init__(self, node, plies_left, is_max, parent, moves, rng):
+        self.node = node
+        self.plies_left = plies_left
+        self.is_max = is_max
+        self.parent = parent
+        self.children = {}  # move -> _TreeNode
+        self.untried = list(dict.fromkeys(moves)) if plies_left > 0 else []
+        rng.shuffle(self.untried)
+        self.visits = 0
+        self.total = 0.0  # Sum of payoffs (agent's point of view)
+
+
+class MCTSSearch:
+    """UCT Monte Carlo Tree Search with tree reuse and optional parallel rollouts"""
+
+    def __init__(self, graph, utility_func, max_depth=5, iterations=1000,
+                 time_budget=None, exploration=1.4, workers=0, batch_size=16, seed=0):
+        """
+        Initialize MCTS
+
+        Args:
+            graph: Dictionary representing the game graph {node: [neighbors]},
+                   or an unweighted CSRGraph
+            utility_func: Function (node, is_max_player) -> utility, used as the
+                          rollout payoff (e.g. create_coffee_utility_function())
+            max_depth: Plies until the game ends (same horizon as MiniMaxSearch)
+            iterations: Iterations per search when no time budget is given
+            time_budget: Optional seconds per search (overrides iterations)
+            exploration: UCT constant, in units of the largest payoff seen
+            workers: Rollout processes (0 runs the rollouts in this process)
+            batch_size: Leaves per worker per round when workers > 0
+            seed: Random seed
+        """
+        self.graph = graph
+        self.utility = utility_func
+        self.max_depth = max_depth
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.workers = workers
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.root = None
+        self._scale = 1.0  # Largest |payoff| seen, to normalize exploration
+        self._executor = None
+        self.iterations_done = 0  # Iterations run by the last search()
+        self.reused_visits = 0  # Root visits inherited from the previous search
+
+    def _new_node(self, node, plies_left, is_max, parent):
+        moves = self.graph[node] if node in self.graph else []
+        return _TreeNode(node, plies_left, is_max, parent, moves, self.rng)
+
+    def _is_terminal(self, tree_node):
+        return tree_node.plies_left == 0 or (not tree_node.untried and not tree_node.children)
+
+    def _select(self, tree_node):
+        """Child with the best UCT score for the player to move"""
+        log_visits = math.log(tree_node.visits)
+        bonus = self.exploration * self._scale
+        sign = 1 if tree_node.is_max else -1
+        best, best_score = None, float('-inf')
+        for child in tree_node.children.values():
+            if child.visits == 0:
+                return child
+            score = sign * child.total / child.visits + bonus * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _descend(self):
+        """Selection + expansion: the tree node to roll out from"""
+        tree_node = self.root
+        while not tree_node.untried and tree_node.children and tree_node.plies_left > 0:
+            tree_node = self._select(tree_node)
+        if tree_node.untried and tree_node.plies_left > 0:
+            move = tree_node.untried.pop()
+            child = self._new_node(move, tree_node.plies_left - 1, not tree_node.is_max, tree_node)
+            tree_node.children[move] = child
+            tree_node = child
+        return tree_node
+
+    def _backpropagate(self, tree_node, payoff, visits=1):
+        while tree_node is not None:
+            tree_node.visits += visits
+            tree_node.total += payoff
+            tree_node = tree_node.parent
+
+    def _pool(self):
+        """Start the rollout workers on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.graph, self.utility))
+        return self._executor
+
+    def close(self):
+        """Shut the rollout workers down"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run_serial(self, keep_going):
+        while keep_going():
+            leaf = self._descend()
+            payoff = (self.utility(leaf.node, leaf.is_max) if self._is_terminal(leaf) else
+                      rollout(self.graph, self.utility, leaf.node, leaf.plies_left, leaf.is_max, self.rng))
+            self._scale = max(self._scale, abs(payoff))
+            self._backpropagate(leaf, payoff)
+            self.iterations_done += 1
+
+    def _run_parallel(self, keep_going):
+        pool = self._pool()
+        while keep_going():
+            # Select a batch of leaves; a virtual loss (one visit with the
+            # worst payoff for the player choosing it) spreads the batch out
+            leaves = []
+            for _ in range(self.workers * self.batch_size):
+                leaf = self._descend()
+                loss = -self._scale if leaf.parent is None or leaf.parent.is_max else self._scale
+                self._backpropagate(leaf, loss)
+                leaves.append((leaf, loss))
+            chunks = [leaves[i::self.workers] for i in range(self.workers)]
+            futures = [pool.submit(_rollout_batch,
+                                   [(leaf.node, leaf.plies_left, leaf.is_max) for leaf, _ in chunk],
+                                   self.rng.getrandbits(32))
+                       for chunk in chunks if chunk]
+            for chunk, future in zip([chunk for chunk in chunks if chunk], futures):
+                for (leaf, loss), payoff in zip(chunk, future.result()):
+                    # Replace the virtual loss by the real payoff
+                    self._scale = max(self._scale, abs(payoff))
+                    self._backpropagate(leaf, payoff - loss, visits=0)
+            self.iterations_done += len(leaves)
+
+    def search(self, initial_state, plies=None):
+        """
+        Find the best move for the agent from initial_state
+
+        Args:
+            initial_state: Current location (the agent is to move)
+            plies: Plies left in the game (default: max_depth)
+
+        Returns:
+            tuple: (best_value, best_path) - estimated payoff of the best move
+                   and the most visited line; best_path[1] is the move to play
+        """
+        plies = self.max_depth if plies is None else plies
+        root = self.root
+        if root is None or (root.node, root.plies_left, root.is_max) != (initial_state, plies, True):
+            root = self._new_node(initial_state, plies, True, None)
+        root.parent = None
+        self.root = root
+        self.reused_visits = root.visits
+        self.iterations_done = 0
+
+        if self._is_terminal(root):
+            return self.utility(initial_state, True), [initial_state]
+
+        # At least one iteration always runs, so there is a move to return
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+            keep_going = lambda: self.iterations_done == 0 or time.perf_counter() < deadline
+        else:
+            keep_going = lambda: self.iterations_done == 0 or self.iterations_done < self.iterations
+        if self.workers:
+            self._run_parallel(keep_going)
+        else:
+            self._run_serial(keep_going)
+
+        # Most visited line; the value is the mean payoff of the chosen move
+        path = [initial_state]
+        tree_node = root
+        while tree_node.children:
+            tree_node = max(tree_node.children.values(), key=lambda child: child.visits)
+            path.append(tree_node.node)
+        best = max(root.children.values(), key=lambda child: child.visits)
+        return best.total / best.visits, path
+
+    def advance(self, move):
+        """
+        Play a move (the agent's or the adversary's) and keep its subtree
+
+        The next search() from the resulting location starts from the
+        statistics already gathered below move.
+        """
+        if self.root is None:
+            return
+        child = self.root.children.get(move)
+        if child is None:
+            self.root = None
+        else:
+            child.parent = None
+            self.root = child
@@ -6,21 +6,245 @@ good quality of Coffee. Write a class that shows how MiniMax
 search algorithm directs an agent to the best achievable destination.
 """
 
+import sys
+import os
+import random
+import time
+from itertools import repeat
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.transposition_table import (TranspositionTable, EXACT,
+                                           LOWER_BOUND, UPPER_BOUND)
+
+
+class _SearchTimeout(Exception):
+    """Raised inside minimax() when the time budget runs out"""
+
+
+class _Frame:
+    """One open position on the iterative engine's explicit stack"""
+    __slots__ = ('node', 'depth', 'is_max', 'alpha', 'beta', 'window_alpha', 'window_beta',
+                 'moves', 'index', 'best')
+
+
 class MiniMaxSearch:
     """Implements MiniMax algorithm for adversarial search"""
     
-    def __init__(self, graph, utility_func, max_depth=5):
+    def __init__(self, graph, utility_func, max_depth=5, tt_capacity=1 << 16, engine='recursive',
+                 no_revisit=False, batch_leaves=False):
         """
         Initialize MiniMax search
         
         Args:
-            graph: Dictionary representing the game graph {node: [neighbors]}
+            graph: Dictionary representing the game graph {node: [neighbors]},
+                   or an unweighted CSRGraph (used through its read-only dict view)
             utility_func: Function that takes (node, is_max_player) and returns utility
             max_depth: Maximum depth to search
+            tt_capacity: Slots in the transposition table keyed by
+                         (node, depth, is_maximizing_player); 0 disables it
+            engine: 'recursive', or 'iterative' for the explicit-stack engine
+                    (same results, no recursion limit, less overhead per node)
+            no_revisit: If True, a player may not move to a city already on
+                        the current line of play (no A -> B -> A shuffling);
+                        a player with no such move left ends the game there
+            batch_leaves: If True, the children of a depth-1 position are
+                          valued with one utility_func.batch(nodes, is_max_player)
+                          call (when the utility has one) instead of one call
+                          per leaf; worthwhile for expensive utilities
         """
+        if engine not in ('recursive', 'iterative'):
+            raise ValueError(f"Unknown engine: {engine}. Use 'recursive' or 'iterative'")
         self.graph = graph
         self.utility = utility_func
         self.max_depth = max_depth
+        self.tt = TranspositionTable(tt_capacity) if tt_capacity else None
+        self.engine = engine
+        self.batch_leaves = batch_leaves
+        
+        # Move ordering state: previous iteration's principal variation,
+        # two killer moves per ply and a history score per (node, move)
+        self._root_depth = max_depth
+        self._pv = []
+        self._pv_table = []  # Triangular: row d has room for d + 1 nodes
+        self._pv_length = []
+        self._killers = {}
+        self._history = {}
+        self._deadline = None
+        
+        # No-revisit rule: every city gets a bit and a random 64-bit Zobrist
+        # key. The cities on the current line are kept as a bitset (exact
+        # membership test) and as the XOR of their keys, a hash of the set
+        # that is added to transposition table keys. Both are updated
+        # incrementally when a city is entered and left.
+        self.no_revisit = no_revisit
+        self._city_bits = {}
+        self._zobrist = {}
+        if no_revisit:
+            rng = random.Random(0)
+            cities = dict.fromkeys(city for node in graph for city in (node, *graph[node]))
+            self._city_bits = {city: 1 << i for i, city in enumerate(cities)}
+            self._zobrist = {city: rng.getrandbits(64) for city in cities}
+        self._visited_bits = 0
+        self._visited_hash = 0
+        self._child_search = self._alphabeta_no_revisit if no_revisit else self._alphabeta
+        self.nodes_searched = 0
+        self.completed_depth = 0  # Deepest iteration finished by the last search()
+    
+    def _is_terminal(self, node, depth, visited=0):
+        """
+        True when the search stops at node (depth exhausted or no moves)
+        
+        Args:
+            visited: Bitset of the cities on the line (no-revisit rule only)
+        """
+        if depth == 0 or node not in self.graph or len(self.graph[node]) == 0:
+            return True
+        if self.no_revisit:
+            bits = self._city_bits
+            return all(visited & bits[move] for move in self.graph[node])
+        return False
+    
+    def _tt_key(self, node, depth, is_maximizing_player):
+        """Transposition key; under the no-revisit rule it includes the visited-set hash"""
+        if self.no_revisit:
+            return (node, depth, is_maximizing_player, self._visited_hash)
+        return (node, depth, is_maximizing_player)
+    
+    def _grow_pv_table(self, depth):
+        """
+        Make sure the triangular principal-variation table reaches depth
+        
+        Row d holds the best line found from the position currently searched
+        at depth d (at most d + 1 nodes). Rows are allocated once and reused,
+        so no path list is built while searching.
+        """
+        table = self._pv_table
+        while len(table) <= depth:
+            table.append([None] * (len(table) + 1))
+            self._pv_length.append(0)
+    
+    def _tt_pv(self, node, depth, is_maximizing_player):
+        """
+        Fill PV row depth by following stored best moves from a position
+        
+        Returns:
+            bool: False when the chain stops at a position that is no longer
+                  in the table (the row then holds the partial line)
+        """
+        row = self._pv_table[depth]
+        length = 0
+        complete = True
+        visited, visited_hash = self._visited_bits, self._visited_hash
+        while True:
+            row[length] = node
+            length += 1
+            if self._is_terminal(node, depth, visited):
+                break
+            key = (node, depth, is_maximizing_player)
+            if self.no_revisit:
+                key += (visited_hash,)
+            entry = self.tt.peek(key)
+            if entry is None or entry[3] is None:
+                complete = False
+                break
+            node = entry[3]
+            depth -= 1
+            is_maximizing_player = not is_maximizing_player
+            visited |= self._city_bits.get(node, 0)
+            visited_hash ^= self._zobrist.get(node, 0)
+        self._pv_length[len(row) - 1] = length
+        return complete
+    
+    def _ordered_moves(self, node, neighbors, depth, best_move=None):
+        """
+        Order moves so alpha-beta cuts off early
+        
+        Principal-variation move first, then the transposition table's best
+        move, then this ply's killer moves, then the rest by history score
+        (ties keep adjacency-list order).
+        """
+        ply = self._root_depth - depth
+        first = []
+        if ply + 1 < len(self._pv) and self._pv[ply] == node:
+            first.append(self._pv[ply + 1])
+        if best_move is not None:
+            first.append(best_move)
+        first.extend(self._killers.get(ply, ()))
+        
+        history = self._history
+        rank = {}
+        for move in first:
+            rank.setdefault(move, (0, len(rank)))
+        return sorted(neighbors, key=lambda move: rank.get(move, (1, -history.get((node, move), 0))))
+    
+    def _record_cutoff(self, node, move, depth):
+        """Remember a move that caused a beta cutoff (killer + history)"""
+        ply = self._root_depth - depth
+        killers = self._killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self._history[(node, move)] = self._history.get((node, move), 0) + depth * depth
+    
+    def _age_move_ordering(self):
+        """
+        Start a new search: forget the killers (they belong to another root)
+        and halve the history scores, dropping those that reach zero
+        """
+        self._killers = {}
+        self._history = {key: score >> 1 for key, score in self._history.items() if score > 1}
+    
+    def _tt_probe(self, node, depth, is_maximizing_player, alpha, beta):
+        """
+        Consult the transposition table before searching a position
+        
+        Returns:
+            tuple: (value, alpha, beta, best_move) - value is None unless a
+                   stored entry settles the position for this window (its
+                   line is then in PV row depth); alpha and beta come back
+                   narrowed by any stored bound
+        """
+        tt = self.tt
+        best_move = None
+        entry = tt.lookup(self._tt_key(node, depth, is_maximizing_player))
+        if entry is not None:
+            _, stored_value, flag, best_move = entry
+            if flag == EXACT:
+                if self._tt_pv(node, depth, is_maximizing_player):
+                    tt.cutoffs += 1
+                    return stored_value, alpha, beta, best_move
+            else:
+                if flag == LOWER_BOUND:
+                    narrowed_alpha, narrowed_beta = max(alpha, stored_value), beta
+                else:
+                    narrowed_alpha, narrowed_beta = alpha, min(beta, stored_value)
+                if narrowed_alpha < narrowed_beta:
+                    alpha, beta = narrowed_alpha, narrowed_beta
+                elif self._tt_pv(node, depth, is_maximizing_player):
+                    # Bound cutoff, only with a complete line like EXACT;
+                    # otherwise search the position with the caller's window
+                    tt.cutoffs += 1
+                    return stored_value, narrowed_alpha, narrowed_beta, best_move
+        if best_move is None and depth > 1:
+            # The previous iteration searched this position one ply
+            # shallower; its best move is still the best first guess
+            shallower = tt.peek(self._tt_key(node, depth - 1, is_maximizing_player))
+            if shallower is not None:
+                best_move = shallower[3]
+        return None, alpha, beta, best_move
+    
+    def _tt_store(self, node, depth, is_maximizing_player, value, alpha, beta):
+        """Store a searched position, classified against its window (fail-soft)"""
+        if value <= alpha:
+            flag = UPPER_BOUND
+        elif value >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        best_move = self._pv_table[depth][1] if self._pv_length[depth] > 1 else None
+        self.tt.store(self._tt_key(node, depth, is_maximizing_player), depth, value, flag, best_move)
     
     def minimax(self, node, depth, is_maximizing_player, alpha=float('-inf'), beta=float('inf')):
         """
@@ -36,90 +260,366 @@ class MiniMaxSearch:
         Returns:
             tuple: (best_value, best_path)
         """
-        # Terminal conditions
-        if depth == 0 or node not in self.graph or len(self.graph[node]) == 0:
-            utility = self.utility(node, is_maximizing_player)
-            return utility, [node]
+        self._grow_pv_table(depth)
+        self._visited_bits = self._visited_hash = 0
+        if self.engine == 'iterative':
+            value = self._alphabeta_iterative(node, depth, is_maximizing_player, alpha, beta)
+        else:
+            value = self._child_search(node, depth, is_maximizing_player, alpha, beta)
+        # The path is built once, from the PV table row of the root
+        return value, self._pv_table[depth][:self._pv_length[depth]]
+    
+    def _alphabeta(self, node, depth, is_maximizing_player, alpha, beta):
+        """Value of a position; its best line is left in PV row depth"""
+        self.nodes_searched += 1
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        
+        # Terminal conditions (under the no-revisit rule also: every move
+        # leads back to a city already on the line)
+        moves = self.graph[node] if depth and node in self.graph else None
+        if moves and self.no_revisit:
+            visited, bits = self._visited_bits, self._city_bits
+            moves = [move for move in moves if not visited & bits[move]]
+        if not moves:
+            self._pv_table[depth][0] = node
+            self._pv_length[depth] = 1
+            return self.utility(node, is_maximizing_player)
+        
+        # Transposition table: reuse an earlier search of this position if
+        # its value (or bound) settles it for the current alpha-beta window
+        best_move = None
+        if self.tt is not None:
+            value, alpha, beta, best_move = self._tt_probe(node, depth, is_maximizing_player, alpha, beta)
+            if value is not None:
+                return value
+        if depth == 1 and self.batch_leaves:
+            value = self._batch_children(node, moves, is_maximizing_player, alpha, beta)
+        else:
+            neighbors = self._ordered_moves(node, moves, depth, best_move)
+            value = self._search_children(node, neighbors, depth, is_maximizing_player, alpha, beta)
         
-        neighbors = self.graph[node]
+        if self.tt is not None:
+            self._tt_store(node, depth, is_maximizing_player, value, alpha, beta)
+        return value
+    
+    def _batch_children(self, node, moves, is_maximizing_player, alpha, beta):
+        """
+        Value a depth-1 position with one utility call for all its leaves
+        
+        Every child is evaluated, so leaves are not pruned, but the result is
+        the exact maximum/minimum, which is correct for any window. Ties go
+        to the first move in adjacency order.
+        """
+        self.nodes_searched += len(moves)
+        batch = getattr(self.utility, 'batch', None)
+        if batch is not None:
+            values = np.asarray(batch(moves, not is_maximizing_player))
+        else:
+            values = np.array([self.utility(move, not is_maximizing_player) for move in moves])
+        best = int(values.argmax() if is_maximizing_player else values.argmin())
+        value = values[best].item()
+        
+        row = self._pv_table[1]
+        row[0], row[1] = node, moves[best]
+        self._pv_length[1] = 2
+        if (value >= beta) if is_maximizing_player else (value <= alpha):
+            self._record_cutoff(node, moves[best], 1)
+        return value
+    
+    def _alphabeta_no_revisit(self, node, depth, is_maximizing_player, alpha, beta):
+        """_alphabeta() with node on the visited line while it is searched"""
+        bit, key = self._city_bits.get(node, 0), self._zobrist.get(node, 0)
+        self._visited_bits |= bit
+        self._visited_hash ^= key
+        try:
+            return self._alphabeta(node, depth, is_maximizing_player, alpha, beta)
+        finally:
+            self._visited_bits ^= bit
+            self._visited_hash ^= key
+    
+    def _search_children(self, node, neighbors, depth, is_maximizing_player, alpha, beta):
+        """
+        Alpha-beta over the successors of node; returns the best value
+        
+        Whenever a child improves the best value, the best line becomes node
+        followed by the child's line, copied from PV row depth - 1 into row
+        depth (nothing is copied for the children that do not improve).
+        """
+        search_child = self._child_search
+        row = self._pv_table[depth]
+        child_row = self._pv_table[depth - 1]
+        lengths = self._pv_length
+        row[0] = node
+        lengths[depth] = 1
         
         if is_maximizing_player:
             # Agent's turn: maximize utility
             max_value = float('-inf')
-            best_path = [node]
             
             for neighbor in neighbors:
-                value, path = self.minimax(neighbor, depth - 1, False, alpha, beta)
+                value = search_child(neighbor, depth - 1, False, alpha, beta)
                 
                 if value > max_value:
                     max_value = value
-                    best_path = [node] + path
+                    length = lengths[depth - 1]
+                    row[1:length + 1] = child_row[:length]
+                    lengths[depth] = length + 1
                 
                 alpha = max(alpha, value)
                 if beta <= alpha:
+                    self._record_cutoff(node, neighbor, depth)
                     break  # Alpha-beta pruning
             
-            return max_value, best_path
+            return max_value
         
         else:
             # Adversary's turn: minimize utility
             min_value = float('inf')
-            best_path = [node]
             
             for neighbor in neighbors:
-                value, path = self.minimax(neighbor, depth - 1, True, alpha, beta)
+                value = search_child(neighbor, depth - 1, True, alpha, beta)
                 
                 if value < min_value:
                     min_value = value
-                    best_path = [node] + path
+                    length = lengths[depth - 1]
+                    row[1:length + 1] = child_row[:length]
+                    lengths[depth] = length + 1
                 
                 beta = min(beta, value)
                 if beta <= alpha:
+                    self._record_cutoff(node, neighbor, depth)
                     break  # Alpha-beta pruning
             
-            return min_value, best_path
+            return min_value
+    
+    def _alphabeta_iterative(self, node, depth, is_maximizing_player, alpha, beta):
+        """
+        _alphabeta() without recursion
+        
+        Open positions are _Frame records on an explicit stack. Each pass of
+        the loop either enters a position - a leaf or a transposition table
+        hit is valued on the spot, anything else pushes a frame and enters
+        its first move - or hands a finished value to the frame on top of
+        the stack, which then enters its next move or finishes itself.
+        Positions one ply above the leaves never get a frame: their moves
+        are valued in a plain loop. Moves are ordered, cut off and stored
+        exactly as in _alphabeta().
+        """
+        graph = self.graph
+        utility = self.utility
+        tt = self.tt
+        table = self._pv_table
+        lengths = self._pv_length
+        deadline = self._deadline
+        clock = time.perf_counter
+        no_revisit = self.no_revisit
+        city_bits, zobrist = self._city_bits, self._zobrist
+        stack = []
+        nodes = 0
+        try:
+            while True:
+                # Enter (node, depth, is_maximizing_player) with window alpha..beta
+                nodes += 1
+                if deadline is not None and clock() > deadline:
+                    raise _SearchTimeout()
+                moves = graph[node] if depth and node in graph else None
+                entered = False
+                if moves and no_revisit:
+                    # Put node on the visited line before filtering its moves
+                    self._visited_bits |= city_bits[node]
+                    self._visited_hash ^= zobrist[node]
+                    entered = True
+                    visited = self._visited_bits
+                    moves = [move for move in moves if not visited & city_bits[move]]
+                if not moves:
+                    table[depth][0] = node
+                    lengths[depth] = 1
+                    value = utility(node, is_maximizing_player)
+                else:
+                    best_move = None
+                    value = None
+                    if tt is not None:
+                        value, alpha, beta, best_move = self._tt_probe(node, depth, is_maximizing_player, alpha, beta)
+                    if value is None and depth == 1 and self.batch_leaves:
+                        value = self._batch_children(node, moves, is_maximizing_player, alpha, beta)
+                        if tt is not None:
+                            self._tt_store(node, 1, is_maximizing_player, value, alpha, beta)
+                    elif value is None and depth == 1:
+                        # Every move leads to a leaf: value them in a tight
+                        # loop instead of entering each one through the stack
+                        row = table[1]
+                        row[0] = node
+                        lengths[1] = 1
+                        window_alpha, window_beta = alpha, beta
+                        moves = self._ordered_moves(node, moves, 1, best_move)
+                        if is_maximizing_player:
+                            value = float('-inf')
+                            for move in moves:
+                                nodes += 1
+                                if deadline is not None and clock() > deadline:
+                                    raise _SearchTimeout()
+                                leaf_value = utility(move, False)
+                                if leaf_value > value:
+                                    value = leaf_value
+                                    row[1] = move
+                                    lengths[1] = 2
+                                if leaf_value > alpha:
+                                    alpha = leaf_value
+                                if beta <= alpha:
+                                    self._record_cutoff(node, move, 1)
+                                    break
+                        else:
+                            value = float('inf')
+                            for move in moves:
+                                nodes += 1
+                                if deadline is not None and clock() > deadline:
+                                    raise _SearchTimeout()
+                                leaf_value = utility(move, True)
+                                if leaf_value < value:
+                                    value = leaf_value
+                                    row[1] = move
+                                    lengths[1] = 2
+                                if leaf_value < beta:
+                                    beta = leaf_value
+                                if beta <= alpha:
+                                    self._record_cutoff(node, move, 1)
+                                    break
+                        if tt is not None:
+                            self._tt_store(node, 1, is_maximizing_player, value, window_alpha, window_beta)
+                    elif value is None:
+                        frame = _Frame()
+                        frame.node, frame.depth, frame.is_max = node, depth, is_maximizing_player
+                        frame.alpha = frame.window_alpha = alpha
+                        frame.beta = frame.window_beta = beta
+                        frame.moves = self._ordered_moves(node, moves, depth, best_move)
+                        frame.index = 0
+                        frame.best = float('-inf') if is_maximizing_player else float('inf')
+                        table[depth][0] = node
+                        lengths[depth] = 1
+                        stack.append(frame)
+                        node = frame.moves[0]
+                        depth -= 1
+                        is_maximizing_player = not is_maximizing_player
+                        continue
+                if entered:
+                    self._visited_bits ^= city_bits[node]
+                    self._visited_hash ^= zobrist[node]
+                
+                # Hand value to the open frames until one has a move left
+                while stack:
+                    frame = stack[-1]
+                    frame_depth = frame.depth
+                    if frame.is_max:
+                        if value > frame.best:
+                            frame.best = value
+                            length = lengths[frame_depth - 1]
+                            table[frame_depth][1:length + 1] = table[frame_depth - 1][:length]
+                            lengths[frame_depth] = length + 1
+                        if value > frame.alpha:
+                            frame.alpha = value
+                    else:
+                        if value < frame.best:
+                            frame.best = value
+                            length = lengths[frame_depth - 1]
+                            table[frame_depth][1:length + 1] = table[frame_depth - 1][:length]
+                            lengths[frame_depth] = length + 1
+                        if value < frame.beta:
+                            frame.beta = value
+                    
+                    if frame.beta <= frame.alpha:
+                        self._record_cutoff(frame.node, frame.moves[frame.index], frame_depth)
+                    else:
+                        frame.index += 1
+                        if frame.index < len(frame.moves):
+                            node = frame.moves[frame.index]
+                            depth = frame_depth - 1
+                            is_maximizing_player = not frame.is_max
+                            alpha, beta = frame.alpha, frame.beta
+                            break
+                    
+                    # Frame finished: its value goes to the frame below
+                    value = frame.best
+                    if tt is not None:
+                        self._tt_store(frame.node, frame_depth, frame.is_max, value,
+                                       frame.window_alpha, frame.window_beta)
+                    if no_revisit:
+                        self._visited_bits ^= city_bits[frame.node]
+                        self._visited_hash ^= zobrist[frame.node]
+                    stack.pop()
+                else:
+                    return value
+        finally:
+            self.nodes_searched += nodes
     
-    def search(self, initial_state):
+    def search(self, initial_state, time_budget=None):
         """
         Find the best path for the agent using MiniMax
         
         Args:
             initial_state: Starting node
+            time_budget: Optional seconds. If given, search depth 1, 2, ...
+                         up to max_depth (each iteration ordered by the
+                         previous one's principal variation) and return the
+                         result of the deepest iteration that finished in time
             
         Returns:
-            tuple: (best_value, best_path)
+            tuple: (best_value, best_path); best_path[1] is the move to play
         """
-        value, path = self.minimax(initial_state, self.max_depth, True)
-        return value, path
+        self.nodes_searched = 0
+        self._pv = []
+        self._age_move_ordering()
+        if time_budget is None:
+            self._root_depth = self.max_depth
+            value, path = self.minimax(initial_state, self.max_depth, True)
+            self.completed_depth = self.max_depth
+            return value, path
+        
+        deadline = time.perf_counter() + time_budget
+        best = None
+        self.completed_depth = 0
+        for depth in range(1, self.max_depth + 1):
+            self._root_depth = depth
+            self._deadline = deadline
+            try:
+                best = self.minimax(initial_state, depth, True)
+            except _SearchTimeout:
+                break  # Keep the previous iteration's answer
+            finally:
+                self._deadline = None
+            self._pv = best[1]
+            self.completed_depth = depth
+            if time.perf_counter() >= deadline:
+                break
+        
+        if best is None:
+            # Not even depth 1 finished: still return a legal move
+            self._root_depth = 1
+            best = self.minimax(initial_state, 1, True)
+            self.completed_depth = 1
+        self._root_depth = self.max_depth
+        return best
 
 
 # Utility function: Coffee quality at different locations
-def create_coffee_utility_function():
+class CoffeeUtility:
     """
-    Create a utility function based on coffee quality at different locations
-    Uses the provided utility values for terminal states
+    Utility function as a plain class so it can be pickled (e.g. sent once to
+    each worker process) - closures cannot
     """
-    # Utility values for terminal states (cities) as provided
-    utility_values = {
-        "Shambu": 4,
-        "Fincha": 5,
-        "Gimbi": 8,
-        "Limu": 8,
-        "Hossana": 6,
-        "Durame": 5,
-        "Bench Naji": 5,
-        "Bench Maji": 5,  # Alternative spelling
-        "Tepi": 6,
-        "Kaffa": 7,
-        "Dilla": 9,
-        "Chiro": 6,
-        "Harar": 10,
-    }
     
-    # Default utility for non-terminal states (can be adjusted)
-    default_utility = 0
+    def __init__(self, utility_values, default_utility=0):
+        """
+        Args:
+            utility_values: {node: coffee quality} for terminal states
+            default_utility: Utility of any other node
+        """
+        self.utility_values = utility_values
+        self.default_utility = default_utility
+        self._ids = None  # node -> position in _vector (built on first batch)
+        self._vector = None
     
-    def utility(node, is_maximizing_player):
+    def __call__(self, node, is_maximizing_player):
         """
         Calculate utility for a node
         
@@ -131,7 +631,7 @@ def create_coffee_utility_function():
             int: Utility value
         """
         # Get utility value for terminal state, or use default
-        base_utility = utility_values.get(node, default_utility)
+        base_utility = self.utility_values.get(node, self.default_utility)
         
         if is_maximizing_player:
             # Agent wants high utility (coffee quality)
@@ -140,24 +640,97 @@ def create_coffee_utility_function():
             # Adversary wants to minimize agent's utility
             return -base_utility
     
-    return utility
+    def batch(self, nodes, is_maximizing_player):
+        """
+        Utilities of many nodes in one call (same values as one call each)
+        
+        Reads a NumPy vector of coffee qualities indexed by node id; the last
+        slot holds the default utility for nodes without a value.
+        
+        Returns:
+            numpy array aligned with nodes
+        """
+        if self._vector is None:
+            self._ids = {node: i for i, node in enumerate(self.utility_values)}
+            self._vector = np.array(list(self.utility_values.values()) + [self.default_utility])
+        ids = np.fromiter(map(self._ids.get, nodes, repeat(len(self._ids))),
+                          dtype=np.intp, count=len(nodes))
+        values = self._vector[ids]
+        return values if is_maximizing_player else -values
+
+
+def create_coffee_utility_function():
+    """
+    Create a utility function based on coffee quality at different locations
+    Uses the provided utility values for terminal states
+    """
+    # Utility values for terminal states (cities) as provided
+    utility_values = {
+        "Shambu": 4,
+        "Fincha": 5,
+        "Gimbi": 8,
+        "Limu": 8,
+        "Hossana": 6,
+        "Durame": 5,
+        "Bench Naji": 5,
+        "Bench Maji": 5,  # Alternative spelling
+        "Tepi": 6,
+        "Kaffa": 7,
+        "Dilla": 9,
+        "Chiro": 6,
+        "Harar": 10,
+    }
+    
+    # Default utility for non-terminal states (can be adjusted)
+    return CoffeeUtility(utility_values, default_utility=0)
 
 
 # Create game graph (simplified version - adjust based on Figure 4)
-def create_adversarial_graph():
+def create_adversarial_graph(snapshot_path=None):
     """
     Create the adversarial game graph
     This represents possible moves for both agent and adversary
+    
+    Args:
+        snapshot_path: Optional graph snapshot file. If it exists the graph is
+                       memory-mapped from it instead of being rebuilt; if it
+                       does not exist yet it is written for the next start
     """
     import sys
     import os
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from question1.graph_converter import create_figure1_graph
+    from question1.graph_converter import GraphConverter, create_figure1_graph
+    
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        return GraphConverter.load_snapshot(snapshot_path)
     
     converter = create_figure1_graph()
+    if snapshot_path is not None:
+        converter.save_snapshot(snapshot_path)
     return converter.get_graph()
 
 
+def create_synthetic_game(num_nodes=2000, branching=4, max_utility=100, seed=0):
+    """
+    Random game graph for benchmarks, much larger than Figure 4
+    
+    Args:
+        num_nodes: Number of locations ("Node 0" ... "Node n-1")
+        branching: Moves available from every location
+        max_utility: Coffee quality is drawn uniformly from 0..max_utility
+        seed: Random seed (same seed, same game)
+        
+    Returns:
+        tuple: (graph, utility_func)
+    """
+    import random
+    rng = random.Random(seed)
+    names = [f"Node {i}" for i in range(num_nodes)]
+    graph = {name: rng.sample(names, branching) for name in names}
+    utility_func = CoffeeUtility({name: rng.randint(0, max_utility) for name in names})
+    return graph, utility_func
+
+
 if __name__ == "__main__":
     # Create adversarial graph
     graph = create_adversarial_graph()
@@ -0,0 +1,176 @@
+"""
+Parallel root-split alpha-beta search for MiniMaxSearch
+
+The agent's root moves are searched in separate worker processes of a
+concurrent.futures.ProcessPoolExecutor, so deep searches use every core.
+
+- The graph and utility function are handed to each worker once, through
+  the pool initializer, and kept in module globals; tasks only carry
+  (move, depth, alpha). With a snapshot path instead of a graph, workers
+  memory-map the same CSR file and nothing is copied at all.
+- Young Brothers Wait: the first (eldest) root move is searched on its own
+  to establish alpha. Its younger brothers are then submitted lazily, at
+  most one per worker at a time, each with the best alpha known when it is
+  submitted, so bounds found by finished workers narrow later searches.
+- Each worker keeps its own MiniMaxSearch (and transposition table) across
+  tasks and searches.
+"""
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question4.minimax_search import MiniMaxSearch
+
+# Per-process search state, set once by _init_worker()
+_worker_search = None
+_worker_generation = None  # Last ParallelMiniMaxSearch.search() this worker served
+
+
+def _init_worker(graph, snapshot_path, utility_func, max_depth, tt_capacity):
+    """Pool initializer: build this worker's MiniMaxSearch once"""
+    global _worker_search
+    if snapshot_path is not None:
+        from question1.csr_graph import CSRGraph
+        graph = CSRGraph.load(snapshot_path)
+    _worker_search = MiniMaxSearch(graph, utility_func, max_depth, tt_capacity)
+
+
+def _ready():
+    """No-op task used to bring a worker up"""
+    return os.getpid()
+
+
+def _search_move(move, depth, alpha, generation):
+    """
+    Worker task: value of one root move (the adversary moves next)
+
+    Returns:
+        tuple: (move, value, path, nodes_searched)
+    """
+    global _worker_generation
+    if generation != _worker_generation:
+        # First task of a new search here: age the killers and history
+        _worker_search._age_move_ordering()
+        _worker_generation = generation
+    _worker_search.nodes_searched = 0
+    _worker_search._root_depth = depth
+    value, path = _worker_search.minimax(move, depth, False, alpha, float('inf'))
+    return move, value, path, _worker_search.nodes_searched
+
+
+class ParallelMiniMaxSearch:
+    """MiniMax with the root moves split across a process pool"""
+
+    def __init__(self, graph, utility_func, max_depth=5, workers=None,
+                 tt_capacity=1 << 16, snapshot_path=None):
+        """
+        Args:
+            graph: Game graph {node: [neighbors]} or CSRGraph
+            utility_func: Picklable function (node, is_max_player) -> utility,
+                          e.g. a CoffeeUtility
+            max_depth: Maximum depth to search
+            workers: Number of worker processes (default: CPU count)
+            tt_capacity: Transposition table slots per worker (0 disables)
+            snapshot_path: Optional CSR snapshot of graph; workers memory-map
+                           it instead of receiving a copy of the graph
+        """
+        self.graph = graph
+        self.utility = utility_func
+        self.max_depth = max_depth
+        self.workers = workers or os.cpu_count() or 1
+        self.tt_capacity = tt_capacity
+        self.snapshot_path = snapshot_path
+        self._executor = None
+        # Orders root moves and searches the eldest brother in this process
+        self._local = MiniMaxSearch(graph, utility_func, max_depth, tt_capacity)
+        self.nodes_searched = 0
+        self.tasks = 0
+        self._searches = 0  # Lets workers tell a new search from the same one
+
+    def _pool(self):
+        """Start the worker processes on first use"""
+        if self._executor is None:
+            graph = None if self.snapshot_path is not None else self.graph
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(graph, self.snapshot_path, self.utility, self.max_depth, self.tt_capacity),
+            )
+        return self._executor
+
+    def start(self):
+        """Bring every worker process up now rather than on the first search"""
+        pool = self._pool()
+        for future in [pool.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self):
+        """Shut the worker processes down"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def search(self, initial_state):
+        """
+        Find the best path for the agent (same result as MiniMaxSearch.search)
+
+        Args:
+            initial_state: Starting node
+
+        Returns:
+            tuple: (best_value, best_path)
+        """
+        local = self._local
+        local.nodes_searched = 0
+        local._age_move_ordering()
+        self._searches += 1
+        depth = self.max_depth
+        if local._is_terminal(initial_state, depth):
+            return local.search(initial_state)
+
+        # Cheap shallow search to order the root moves, best first
+        local._root_depth = min(2, depth)
+        local.minimax(initial_state, min(2, depth), True)
+        # The root entry may have lost its slot to a deeper one
+        entry = local.tt.peek((initial_state, min(2, depth), True)) if local.tt is not None else None
+        moves = local._ordered_moves(initial_state, self.graph[initial_state], min(2, depth),
+                                     entry[3] if entry is not None else None)
+        local._root_depth = depth
+
+        # Eldest brother: searched alone to get a first alpha
+        best_value, path = local.minimax(moves[0], depth - 1, False)
+        best_index, best_path = 0, [initial_state] + path
+        self.nodes_searched = local.nodes_searched
+        self.tasks = 0
+
+        # Younger brothers: one task per move, submitted as workers free up
+        # so each one starts with the tightest alpha known at that point
+        pool = self._pool()
+        pending = {}
+        next_move = 1
+        while next_move < len(moves) or pending:
+            while next_move < len(moves) and len(pending) < self.workers:
+                future = pool.submit(_search_move, moves[next_move], depth - 1, best_value,
+                                     self._searches)
+                pending[future] = (next_move, best_value)
+                next_move += 1
+                self.tasks += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, alpha = pending.pop(future)
+                _, value, path, nodes = future.result()
+                self.nodes_searched += nodes
+                # value <= alpha is only an upper bound (fail low): never better.
+                # Equal exact values keep the earlier move, like the serial search
+                if value > alpha and (value > best_value or (value == best_value and index < best_index)):
+                    best_value, best_index, best_path = value, index, [initial_state] + path
+
+        return best_value, best_path
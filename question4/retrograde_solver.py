@@ -0,0 +1,159 @@
+"""
+Retrograde analysis: minimax values for every city, depth and player at once
+
+MiniMaxSearch solves one starting city at a time. The game value only
+depends on (city, remaining depth, player to move), so all of them can be
+computed bottom-up over the whole graph instead:
+
+    V[0, p, i] = utility(i, p)
+    V[d, max, i] = max over moves i -> j of V[d - 1, min, j]
+    V[d, min, i] = min over moves i -> j of V[d - 1, max, j]
+
+(a city without moves keeps its utility at every depth). Each layer is a
+handful of numpy operations over the graph's CSR arrays: gather the child
+values along the edge targets, then reduce every node's edge range with
+np.maximum.reduceat / np.minimum.reduceat. The best move of every entry is
+kept too, so after one O(depth * edges) pass the game from any start is an
+O(depth) table walk. Tables can be saved to a .npz file and loaded later.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from question1.csr_graph import CSRGraph
+
+MAX, MIN = 0, 1  # Player index in the tables
+
+
+class RetrogradeSolver:
+    """Bottom-up minimax table over (depth, player, node id)"""
+
+    def __init__(self, graph, utility_func, max_depth=5):
+        """
+        Solve every (city, remaining depth <= max_depth, player) position
+
+        Args:
+            graph: Dictionary representing the game graph {node: [neighbors]},
+                   or an unweighted CSRGraph
+            utility_func: Function (node, is_max_player) -> utility
+            max_depth: Deepest remaining depth to tabulate
+        """
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        self.names = csr.names
+        self.index = csr.index
+        self.max_depth = max_depth
+        n = csr.num_nodes
+        offsets = np.asarray(csr.offsets, dtype=np.int64)
+        targets = np.asarray(csr.targets, dtype=np.int64)
+
+        leaf = np.empty((2, n), dtype=np.float64)
+        for node_id in range(n):
+            name = self.names[node_id]
+            leaf[MAX, node_id] = utility_func(name, True)
+            leaf[MIN, node_id] = utility_func(name, False)
+        # Integer utilities (the coffee table) stay exact as int64
+        if np.array_equal(leaf, np.round(leaf)):
+            leaf = leaf.astype(np.int64)
+
+        # values[d, p, i] and best_moves[d, p, i] (node id, -1 at terminals)
+        self.values = np.empty((max_depth + 1, 2, n), dtype=leaf.dtype)
+        self.best_moves = np.full((max_depth + 1, 2, n), -1, dtype=np.int32)
+        self.values[0] = leaf
+
+        degree = np.diff(offsets)
+        movable = np.flatnonzero(degree > 0)
+        starts = offsets[:-1][movable]
+        edge_ids = np.arange(len(targets))
+        for depth in range(1, max_depth + 1):
+            self.values[depth] = leaf  # Cities without moves keep their utility
+            for player, reduce in ((MAX, np.maximum), (MIN, np.minimum)):
+                if not len(movable):
+                    continue
+                child_values = self.values[depth - 1, 1 - player][targets]
+                best = reduce.reduceat(child_values, starts)
+                # First edge reaching the best value, per node
+                is_best = child_values == np.repeat(best, degree[movable])
+                first = np.minimum.reduceat(np.where(is_best, edge_ids, len(targets)), starts)
+                self.values[depth, player, movable] = best
+                self.best_moves[depth, player, movable] = targets[first]
+
+    def value(self, node, depth, is_maximizing_player=True):
+        """
+        Minimax value of a position (what MiniMaxSearch.minimax returns)
+
+        Args:
+            node: City name
+            depth: Remaining depth (at most max_depth)
+            is_maximizing_player: True if the agent is to move
+        """
+        player = MAX if is_maximizing_player else MIN
+        return self.values[self._check_depth(depth), player, self._node_id(node)].item()
+
+    def search(self, initial_state, depth=None):
+        """
+        Best path for the agent, like MiniMaxSearch.search, by table lookups
+
+        Args:
+            initial_state: Starting city
+            depth: Remaining depth (default: max_depth)
+
+        Returns:
+            tuple: (best_value, best_path)
+        """
+        depth = self.max_depth if depth is None else self._check_depth(depth)
+        node_id = self._node_id(initial_state)
+        value = self.values[depth, MAX, node_id].item()
+        path = [initial_state]
+        player = MAX
+        while depth > 0:
+            node_id = int(self.best_moves[depth, player, node_id])
+            if node_id < 0:
+                break  # No moves from here
+            path.append(self.names[node_id])
+            depth -= 1
+            player = 1 - player
+        return value, path
+
+    def _check_depth(self, depth):
+        if not 0 <= depth <= self.max_depth:
+            raise ValueError(f"depth must be between 0 and {self.max_depth}, got {depth}")
+        return depth
+
+    def _node_id(self, node):
+        node_id = self.index.get(node)
+        if node_id is None:
+            raise KeyError(node)
+        return node_id
+
+    def save(self, path):
+        """
+        Write the solved tables to a .npz file
+
+        Args:
+            path: Output file path
+        """
+        np.savez(path, names=np.array(list(self.names), dtype=str),
+                 values=self.values, best_moves=self.best_moves)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read tables written by save(); no graph or utility function is needed
+
+        Args:
+            path: File written by save()
+
+        Returns:
+            RetrogradeSolver: Ready to answer value() and search()
+        """
+        solver = cls.__new__(cls)
+        with np.load(path) as data:
+            solver.names = [str(name) for name in data['names']]
+            solver.values = data['values']
+            solver.best_moves = data['best_moves']
+        solver.index = {name: node_id for node_id, name in enumerate(solver.names)}
+        solver.max_depth = len(solver.values) - 1
+        return solver
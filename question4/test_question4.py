@@ -4,9 +4,15 @@ Test cases for Question 4
 
 import sys
 import os
+import random
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from question4.minimax_search import MiniMaxSearch, create_coffee_utility_function, create_adversarial_graph
+from question4.minimax_search import (MiniMaxSearch, CoffeeUtility, create_coffee_utility_function,
+                                      create_adversarial_graph, create_synthetic_game)
+from question4.parallel_minimax import ParallelMiniMaxSearch
+from question4.mcts_search import MCTSSearch
+from question4.retrograde_solver import RetrogradeSolver
 
 
 def test_question4():
@@ -40,6 +46,197 @@ def test_question4():
     else:
         print(f"   [FAIL] MiniMax: No path found")
     
+    # Transposition table must not change the minimax value
+    deep = MiniMaxSearch(graph, utility_func, max_depth=8)
+    deep_value, deep_path = deep.search(initial)
+    plain_value, _ = MiniMaxSearch(graph, utility_func, max_depth=8, tt_capacity=0).search(initial)
+    stats = deep.tt.stats()
+    if deep_value == plain_value:
+        print(f"   [OK] Transposition table (depth 8): same value {deep_value}, "
+              f"hit rate {stats['hit_rate']:.0%}, {stats['cutoffs']} positions reused")
+    else:
+        print(f"   [FAIL] Transposition table: value {deep_value}, expected {plain_value}")
+    
+    # The principal variation comes from the PV table: a legal line whose
+    # last position is worth the minimax value
+    legal = all(move in graph[node] for node, move in zip(deep_path, deep_path[1:]))
+    final_value = utility_func(deep_path[-1], len(deep_path) % 2 == 1)
+    if legal and final_value == deep_value:
+        print(f"   [OK] Principal variation (depth 8): {len(deep_path) - 1} legal moves ending at {deep_path[-1]}")
+    else:
+        print(f"   [FAIL] Principal variation: {deep_path}")
+    
+    # On a random game, every move of the PV must keep the brute-force
+    # minimax value (the line may differ between equally good moves)
+    pv_game, pv_utility = create_synthetic_game(500, 3, seed=4)
+    exact = {}
+    def brute_force(node, depth, is_max):
+        key = (node, depth, is_max)
+        if key not in exact:
+            moves = pv_game.get(node, [])
+            if depth == 0 or not moves:
+                exact[key] = pv_utility(node, is_max)
+            else:
+                values = [brute_force(move, depth - 1, not is_max) for move in moves]
+                exact[key] = max(values) if is_max else min(values)
+        return exact[key]
+    wrong_lines = []
+    for engine in ('recursive', 'iterative'):
+        for start in range(0, 500, 50):
+            node = f"Node {start}"
+            value, path = MiniMaxSearch(pv_game, pv_utility, 6, engine=engine).search(node)
+            on_line = [brute_force(city, 6 - ply, ply % 2 == 0) for ply, city in enumerate(path)]
+            if (any(move not in pv_game[city] for city, move in zip(path, path[1:]))
+                    or set(on_line) != {value} or (len(path) < 7 and pv_game.get(path[-1]))):
+                wrong_lines.append((engine, node))
+    if not wrong_lines:
+        print("   [OK] Principal variations match brute-force minimax on a random game")
+    else:
+        print(f"   [FAIL] Principal variation differs from brute force: {wrong_lines}")
+    
+    # Repeated searches with a tiny table on small games full of
+    # transpositions: bound cutoffs must never copy a truncated line
+    truncated = []
+    for seed in range(10):
+        rng = random.Random(seed)
+        cities = [f"City {i}" for i in range(12)]
+        small = {city: rng.sample(cities, 3) for city in cities}
+        small_utility = CoffeeUtility({city: rng.randint(0, 9) for city in cities})
+        for engine in ('recursive', 'iterative'):
+            repeated = MiniMaxSearch(small, small_utility, 6, tt_capacity=64, engine=engine)
+            for start in cities:
+                for _ in range(2):
+                    _, line = repeated.search(start, time_budget=10)
+                    if len(line) != 7 or any(move not in small[city] for city, move in zip(line, line[1:])):
+                        truncated.append((seed, engine, start, len(line)))
+    if not truncated:
+        print("   [OK] Full, legal principal variations across repeated searches with a 64-slot table")
+    else:
+        print(f"   [FAIL] Truncated or illegal principal variations: {truncated[:3]}")
+    
+    # Killers and history from an earlier root must not pile up
+    ordering = MiniMaxSearch(pv_game, pv_utility, 6)
+    ordering.search("Node 0")
+    ordering._killers[0] = ["Stale killer"]
+    ordering._history[("Node 0", "Stale move")] = 1
+    ordering.search("Node 1")
+    if "Stale killer" not in ordering._killers.get(0, []) and ("Node 0", "Stale move") not in ordering._history:
+        print(f"   [OK] Killers cleared and history aged between searches ({len(ordering._history)} scores kept)")
+    else:
+        print("   [FAIL] Move-ordering state carried over between searches")
+    
+    # Explicit-stack engine: same result, and no recursion limit
+    iterative = MiniMaxSearch(graph, utility_func, max_depth=8, engine='iterative')
+    iterative_result = iterative.search(initial)
+    chain = {f"Step {i}": [f"Step {i + 1}", f"Exit {i}"] for i in range(3000)}
+    chain_value, chain_path = MiniMaxSearch(chain, CoffeeUtility({}), 3000, tt_capacity=0,
+                                            engine='iterative').search("Step 0")
+    if iterative_result == (deep_value, deep_path) and len(chain_path) > 1:
+        print("   [OK] Iterative engine: same result as recursive, 3000-ply chain searched")
+    else:
+        print(f"   [FAIL] Iterative engine: {iterative_result}, expected {(deep_value, deep_path)}")
+    
+    # No-revisit rule: the line never returns to a city, both engines agree,
+    # and the tree is much smaller than the plain one
+    plain = MiniMaxSearch(graph, utility_func, max_depth=10, tt_capacity=0)
+    plain.search(initial)
+    no_revisit = MiniMaxSearch(graph, utility_func, max_depth=10, tt_capacity=0, no_revisit=True)
+    no_revisit_result = no_revisit.search(initial)
+    iterative_result = MiniMaxSearch(graph, utility_func, max_depth=10, engine='iterative',
+                                     no_revisit=True).search(initial)
+    line = no_revisit_result[1]
+    if len(set(line)) == len(line) and iterative_result == no_revisit_result \
+            and no_revisit.nodes_searched < plain.nodes_searched:
+        print(f"   [OK] No-revisit (depth 10): {no_revisit.nodes_searched} nodes instead of "
+              f"{plain.nodes_searched}, line ends at {line[-1]}")
+    else:
+        print(f"   [FAIL] No-revisit: {no_revisit_result}, iterative {iterative_result}")
+    
+    # Batched leaves: one utility call per depth-1 position, same value
+    batched_value, batched_path = MiniMaxSearch(graph, utility_func, max_depth=8,
+                                                batch_leaves=True).search(initial)
+    leaf_values = utility_func.batch(graph[initial], True)
+    if batched_value == plain_value and list(leaf_values) == [utility_func(city, True) for city in graph[initial]]:
+        print(f"   [OK] Batched leaf evaluation: same value {batched_value}, line ends at {batched_path[-1]}")
+    else:
+        print(f"   [FAIL] Batched leaf evaluation: value {batched_value}, expected {plain_value}")
+    
+    # Iterative deepening: a generous budget reaches max_depth with the same
+    # value; a tiny one still returns a legal first move
+    timed = MiniMaxSearch(graph, utility_func, max_depth=8)
+    timed_value, timed_path = timed.search(initial, time_budget=5.0)
+    _, quick_path = MiniMaxSearch(graph, utility_func, max_depth=30).search(initial, time_budget=0.01)
+    if timed_value == plain_value and timed.completed_depth == 8 and quick_path[1] in graph[initial]:
+        print(f"   [OK] Iterative deepening: value {timed_value} at depth {timed.completed_depth}, "
+              f"time-limited move {quick_path[1]}")
+    else:
+        print(f"   [FAIL] Iterative deepening: value {timed_value}, depth {timed.completed_depth}")
+    
+    # Retrograde table: every city's value in one pass, saved and reloaded
+    solver = RetrogradeSolver(graph, utility_func, max_depth=6)
+    with tempfile.TemporaryDirectory() as folder:
+        table_path = os.path.join(folder, "retrograde.npz")
+        solver.save(table_path)
+        loaded = RetrogradeSolver.load(table_path)
+    wrong = [city for city in graph
+             if loaded.search(city)[0] != MiniMaxSearch(graph, utility_func, 6).search(city)[0]]
+    if not wrong:
+        print(f"   [OK] Retrograde table: depth-6 values for all {len(graph)} cities match MiniMax")
+    else:
+        print(f"   [FAIL] Retrograde table: wrong values for {wrong}")
+    rejected = 0
+    for depth in (-1, 7):
+        try:
+            solver.search(initial, depth)
+        except ValueError:
+            rejected += 1
+    if rejected == 2:
+        print("   [OK] Retrograde table rejects depths outside 0..max_depth")
+    else:
+        print("   [FAIL] Retrograde table accepted a depth outside 0..max_depth")
+    
+    # MCTS on a larger random game: its move must be a minimax-optimal one,
+    # and the subtree below the played moves is kept for the next search
+    game, game_utility = create_synthetic_game(3000, 4, seed=2)
+    exact_value, _ = MiniMaxSearch(game, game_utility, 3).search("Node 0")
+    mcts = MCTSSearch(game, game_utility, max_depth=3, iterations=10000, seed=1)
+    _, mcts_path = mcts.search("Node 0")
+    move_value, _ = MiniMaxSearch(game, game_utility, 2).minimax(mcts_path[1], 2, False)
+    mcts.advance(mcts_path[1])
+    mcts.advance(mcts_path[2])
+    mcts.search(mcts_path[2], plies=1)
+    if move_value == exact_value and mcts.reused_visits > 0:
+        print(f"   [OK] MCTS: optimal move {mcts_path[1]} (value {exact_value}), "
+              f"{mcts.reused_visits} visits reused after two moves")
+    else:
+        print(f"   [FAIL] MCTS: move {mcts_path[1]} worth {move_value}, expected {exact_value}")
+    
+    # An expired budget still yields a legal move
+    quick_paths = [MCTSSearch(game, game_utility, max_depth=3, **budget).search("Node 0")[1]
+                   for budget in ({'time_budget': 0}, {'iterations': 0})]
+    if all(len(path) > 1 and path[1] in game["Node 0"] for path in quick_paths):
+        print("   [OK] MCTS returns a legal move with a zero time or iteration budget")
+    else:
+        print(f"   [FAIL] MCTS with a zero budget: {quick_paths}")
+    
+    # Root-split parallel search must agree with the sequential value
+    with ParallelMiniMaxSearch(graph, utility_func, max_depth=8, workers=2) as parallel:
+        parallel_value, parallel_path = parallel.search(initial)
+    if parallel_value == plain_value and parallel_path[1] in graph[initial]:
+        print(f"   [OK] Parallel search (2 workers): value {parallel_value} "
+              f"over {parallel.tasks} root tasks")
+    else:
+        print(f"   [FAIL] Parallel search: value {parallel_value}, expected {plain_value}")
+    
+    # A tiny transposition table loses root entries between searches
+    with ParallelMiniMaxSearch(game, game_utility, max_depth=4, workers=2, tt_capacity=1) as parallel:
+        tiny_values = [parallel.search(f"Node {i}")[0] for i in range(6)]
+    expected = [MiniMaxSearch(game, game_utility, 4).search(f"Node {i}")[0] for i in range(6)]
+    if tiny_values == expected:
+        print("   [OK] Parallel search with a 1-slot transposition table: 6 searches on one instance")
+    else:
+        print(f"   [FAIL] Parallel search with a 1-slot table: {tiny_values}, expected {expected}")
+    
     print("\n" + "=" * 60)
 
 
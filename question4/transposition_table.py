@@ -0,0 +1,113 @@
+"""
+Transposition table for MiniMax search
+
+On the undirected Figure 1 graph the same position (node, remaining depth,
+player to move) is reached through many different move orders. The table
+remembers what an earlier search of that position found, so it is not
+searched again.
+
+Under alpha-beta a stored value is not always exact: a search that was cut
+off only proves a bound. Every entry therefore records its bound type:
+
+    EXACT        value is the minimax value
+    LOWER_BOUND  value failed high (true value >= value)
+    UPPER_BOUND  value failed low  (true value <= value)
+
+The table has a fixed number of slots indexed by the key's hash. On a
+collision the entry searched to the greater depth is kept (depth-preferred),
+since it saved more work.
+"""
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    """Fixed-capacity, depth-preferred transposition table with hit statistics"""
+
+    def __init__(self, capacity=1 << 16):
+        """
+        Args:
+            capacity: Number of slots (memory stays fixed however long the search)
+        """
+        self.capacity = capacity
+        self._slots = [None] * capacity  # (key, depth, value, flag, best_move)
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the probe/hit/store counters"""
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0  # Hits that answered a position without searching it
+        self.stores = 0
+        self.replacements = 0  # Stores that evicted a different position
+        self.rejected = 0  # Stores dropped because the slot held a deeper entry
+
+    def lookup(self, key):
+        """
+        Return (depth, value, flag, best_move) for key, or None
+
+        Args:
+            key: Position key, e.g. (node, depth, is_maximizing_player)
+        """
+        self.probes += 1
+        entry = self._slots[hash(key) % self.capacity]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1:]
+        return None
+
+    def peek(self, key):
+        """Like lookup() but without touching the statistics"""
+        entry = self._slots[hash(key) % self.capacity]
+        if entry is not None and entry[0] == key:
+            return entry[1:]
+        return None
+
+    def store(self, key, depth, value, flag, best_move=None):
+        """
+        Record a search result, keeping the deeper entry on a collision
+
+        Args:
+            key: Position key
+            depth: Remaining depth the position was searched to
+            value: Value found
+            flag: EXACT, LOWER_BOUND or UPPER_BOUND
+            best_move: Best successor found (tried first next time)
+        """
+        index = hash(key) % self.capacity
+        entry = self._slots[index]
+        if entry is not None and entry[0] != key:
+            if entry[1] > depth:
+                self.rejected += 1
+                return
+            self.replacements += 1
+        self._slots[index] = (key, depth, value, flag, best_move)
+        self.stores += 1
+
+    def clear(self):
+        """Drop every entry (statistics are kept)"""
+        self._slots = [None] * self.capacity
+
+    def __len__(self):
+        return sum(entry is not None for entry in self._slots)
+
+    @property
+    def hit_rate(self):
+        """Fraction of probes that found their position"""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self):
+        """Summary dictionary for reporting"""
+        return {
+            'capacity': self.capacity,
+            'entries': len(self),
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate,
+            'cutoffs': self.cutoffs,
+            'stores': self.stores,
+            'replacements': self.replacements,
+            'rejected': self.rejected,
+        }
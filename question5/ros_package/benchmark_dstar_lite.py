@@ -0,0 +1,91 @@
+"""
+Benchmark: D* Lite replanning vs planning from scratch after road changes
+Changes the cost of k random roads (traffic), and closes then reopens k
+roads of the robot's current route (the worst case), on synthetic road
+grids. Each repair is compared with a fresh search on the changed graph;
+both must find the same cost. Does not need ROS.
+"""
+
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from question2.graph_with_costs import create_synthetic_graph
+from dstar_lite import DStarLite, INF
+
+
+def _fresh_plan(planner, goal):
+    """Plan from scratch on the planner's current road costs"""
+    fresh = DStarLite({city: list(successors.items()) for city, successors in planner.successors.items()},
+                      planner.start, goal)
+    start = time.perf_counter()
+    expanded = fresh.plan()
+    seconds = time.perf_counter() - start
+    assert fresh.cost == planner.cost
+    return expanded, seconds
+
+
+def _replan(planner):
+    start = time.perf_counter()
+    expanded = planner.plan()
+    return expanded, time.perf_counter() - start
+
+
+def run_benchmark(sizes=(30, 60, 120), change_sizes=(1, 16, 256), closures=(1, 4), trials=10, seed=0):
+    print("=" * 60)
+    print("D* Lite benchmark: incremental replan vs fresh search")
+    print("=" * 60)
+    rng = random.Random(seed)
+
+    for size in sizes:
+        graph = create_synthetic_graph(size, size, seed=seed)
+        goal = f"City {size - 1}-{size - 1}"
+        planner = DStarLite(graph, "City 0-0", goal)
+        expanded, seconds = _replan(planner)
+        roads = [(a, b) for a in planner.successors for b in planner.successors[a]]
+        print(f"\n{size}x{size} grid ({len(planner.successors)} cities, {len(roads)} roads): "
+              f"first plan {expanded} expansions, {seconds * 1000:.1f} ms")
+
+        def report(label, totals):
+            replan_expanded, replan_seconds, fresh_expanded, fresh_seconds, plans = totals
+            print(f"  {label:<24} replan {replan_expanded / plans:7.1f} expansions "
+                  f"{replan_seconds / plans * 1000:7.2f} ms | fresh {fresh_expanded / plans:7.1f} "
+                  f"expansions {fresh_seconds / plans * 1000:7.2f} ms")
+
+        # Traffic: k random roads get a new cost (some close), the robot drives on
+        for k in change_sizes:
+            totals = [0, 0, 0, 0, 0]
+            for _ in range(trials):
+                for a, b in rng.sample(roads, k):
+                    planner.update_edge(a, b, INF if rng.random() < 0.1 else rng.randint(1, 20))
+                for i, value in enumerate(_replan(planner) + _fresh_plan(planner, goal)):
+                    totals[i] += value
+                totals[4] += 1
+                path = planner.path()
+                if path and len(path) > 2:
+                    planner.move_to(path[1])
+            report(f"{k} random roads changed", totals)
+
+        # Worst case: close k roads of the current route, replan, reopen them
+        for k in closures:
+            totals = [0, 0, 0, 0, 0]
+            for _ in range(trials):
+                path = planner.path()
+                if not path or len(path) < 3:
+                    break
+                first = rng.randrange(len(path) - 1)
+                closed = list(zip(path, path[1:]))[first:first + k]
+                old_costs = [planner.successors[a][b] for a, b in closed]
+                for costs in ([INF] * len(closed), old_costs):
+                    for (a, b), cost in zip(closed, costs):
+                        planner.update_road(a, b, cost)
+                    for i, value in enumerate(_replan(planner) + _fresh_plan(planner, goal)):
+                        totals[i] += value
+                    totals[4] += 1
+            report(f"{k} route roads closed", totals)
+
+
+if __name__ == "__main__":
+    run_benchmark()
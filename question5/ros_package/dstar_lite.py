@@ -0,0 +1,187 @@
+"""
+D* Lite: incremental replanning on a weighted road graph
+
+D* Lite (Koenig & Likhachev, 2002) searches backwards from the goal and
+keeps its search state (g and rhs values plus a priority queue of
+inconsistent cities) between plans:
+
+- When a road's cost changes (a closure is cost inf), only the city at its
+  tail is updated; the next plan() repairs the part of the shortest-path
+  tree the change affects and stops as soon as the robot's city is
+  consistent again.
+- When the robot moves (or deviates from its route), move_to() shifts the
+  start and adds the heuristic distance travelled to the key modifier km
+  instead of reordering the queue.
+
+So a replan costs about the size of the change, not the size of the graph.
+This module does not depend on ROS; ROSPathPlanner wraps it.
+"""
+
+import heapq
+import math
+
+INF = math.inf
+
+
+class DStarLite:
+    """Incremental shortest path from a moving start to a fixed goal"""
+
+    def __init__(self, graph, start, goal, heuristic=None):
+        """
+        Initialize the planner (nothing is searched until plan())
+
+        Args:
+            graph: GraphWithCosts or adjacency dict {node: [(neighbor, cost), ...]};
+                   edge costs are copied, so updates never touch the graph
+            start: The robot's city
+            goal: Target city
+            heuristic: Optional consistent estimate h(a, b) of the cost
+                       between two cities (default: 0, an incremental Dijkstra)
+        """
+        adjacency = graph.get_graph() if hasattr(graph, 'get_graph') else graph
+        self.successors = {}  # {u: {v: cost}}
+        self.predecessors = {}  # {v: {u: cost}}
+        for node, neighbors in adjacency.items():
+            for neighbor, cost in neighbors:
+                self._set_cost(node, neighbor, cost)
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic or (lambda a, b: 0)
+
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.km = 0
+        self._last = start
+        self._queue = []  # Heap of (key, node); stale entries are skipped
+        self._queued = {}  # node -> current key
+        self._push(goal)
+        self.expanded = 0  # Cities expanded over the planner's lifetime
+        self.last_expanded = 0  # Cities expanded by the last plan()
+
+    def _set_cost(self, u, v, cost):
+        self.successors.setdefault(u, {})[v] = cost
+        self.predecessors.setdefault(v, {})[u] = cost
+
+    def _key(self, node):
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + self.heuristic(self.start, node) + self.km, best)
+
+    def _push(self, node):
+        key = self._key(node)
+        self._queued[node] = key
+        heapq.heappush(self._queue, (key, node))
+
+    def _top(self):
+        """Smallest current (key, node) in the queue, or None"""
+        queue = self._queue
+        while queue:
+            key, node = queue[0]
+            if self._queued.get(node) == key:
+                return key, node
+            heapq.heappop(queue)  # Superseded or removed entry
+        return None
+
+    def _update_vertex(self, node):
+        """Recompute rhs(node) from its successors and requeue it if inconsistent"""
+        if node != self.goal:
+            g = self.g
+            self.rhs[node] = min((cost + g.get(successor, INF)
+                                  for successor, cost in self.successors.get(node, {}).items()),
+                                 default=INF)
+        self._queued.pop(node, None)
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self._push(node)
+
+    def plan(self, should_stop=None):
+        """
+        Repair the search until the start city is consistent
+
+        Args:
+            should_stop: Optional function polled every 256 expansions; when it
+                         returns True the repair stops early. The search state
+                         stays valid, so the next plan() carries on from there
+
+        Returns:
+            int: Cities expanded by this call
+        """
+        expanded = 0
+        g, rhs = self.g, self.rhs
+        while True:
+            if should_stop is not None and not expanded & 255 and expanded and should_stop():
+                break
+            top = self._top()
+            start_g, start_rhs = g.get(self.start, INF), rhs.get(self.start, INF)
+            if top is None or (top[0] >= self._key(self.start) and start_rhs <= start_g):
+                break
+            old_key, node = top
+            new_key = self._key(node)
+            expanded += 1
+            if old_key < new_key:
+                self._push(node)  # km grew since it was queued
+            elif g.get(node, INF) > rhs.get(node, INF):
+                # Overconsistent: the cost went down, settle it
+                g[node] = rhs[node]
+                del self._queued[node]
+                for predecessor in self.predecessors.get(node, ()):
+                    self._update_vertex(predecessor)
+            else:
+                # Underconsistent: the cost went up, reopen it and its parents
+                g[node] = INF
+                self._update_vertex(node)
+                for predecessor in self.predecessors.get(node, ()):
+                    self._update_vertex(predecessor)
+        self.expanded += expanded
+        self.last_expanded = expanded
+        return expanded
+
+    @property
+    def cost(self):
+        """Cost of the current plan from start to goal (inf if unreachable)"""
+        return self.rhs.get(self.start, INF)
+
+    def path(self):
+        """
+        Current best route, following the cheapest successor from the start
+
+        Returns:
+            list: Cities from start to goal, or None if the goal is unreachable
+        """
+        if self.cost == INF:
+            return None
+        g = self.g
+        path = [self.start]
+        node = self.start
+        seen = {node}
+        while node != self.goal:
+            node = min(self.successors.get(node, {}).items(),
+                       key=lambda item: item[1] + g.get(item[0], INF))[0]
+            if node in seen:
+                return None  # Only possible if plan() was not called after a change
+            seen.add(node)
+            path.append(node)
+        return path
+
+    def move_to(self, node):
+        """
+        The robot is now at node (the next city on the route, or anywhere else)
+        """
+        self.km += self.heuristic(self._last, node)
+        self._last = node
+        self.start = node
+
+    def update_edge(self, u, v, cost):
+        """
+        Change the cost of road u -> v (INF closes it; a new road is added)
+
+        Args:
+            u: Tail city
+            v: Head city
+            cost: New cost
+        """
+        self._set_cost(u, v, cost)
+        self._update_vertex(u)
+
+    def update_road(self, a, b, cost):
+        """Change a two-way road: both a -> b and b -> a"""
+        self.update_edge(a, b, cost)
+        self.update_edge(b, a, cost)
@@ -3,6 +3,14 @@
 Question 5.3: ROS-based path planner using uninformed search strategy
 This node uses BFS or DFS to generate a path for the robot to travel
 from any given initial state to the given goal state.
+
+With strategy='dstar_lite' it plans on the weighted road graph (Figure 2)
+with D* Lite instead and replans incrementally: road cost changes arrive
+on /edge_update and only the affected part of the search is repaired.
+
+Planning runs in a background thread so the 10 Hz control loop never waits
+for a search: the planner hands each finished plan over under a lock, and a
+new goal on /goal_state or a road change preempts the plan in progress.
 """
 
 import rospy
@@ -11,54 +19,82 @@ from nav_msgs.msg import Odometry
 from std_msgs.msg import String
 import sys
 import os
+import threading
 
 # Add parent directory to path to import search algorithms
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question1.search_algorithm import SearchAlgorithm
-from question1.graph_converter import create_figure1_graph
+from question1.graph_converter import GraphConverter, create_figure1_graph
+from question2.graph_with_costs import create_figure2_graph
+from dstar_lite import DStarLite, INF
 
 
 class ROSPathPlanner:
     """ROS node for path planning using uninformed search"""
     
-    def __init__(self, initial_state, goal_state, strategy='bfs'):
+    def __init__(self, initial_state, goal_state, strategy='bfs', snapshot_path=None):
         """
         Initialize the path planner
         
         Args:
             initial_state: Starting location
             goal_state: Target location
-            strategy: 'bfs' or 'dfs'
+            strategy: 'bfs', 'dfs' or 'dstar_lite'
+            snapshot_path: Optional graph snapshot file; memory-mapped if it
+                           exists, otherwise written after building the graph
         """
         rospy.init_node('path_planner', anonymous=True)
         
         # Create graph and search algorithm
-        converter = create_figure1_graph()
-        graph = converter.get_graph()
-        self.search_alg = SearchAlgorithm(graph)
+        self.dstar = None
+        if strategy == 'dstar_lite':
+            # Weighted roads; the search state is kept across replans
+            self.dstar = DStarLite(create_figure2_graph(), initial_state, goal_state)
+        elif snapshot_path and os.path.exists(snapshot_path):
+            graph = GraphConverter.load_snapshot(snapshot_path)
+            rospy.loginfo(f"Loaded graph snapshot {snapshot_path}")
+        else:
+            converter = create_figure1_graph()
+            if snapshot_path:
+                converter.save_snapshot(snapshot_path)
+            graph = converter.get_graph()
+        self.search_alg = None if self.dstar is not None else SearchAlgorithm(graph)
         
         self.initial_state = initial_state
         self.goal_state = goal_state
         self.strategy = strategy
         
+        # Current position
+        self.current_position = None
+        self.current_path = None
+        self.path_index = 0
+        self.last_reached = None  # Last waypoint the robot reached
+        
+        # Planning thread state; the lock guards the plan, its requests and
+        # the waypoint progress, the search objects belong to the thread
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._generation = 0  # Bumped by every plan request; older plans are dropped
+        self._pending_edges = []
+        self._planner_thread = threading.Thread(target=self._planning_loop, daemon=True)
+        
         # Publishers and Subscribers
         self.cmd_vel_pub = rospy.Publisher('/cmd_vel', Twist, queue_size=10)
         self.path_pub = rospy.Publisher('/planned_path', String, queue_size=10)
         self.odom_sub = rospy.Subscriber('/odom', Odometry, self.odom_callback)
+        self.edge_sub = rospy.Subscriber('/edge_update', String, self.edge_update_callback)
+        self.goal_sub = rospy.Subscriber('/goal_state', String, self.goal_callback)
         
         # State coordinates (from world file)
         self.state_coordinates = self.load_state_coordinates()
         
-        # Current position
-        self.current_position = None
-        self.current_path = None
-        self.path_index = 0
-        
         # Control parameters
         self.linear_speed = 0.2
         self.angular_speed = 0.5
         self.distance_threshold = 0.5  # meters
         
+        self._planner_thread.start()
+        
     def load_state_coordinates(self):
         """
         Load state coordinates from world file
@@ -82,30 +118,115 @@ class ROSPathPlanner:
             msg.pose.pose.position.z
         )
     
-    def plan_path(self):
-        """Plan path from initial to goal state"""
-        rospy.loginfo(f"Planning path from {self.initial_state} to {self.goal_state} using {self.strategy.upper()}")
+    def edge_update_callback(self, msg):
+        """
+        Callback for road cost changes: "From,To,cost" on a two-way road,
+        with cost "inf" (or "blocked") for a closed road
+        """
+        if self.dstar is None:
+            rospy.logwarn("Edge updates need strategy 'dstar_lite'; ignored")
+            return
+        try:
+            a, b, cost = [field.strip() for field in msg.data.split(',')]
+            cost = INF if cost.lower() in ('inf', 'blocked') else float(cost)
+        except ValueError:
+            rospy.logwarn(f"Malformed edge update: {msg.data!r}")
+            return
+        rospy.loginfo(f"Road {a} <-> {b} now costs {cost}")
+        with self._lock:
+            self._pending_edges.append((a, b, cost))
+        self.request_plan()
+    
+    def goal_callback(self, msg):
+        """Callback for a new goal city; preempts the current plan"""
+        rospy.loginfo(f"New goal: {msg.data}")
+        self.request_plan(msg.data.strip())
+    
+    def request_plan(self, goal_state=None):
+        """
+        Ask the planning thread for a new plan from the robot's current city
         
-        path, explored = self.search_alg.search(
-            self.initial_state, 
-            self.goal_state, 
-            strategy=self.strategy
-        )
+        Any plan still being computed is preempted: D* Lite stops its repair
+        early, and a BFS/DFS result that arrives late is dropped.
         
-        if path:
-            self.current_path = path
-            self.path_index = 0
+        Args:
+            goal_state: Optional new target location
+        """
+        with self._wakeup:
+            if goal_state is not None:
+                self.goal_state = goal_state
+            self._generation += 1
+            self._wakeup.notify()
+    
+    def plan_path(self):
+        """Plan path from initial to goal state (in the planning thread)"""
+        rospy.loginfo(f"Planning path from {self.initial_state} to {self.goal_state} using {self.strategy.upper()}")
+        self.request_plan()
+    
+    def _planning_loop(self):
+        """Planning thread: serve the latest request, then hand the plan over"""
+        handled = 0
+        while not rospy.is_shutdown():
+            with self._wakeup:
+                if self._generation == handled:
+                    self._wakeup.wait(0.5)
+                    continue
+                generation = self._generation
+                start = self.last_reached or self.initial_state
+                goal = self.goal_state
+                edges, self._pending_edges = self._pending_edges, []
             
-            # Publish path
-            path_str = " -> ".join(path)
-            self.path_pub.publish(path_str)
-            rospy.loginfo(f"Path found: {path_str}")
-            rospy.loginfo(f"Path length: {len(path) - 1} edges")
+            path = self._plan(start, goal, edges, lambda: self._generation != generation)
+            handled = generation
             
-            return True
-        else:
-            rospy.logwarn(f"No path found from {self.initial_state} to {self.goal_state}")
-            return False
+            with self._lock:
+                if generation != self._generation:
+                    continue  # Preempted: a newer request is waiting
+                if path:
+                    self.current_path = path
+                    # The robot already stands on path[0] once it has reached it
+                    self.path_index = 1 if path[0] == self.last_reached else 0
+                else:
+                    self.current_path = None
+            
+            if path:
+                path_str = " -> ".join(path)
+                self.path_pub.publish(path_str)
+                rospy.loginfo(f"Path found: {path_str}")
+                rospy.loginfo(f"Path length: {len(path) - 1} edges")
+            else:
+                rospy.logwarn(f"No path found from {start} to {goal}")
+    
+    def _plan(self, start, goal, edges, preempted):
+        """
+        Search for a path (planning thread only)
+        
+        Args:
+            start: Robot's current city
+            goal: Target city
+            edges: Road changes (a, b, cost) received since the last plan
+            preempted: Function returning True once a newer request arrived
+        
+        Returns:
+            list: Path from start to goal, or None
+        """
+        if self.dstar is None:
+            path, explored = self.search_alg.search(start, goal, strategy=self.strategy)
+            return path
+        
+        if self.dstar.goal != goal:
+            # D* Lite searches back from the goal: start over, keeping the road costs
+            self.dstar = DStarLite({city: list(roads.items()) for city, roads in self.dstar.successors.items()},
+                                   start, goal)
+        elif self.dstar.start != start:
+            self.dstar.move_to(start)
+        for a, b, cost in edges:
+            self.dstar.update_road(a, b, cost)
+        expanded = self.dstar.plan(should_stop=preempted)
+        if preempted():
+            return None
+        rospy.loginfo(f"Path cost: {self.dstar.cost} ({expanded} cities expanded)")
+        return self.dstar.path()
     
     def get_next_waypoint(self):
         """Get the next waypoint in the path"""
@@ -154,26 +275,40 @@ class ROSPathPlanner:
         return False
     
     def execute_path(self):
-        """Execute the planned path"""
+        """
+        Follow the latest plan; never waits for the planning thread
+        """
         rate = rospy.Rate(10)  # 10 Hz
+        finished_path = None
         
-        while not rospy.is_shutdown() and self.current_path:
-            waypoint = self.get_next_waypoint()
+        while not rospy.is_shutdown():
+            with self._lock:
+                path = self.current_path
+                index = self.path_index
+                waypoint = self.get_next_waypoint()
             
             if waypoint is None:
-                rospy.loginfo("Path execution complete!")
-                # Stop robot
-                twist = Twist()
-                self.cmd_vel_pub.publish(twist)
-                break
+                # No plan yet, no route, or arrived: hold still until a new plan
+                if path and finished_path is not path:
+                    rospy.loginfo("Path execution complete!")
+                    finished_path = path
+                self.cmd_vel_pub.publish(Twist())
+                rate.sleep()
+                continue
             
-            rospy.loginfo(f"Moving to waypoint {self.path_index + 1}/{len(self.current_path)}: {waypoint}")
+            rospy.loginfo(f"Moving to waypoint {index + 1}/{len(path)}: {waypoint}")
             
             reached = self.move_to_waypoint(waypoint)
             
             if reached:
                 rospy.loginfo(f"Reached {waypoint}")
-                self.path_index += 1
+                with self._lock:
+                    self.last_reached = waypoint
+                    if self.current_path is path:
+                        self.path_index += 1
+                    elif self.current_path and waypoint in self.current_path:
+                        # A new plan arrived meanwhile; continue from this city on it
+                        self.path_index = self.current_path.index(waypoint) + 1
             
             rate.sleep()
     
@@ -184,12 +319,9 @@ class ROSPathPlanner:
         # Wait for odometry
         rospy.sleep(1)
         
-        # Plan path
-        if self.plan_path():
-            # Execute path
-            self.execute_path()
-        else:
-            rospy.logerr("Failed to plan path")
+        # Plan in the background and follow each plan as it arrives
+        self.plan_path()
+        self.execute_path()
 
 
 if __name__ == '__main__':
@@ -198,8 +330,9 @@ if __name__ == '__main__':
         initial = rospy.get_param('~initial_state', 'Addis Ababa')
         goal = rospy.get_param('~goal_state', 'Moyale')
         strategy = rospy.get_param('~strategy', 'bfs')
+        snapshot = rospy.get_param('~graph_snapshot', '')
         
-        planner = ROSPathPlanner(initial, goal, strategy)
+        planner = ROSPathPlanner(initial, goal, strategy, snapshot_path=snapshot or None)
         planner.run()
         
     except rospy.ROSInterruptException:
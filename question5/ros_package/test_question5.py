@@ -0,0 +1,123 @@
+"""
+Test cases for Question 5 (the ROS-independent D* Lite planner)
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from question2.graph_with_costs import GraphWithCosts, create_figure2_graph
+from question2.uniform_cost_search import UniformCostSearch
+from dstar_lite import DStarLite, INF
+
+
+def _ucs_cost(planner):
+    """UCS cost from the planner's start on its current roads (INF if unreachable)"""
+    graph = GraphWithCosts()
+    graph.build_from_edges([(u, v, cost) for u, roads in planner.successors.items()
+                            for v, cost in roads.items() if cost < INF], bidirectional=False)
+    _, cost, _ = UniformCostSearch(graph).search(planner.start, planner.goal)
+    return INF if cost is None else cost
+
+
+def _path_cost(planner, path):
+    """Cost of a city path on the planner's current roads"""
+    return sum(planner.successors[u][v] for u, v in zip(path, path[1:]))
+
+
+def _check(planner, step):
+    """Replan and compare plan(), cost and path() with UCS; returns an error or None"""
+    planner.plan()
+    expected = _ucs_cost(planner)
+    if planner.cost != expected:
+        return f"{step}: D* Lite cost {planner.cost}, UCS {expected}"
+    path = planner.path()
+    if expected == INF:
+        return None if path is None else f"{step}: path {path} to an unreachable goal"
+    if not path or path[0] != planner.start or path[-1] != planner.goal:
+        return f"{step}: path {path} does not join {planner.start} and {planner.goal}"
+    if _path_cost(planner, path) != expected:
+        return f"{step}: path costs {_path_cost(planner, path)}, UCS {expected}"
+    return None
+
+
+def test_question5():
+    """Test D* Lite replanning against UCS on the changed graph"""
+    print("=" * 60)
+    print("Testing Question 5")
+    print("=" * 60)
+
+    graph = create_figure2_graph()
+    initial, goal = "Addis Ababa", "Moyale"
+
+    print("\n5. Testing D* Lite replanning:")
+    planner = DStarLite(graph, initial, goal)
+    error = _check(planner, "initial plan")
+    if error is None:
+        print(f"   [OK] Initial plan matches UCS (cost {planner.cost})")
+    else:
+        print(f"   [FAIL] {error}")
+
+    # Random closures, reopenings and cost changes (on the route and off it)
+    # while the robot drives along the current plan
+    rng = random.Random(0)
+    original = {(u, v): cost for u, roads in planner.successors.items() for v, cost in roads.items()}
+    roads = sorted(original)
+    closed = []
+    error, steps = None, 0
+    for step in range(200):
+        path = planner.path()
+        action = rng.random()
+        if action < 0.25 and path and len(path) > 1:
+            index = rng.randrange(len(path) - 1)
+            planner.update_road(path[index], path[index + 1], INF)
+            closed.append((path[index], path[index + 1]))
+            label = f"close route road {path[index]}-{path[index + 1]}"
+        elif action < 0.45 and closed:
+            a, b = closed.pop(rng.randrange(len(closed)))
+            planner.update_road(a, b, original[(a, b)])
+            label = f"reopen {a}-{b}"
+        elif action < 0.7:
+            u, v = rng.choice(roads)
+            cost = rng.randint(1, 30)
+            planner.update_edge(u, v, cost)
+            original[(u, v)] = cost
+            label = f"one-way cost {u}->{v} = {cost}"
+        elif path and len(path) > 1:
+            planner.move_to(path[1])
+            label = f"move to {path[1]}"
+        else:
+            continue
+        steps += 1
+        error = _check(planner, f"step {step} ({label})")
+        if error:
+            break
+    if error is None:
+        print(f"   [OK] {steps} closures, reopenings, cost changes and moves match UCS")
+    else:
+        print(f"   [FAIL] {error}")
+
+    # Closing every road into the goal makes it unreachable (INF, no path)
+    planner = DStarLite(graph, initial, goal)
+    planner.plan()
+    into_goal = {u: roads[goal] for u, roads in planner.successors.items() if goal in roads}
+    for u in into_goal:
+        planner.update_edge(u, goal, INF)
+    unreachable = _check(planner, "goal cut off")
+    planner_cost, planner_path = planner.cost, planner.path()
+    for u, cost in into_goal.items():
+        planner.update_edge(u, goal, cost)
+    reopened = _check(planner, "goal reopened")
+    if unreachable is None and planner_cost == INF and planner_path is None and reopened is None:
+        print(f"   [OK] Unreachable goal gives cost inf and no path, "
+              f"reopening restores cost {planner.cost}")
+    else:
+        print(f"   [FAIL] {unreachable or reopened or f'cut-off goal: cost {planner_cost}, path {planner_path}'}")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    test_question5()